@@ -0,0 +1,40 @@
+"""Make the small cinfdata text export test file in test_data/cinfdata
+
+The file has the layout of cinfdata's text export: a header with a line of quoted
+"Recorded at" timestamps, one per mass channel, then blank lines, the column names,
+and the columns, a time ("-x") and a value ("-y") column per channel. The channels
+were measured for different lengths of time, so the shorter columns are padded with
+empty cells.
+"""
+
+from pathlib import Path
+import numpy as np
+
+N_POINTS = 200
+test_data_dir = Path(__file__).parent.parent / "test_data"
+txt_file = test_data_dir / "cinfdata/2021-02-01 17_44_12 cinfdata test.txt"
+txt_file.parent.mkdir(parents=True, exist_ok=True)
+
+rng = np.random.default_rng(0)
+n_short = N_POINTS * 3 // 4
+channels = {  # {name: (timestamp, time data, value data)}
+    "M2": ("2021-02-01 17:44:12", np.arange(N_POINTS) * 0.5, rng.random(N_POINTS)),
+    "M32": ("2021-02-01 17:44:13", np.arange(n_short) * 0.5, rng.random(n_short)),
+}
+
+lines = [
+    '"Comment"\t' + "\t".join(f'"{name}"' for name in channels),
+    '"Recorded at"\t' + "\t".join(f'"{ts}"' for ts, _, _ in channels.values()),
+    '"made by"\t"development_scripts/make_cinfdata_test_file.py"',
+    "",
+    "",
+    "\t".join(f"{name}-x\t{name}-y" for name in channels),
+]
+columns = []
+for _, t, values in channels.values():
+    columns += [t, values * 1e-10]
+for n in range(N_POINTS):
+    lines.append(
+        "\t".join(f"{data[n]:.10g}" if n < len(data) else "" for data in columns)
+    )
+txt_file.write_text("\n".join(lines) + "\n")
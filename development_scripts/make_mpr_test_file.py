@@ -0,0 +1,87 @@
+"""Make the small .mpt and .mpr test files in test_data/biologic_mpr
+
+The .mpt file is the start of the .mpt file in test_data/biologic_mpt_and_zilien_tsv.
+The .mpr file has the same data, in the modules and with the column ID's that
+`BiologicMPRReader` reads, as we don't have the .mpr file that EC-Lab saved with it.
+"""
+
+from datetime import datetime
+from pathlib import Path
+import struct
+import numpy as np
+from ixdat.readers.biologic import (
+    BiologicMPTReader,
+    MPR_MAGIC,
+    MPR_MODULE_HEADER_DTYPE,
+    BIOLOGIC_MPR_FLAG_COLUMNS,
+    BIOLOGIC_MPR_COLUMNS,
+)
+
+N_POINTS = 120
+test_data_dir = Path(__file__).parent.parent / "test_data"
+source_file = (
+    test_data_dir
+    / "biologic_mpt_and_zilien_tsv/2020-07-29 10_30_39 Pt_poly_cv_01_02_CVA_C01.mpt"
+)
+mpt_file = test_data_dir / "biologic_mpr/Pt_poly_cv_short.mpt"
+mpr_file = test_data_dir / "biologic_mpr/Pt_poly_cv_short.mpr"
+mpt_file.parent.mkdir(exist_ok=True)
+
+# The .mpt file: the header with the loop cut short, and the first N_POINTS points.
+lines = source_file.read_bytes().split(b"\n")
+n_header_lines = int(lines[1].split(b":")[1])
+lines = lines[: n_header_lines + N_POINTS] + [b""]
+lines = [
+    line.replace(b"to 4472", f"to {N_POINTS - 1}".encode()) for line in lines
+]
+mpt_file.write_bytes(b"\n".join(lines))
+
+# The .mpr file, with the columns of the .mpt file in the same order
+column_data = BiologicMPTReader().read(mpt_file).reader.column_data
+column_ids = {name: i for i, (name, _) in BIOLOGIC_MPR_COLUMNS.items()}
+column_ids.update(
+    {name: i for i, (name, _) in BIOLOGIC_MPR_FLAG_COLUMNS.items()}
+)
+column_ids.update({"(Q-Qo)/C": 434, "<I>/mA": 11})
+names = [name for name in column_data if name != "loop_number"]
+ids = [column_ids[name] for name in names]
+
+record_fields = [("flags", "u1")]
+record_fields += [
+    (name, BIOLOGIC_MPR_COLUMNS[column_ids[name]][1])
+    for name in names
+    if column_ids[name] not in BIOLOGIC_MPR_FLAG_COLUMNS
+]
+records = np.zeros(N_POINTS, dtype=record_fields)
+for name in names:
+    if column_ids[name] in BIOLOGIC_MPR_FLAG_COLUMNS:
+        _, mask = BIOLOGIC_MPR_FLAG_COLUMNS[column_ids[name]]
+        shift = (mask & -mask).bit_length() - 1
+        records["flags"] |= (column_data[name].astype("u1") << shift) & mask
+    else:
+        records[name] = column_data[name]
+
+
+def module(shortname, contents, version):
+    header = np.zeros(1, dtype=MPR_MODULE_HEADER_DTYPE)
+    header["shortname"] = shortname.ljust(10)
+    header["longname"] = shortname.ljust(25)
+    header["length"] = len(contents)
+    header["version"] = version
+    header["date"] = b"07/29/20"
+    return b"MODULE" + header.tobytes() + contents
+
+
+data_header = struct.pack("<I", N_POINTS) + bytes([len(ids)])
+data_header = (data_header + np.array(ids, dtype="<u2").tobytes()).ljust(405, b"\0")
+start_time = datetime(2020, 7, 29, 10, 31, 1)  # "Acquisition started on"
+ole_date = (start_time - datetime(1899, 12, 30)).total_seconds() / (24 * 60 * 60)
+log = (b"\0" * 465 + struct.pack("<d", ole_date)).ljust(500, b"\0")
+loop = struct.pack("<I", 1) + np.array([0], dtype="<u4").tobytes()
+mpr_file.write_bytes(
+    MPR_MAGIC
+    + module(b"VMP Set", b"\0" * 100, 0)
+    + module(b"VMP data", data_header + records.tobytes(), 2)
+    + module(b"VMP LOG", log, 0)
+    + module(b"VMP loop", loop, 0)
+)
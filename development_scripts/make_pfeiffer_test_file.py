@@ -0,0 +1,39 @@
+"""Make the small PVMassSpec scan test files in test_data/pfeiffer
+
+The files have the layout of a '- Scan.dat' file exported by PVMassSpec: the header
+of an MID file (MID_N_HEADER_LINES lines, with the column names last), and then a row
+per mass scan, with a column per m/z value. The m/z columns are not quite in order,
+as the reader sorts them. One file has five scans, and the other just one.
+"""
+
+from pathlib import Path
+import numpy as np
+
+test_data_dir = Path(__file__).parent.parent / "test_data"
+scan_file = test_data_dir / "pfeiffer/test - Scan.dat"
+single_scan_file = test_data_dir / "pfeiffer/single - Scan.dat"
+scan_file.parent.mkdir(exist_ok=True)
+
+rng = np.random.default_rng(0)
+masses = ["1.00", "2.00", "4.00", "18.00", "14.00", "28.00", "32.00", "44.00"]
+t = np.arange(5) * 2.5
+y = rng.random((len(t), len(masses))) * 1e-10
+header = [
+    "PV MassSpec export",
+    "Scan data",
+    "Sourcefile\tC:\\data\\test 03-02-2021 12'58'40.dat",
+    "Exported by\tdevelopment_scripts/make_pfeiffer_test_file.py",
+    "Start Time\t03/02/2021 12:58:40",
+    "",
+    "Mode\tScan",
+    "\t".join(
+        ["Time Absolute (UTC)", "Time Absolute (Date_Time)", "Time Relative (sec)"]
+        + masses
+    ),
+]
+for path, n_scans in [(scan_file, len(t)), (single_scan_file, 1)]:
+    lines = header.copy()
+    for i in range(n_scans):
+        t_absolute = f"{1614772720 + t[i]}\t03/02/2021 12:58:{40 + t[i]:06.3f}"
+        lines.append("\t".join([t_absolute, repr(t[i])] + [repr(v) for v in y[i]]))
+    path.write_text("\n".join(lines) + "\n")
@@ -0,0 +1,34 @@
+"""Save the series the legacy EC_MS package reads from the Zilien .tsv test file
+
+The test file is made by make_zilien_test_file.py. Its series, as read by EC_MS's
+Zilien_Dataset, are saved in an .npz file next to it, so that the Zilien reader can
+be tested against them without EC_MS installed. The file has the timestamp
+("tstamp"), the series names ("names"), the name of each series' time series
+("tseries_names", "" for a time series), and the data of the i'th series ("data_i").
+
+This needs EC_MS, and only needs to be run again if the test file is changed.
+"""
+
+from pathlib import Path
+import numpy as np
+import EC_MS
+from ixdat.data_series import TimeSeries
+from ixdat.readers.ec_ms_pkl import measurement_from_ec_ms_dataset
+
+test_data_dir = Path(__file__).parent.parent / "test_data"
+tsv_file = test_data_dir / "zilien/2021-02-01 17_44_12 test.tsv"
+npz_file = test_data_dir / "zilien/2021-02-01 17_44_12 test EC_MS.npz"
+
+meas = measurement_from_ec_ms_dataset(
+    EC_MS.Zilien_Dataset(str(tsv_file)).data, name=tsv_file.name
+)
+series_list = sorted(meas.series_list, key=lambda s: s.name)
+np.savez_compressed(
+    npz_file,
+    tstamp=meas.tstamp,
+    names=[s.name for s in series_list],
+    tseries_names=[
+        "" if isinstance(s, TimeSeries) else s.tseries.name for s in series_list
+    ],
+    **{f"data_{i}": s.data for i, s in enumerate(series_list)},
+)
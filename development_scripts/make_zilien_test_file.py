@@ -0,0 +1,67 @@
+"""Make the small Zilien .tsv test file and mass scans in test_data/zilien
+
+The .tsv file has the layout of a Zilien .tsv file: a header of metadata lines ending
+with the series headers and column headers, and then groups of columns, each with its
+own time column. The groups have different lengths and are padded with empty cells.
+
+The mass scans are in a folder named, like the .tsv file, by when the measurement
+started. Each has a header of 9 non-blank lines, with the time the scan started at,
+and then the column headers and the m/z and current columns.
+"""
+
+from pathlib import Path
+import numpy as np
+
+N_POINTS = 200
+test_data_dir = Path(__file__).parent.parent / "test_data"
+tsv_file = test_data_dir / "zilien/2021-02-01 17_44_12 test.tsv"
+spectra_dir = test_data_dir / "zilien/2021-02-01 17_44_12 mass scans"
+spectra_dir.mkdir(parents=True, exist_ok=True)
+
+rng = np.random.default_rng(0)
+t = np.arange(N_POINTS) * 0.1
+n_ec, n_gauge = N_POINTS // 2, N_POINTS // 4
+groups = {  # {series header: {column header: data}}
+    "C0M2": {"Time [s]": t, "M2-H2 [A]": rng.random(N_POINTS) * 1e-10},
+    "C1M32": {"Time [s]": t + 0.05, "M32-O2 [A]": rng.random(N_POINTS) * 1e-9},
+    "pot": {
+        "Time [s]": t[:n_ec],
+        "Voltage [V]": np.sin(t[:n_ec]),
+        "Current [mA]": np.cos(t[:n_ec]),
+        "Cycle [n]": np.floor(t[:n_ec] / 2),
+    },
+    "iongauge": {"Time [s]": t[:n_gauge], "Pressure [mbar]": rng.random(n_gauge)},
+}
+
+lines = [
+    "name\t\t\t\ttest",
+    "offset\t\t\t\t12.5",
+    "data_start\t\t\t\t6",
+    "comment\t\t\t\tmade by development_scripts/make_zilien_test_file.py",
+]
+series_headers, column_headers, columns = [], [], []
+for group, group_columns in groups.items():
+    for i, (header, data) in enumerate(group_columns.items()):
+        series_headers.append(group if i == 0 else "")
+        column_headers.append(header)
+        columns.append(data)
+lines += ["\t".join(series_headers), "\t".join(column_headers)]
+for n in range(N_POINTS):
+    lines.append(
+        "\t".join(f"{data[n]:.10g}" if n < len(data) else "" for data in columns)
+    )
+tsv_file.write_text("\n".join(lines) + "\n")
+
+mass = np.arange(0, 50.01, 0.5)
+for scan_time in [2.0, 8.0, 14.0]:
+    current = rng.random(len(mass)) * 1e-10
+    lines = [
+        "Zilien mass scan",
+        f"Mass scan started at [s]\t\t\t\t{scan_time:.3f}",
+        "made by\t\t\t\tdevelopment_scripts/make_zilien_test_file.py",
+    ]
+    lines += [f"key{i}\t\t\t\tvalue" for i in range(6)] + [""]
+    lines.append("Mass  [AMU]\tCurrent [A]")
+    lines += [f"{m:.2f}\t{c!r}" for m, c in zip(mass, current)]
+    file_name = f"mass scan started at measurement time {scan_time:07.0f}.tsv"
+    (spectra_dir / file_name).write_text("\n".join(lines) + "\n")
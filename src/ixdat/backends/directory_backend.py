@@ -1,4 +1,5 @@
 import json
+from pathlib import Path
 import numpy as np
 from .memory_backend import BackendBase
 from ..config import CFG
@@ -66,6 +67,7 @@ class DirBackend(BackendBase):
         self._project_directory = None
         self.metadata_suffix = metadata_suffix
         self.data_suffix = data_suffix
+        self.saved_uids = {}  # {(table_name, uid): id} of the data objects saved
         super().__init__()
 
     @property
@@ -120,23 +122,46 @@ class DirBackend(BackendBase):
             print(f"could not find file {path_to_row}")
             return
 
-    def save_data_obj(self, data_obj):
-        """Save the object as a .ix for metadata and .ixdata for numerical data"""
+    def save_data_obj(self, data_obj, data_file=None):
+        """Save the object as a .ix for metadata and .ixdata for numerical data
+
+        Args:
+            data_obj (Saveable): The object to save, typically a DataSeries
+            data_file (Path or str): A .npy file already holding the object's data, as
+                written by a `readers.chunked.ChunkWriter`. It is moved into place
+                rather than the data being saved again.
+        """
         table_name = data_obj.table_name
         if data_obj.backend == self and self.contains(table_name, data_obj.id):
             return data_obj.id  # already saved!
+        # The uid is calculated here, as the data may have changed since it was last:
+        uid = data_obj.uid
+        i = self.saved_uids.get((table_name, uid))
+        if i is not None:
+            # An object with the same content is saved, so this one is the same row:
+            data_obj.set_id(i)
+            data_obj.set_backend(self)
+            return i
         obj_as_dict = data_obj.as_dict()
-        data = obj_as_dict["data"]
+        data = obj_as_dict.get("data")  # None for e.g. a UniformTimeSeries
         obj_as_dict["data"] = None
         # first we save the metadata and set the object's id:
         i = self.add_row(obj_as_dict, table_name=table_name)
         data_obj.set_id(i)
         data_obj.set_backend(self)
+        self.saved_uids[(table_name, uid)] = i
         #  ... and now we save the data
         folder = self.project_directory / table_name
         fixed_name = fix_name_for_saving(data_obj.name)
         data_file_name = f"{data_obj.id}_{fixed_name}{self.data_suffix}"
-        np.save(folder / data_file_name, data)
+        if data_file:
+            try:
+                Path(data_file).replace(folder / data_file_name)
+                return i
+            except PermissionError:  # Windows can't move a memory-mapped file.
+                pass
+        if data is not None:
+            np.save(folder / data_file_name, data)
         return i
 
     def add_row(self, obj_as_dict, table_name):
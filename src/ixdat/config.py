@@ -12,6 +12,33 @@ class Config:
             ixdat will make the directory if it does not exist.
         standard_metadata_suffix (str): The file ext. for JSON format metadata files
         standard_data_suffix (str): The file extension for numpy.save format data files
+        read_cache_directory (Path): The directory in which to cache parsed files when
+            reading with `cache=True`. Defaults to a folder in `ixdat_temp_dir`.
+        read_cache_max_size (int): The maximum total size in bytes of the read cache.
+            The least recently used files are removed to stay below it.
+        compact_integers (bool): Whether to store the ValueSeries of whole numbers
+            (like "cycle number", "Ns", or "loop_number") read from files, and the
+            "selector", with the smallest signed integer dtype holding their values
+            and the differences between them (see `data_series.get_compact_int_dtype`).
+            TimeSeries always stay float64. See `data_series.apply_dtype_policy`.
+        value_dtype (str): The dtype of the other float ValueSeries read from files,
+            e.g. "float32" to halve their size at about 7 significant digits. Defaults
+            to None, i.e. as read, so that data which a reader shares with the file
+            (like that of a .mpr file) isn't copied.
+        column_dtypes (dict): {series name: dtype} for ValueSeries which should have
+            a specific dtype, overriding the above.
+        uniform_time_tolerance (float): How far (as a fraction of the time step) the
+            times of a TimeSeries read from a file may be from a uniform grid for it
+            to be stored as a `UniformTimeSeries`. Defaults to None, i.e. never, as
+            this replaces the recorded times by the grid.
+        run_length_encoding_ratio (float): The most runs of equal values per point
+            for a ValueSeries read from a file to be stored as an `RLEValueSeries`.
+            Defaults to None, i.e. never, as the data of an RLEValueSeries is then
+            expanded again each time it is used.
+        intern_time_series (bool): Whether equal TimeSeries (same name, unit, tstamp,
+            and data) share one object in memory and one file in the backend. See
+            `data_series.TimeSeriesInterner`. Defaults to False, as the TimeSeries
+            are then shared between measurements read separately.
     """
 
     def __init__(self):
@@ -19,6 +46,14 @@ class Config:
         self.standard_data_suffix = ".ix.npy"
         self.standard_data_directory = Path.home() / "ixdat"
         self.default_project_name = "test"
+        self._read_cache_directory = None
+        self.read_cache_max_size = 2e9
+        self.compact_integers = False
+        self.value_dtype = None
+        self.column_dtypes = {}
+        self.uniform_time_tolerance = None
+        self.run_length_encoding_ratio = None
+        self.intern_time_series = False
 
     @property
     def ixdat_temp_dir(self):
@@ -27,5 +62,15 @@ class Config:
             temp_dir.mkdir(parents=True)
         return temp_dir
 
+    @property
+    def read_cache_directory(self):
+        if not self._read_cache_directory:
+            return self.ixdat_temp_dir / "read_cache"
+        return self._read_cache_directory
+
+    @read_cache_directory.setter
+    def read_cache_directory(self, read_cache_directory):
+        self._read_cache_directory = Path(read_cache_directory)
+
 
 CFG = Config()
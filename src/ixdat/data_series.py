@@ -6,7 +6,10 @@ variable corresponding to the rows of the array. The time variable itself is a s
 case, TimeSeries, which must know its absolute (unix) timestamp.
 """
 
+import hashlib
+import weakref
 import numpy as np
+from .config import CFG
 from .db import Saveable
 from .units import Unit
 from .exceptions import TimeError, AxisError
@@ -37,12 +40,20 @@ class DataSeries(Saveable):
         self.name = name
         self.unit = Unit(unit_name)
         self._data = data
+        self._uid = None
 
     @classmethod
     def from_dict(cls, obj_as_dict):
         """Return the right type of DataSeries based on the info in its serialization"""
+        if "t_step" in obj_as_dict:
+            return UniformTimeSeries(**obj_as_dict)
         if "tstamp" in obj_as_dict:
             return TimeSeries(**obj_as_dict)
+        elif "n_runs" in obj_as_dict:
+            # The data in the serialization of an RLEValueSeries is its runs.
+            obj_as_dict = obj_as_dict.copy()
+            obj_as_dict["runs"] = obj_as_dict.pop("data")
+            return RLEValueSeries(**obj_as_dict)
         elif "t_ids" in obj_as_dict:
             return ValueSeries(**obj_as_dict)
         elif "a_ids" in obj_as_dict:
@@ -66,6 +77,37 @@ class DataSeries(Saveable):
         """The name of the data series' unit"""
         return self.unit.name
 
+    @property
+    def uid(self):
+        """str: A fingerprint of the series: a hash of its name, unit, and content
+
+        The content is the data and what else defines the series, like the tstamp of
+        a TimeSeries and the TimeSeries of a ValueSeries (by its uid). Series with the
+        same content thus have the same uid, wherever they are saved. It is only
+        cached if the content can't be changed in place, i.e. if its arrays are
+        read-only (see `_is_read_only`), and is otherwise calculated each time. Code
+        which replaces the data should reset `_uid` to None.
+        """
+        if self._uid is not None:
+            return self._uid
+        content = hashlib.blake2b(digest_size=16)
+        content.update(
+            repr((self.__class__.__name__, self.name, self.unit_name)).encode()
+        )
+        self._hash_content(content)
+        uid = content.hexdigest()
+        if self._is_read_only():
+            self._uid = uid
+        return uid
+
+    def _is_read_only(self):
+        """Return whether the content hashed for the uid can't be changed in place"""
+        return not self.data.flags.writeable
+
+    def _hash_content(self, content):
+        """Update the hash object `content` with the data"""
+        hash_array(content, self.data)
+
     @property
     def shape(self):
         return self.data.shape
@@ -93,12 +135,183 @@ class TimeSeries(DataSeries):
     def t(self):
         return self.data
 
+    def _hash_content(self, content):
+        """Update the hash object `content` with the tstamp and the data"""
+        content.update(repr(self.tstamp).encode())
+        hash_array(content, self.data)
+
     @property
     def tseries(self):
         """Trivially, a TimeSeries is its own TimeSeries"""
         return self
 
 
+class UniformTimeSeries(TimeSeries):
+    """A TimeSeries sampled at a constant interval, stored as start, step, and count
+
+    Only t_start, t_step, and n are kept, and they are what is saved. The data,
+    `t_start + t_step * i` for i from 0 to n - 1, is made when it is asked for and
+    kept only while it is in use elsewhere, so it takes no memory between uses.
+    Windows of it are found by arithmetic, see `get_window`. `Measurement.read` makes
+    these from regularly sampled TimeSeries if CFG.uniform_time_tolerance is set, see
+    `apply_uniform_time`.
+    """
+
+    column_attrs = {"name", "unit_name"}
+    extra_column_attrs = {
+        "tstamps": {"tstamp"},
+        "uniform_times": {"t_start", "t_step", "n"},
+    }
+
+    def __init__(self, name, unit_name, tstamp, t_start, t_step, n, data=None):
+        """Initiate a UniformTimeSeries. See the class docstring.
+
+        Args (in addition to those of TimeSeries):
+            t_start (float): The first time, relative to tstamp
+            t_step (float): The time between points. Must be positive.
+            n (int): The number of points
+            data: Not used. Only here so that a backend can pass data=None.
+        """
+        super().__init__(name, unit_name, data=None, tstamp=tstamp)
+        self.t_start = float(t_start)
+        self.t_step = float(t_step)
+        self.n = int(n)
+        self._data_ref = None  # a weak reference to the data, see `data`
+
+    def __getstate__(self):
+        """Return the state for pickling, without the weak reference to the data"""
+        state = self.__dict__.copy()
+        state["_data_ref"] = None
+        return state
+
+    def _hash_content(self, content):
+        """Update the hash object `content` with the tstamp and the data's parameters"""
+        content.update(repr((self.tstamp, self.t_start, self.t_step, self.n)).encode())
+
+    def _is_read_only(self):
+        """Return True, as the data is made from the parameters each time"""
+        return True
+
+    @classmethod
+    def from_time_series(cls, tseries, tolerance, chunk_size=None):
+        """Return a UniformTimeSeries for tseries, or None if it isn't uniform
+
+        Args:
+            tseries (TimeSeries): The time series to check
+            tolerance (float): How far, as a fraction of the step, each time may be
+                from the uniform grid running from the first to the last time.
+            chunk_size (int): If given, the times are checked this many at a time, so
+                that memory-mapped data isn't loaded at once. See `iter_windows`.
+        """
+        t = tseries.data
+        if len(t) < 3 or t.dtype.kind != "f":
+            return None
+        t_step = (t[-1] - t[0]) / (len(t) - 1)
+        if not t_step > 0:
+            return None
+        for window in iter_windows(len(t), chunk_size):
+            grid = t[0] + t_step * np.arange(*window.indices(len(t)))
+            deviation = np.max(np.abs(t[window] - grid))
+            if not deviation <= tolerance * t_step:
+                return None
+        return cls(
+            name=tseries.name,
+            unit_name=tseries.unit_name,
+            tstamp=tseries.tstamp,
+            t_start=t[0],
+            t_step=t_step,
+            n=len(t),
+        )
+
+    @property
+    def data(self):
+        """The times as a np.array, made from t_start, t_step, and n
+
+        The array is made again only if the one made last is no longer used, so that
+        e.g. slicing the data of a tseries in a loop doesn't make it each time.
+        """
+        data = self._data_ref() if self._data_ref else None
+        if data is None:
+            data = self.get_t(slice(None))
+            self._data_ref = weakref.ref(data)
+        return data
+
+    @property
+    def shape(self):
+        return (self.n,)
+
+    @property
+    def size(self):
+        return self.n
+
+    def get_t(self, window):
+        """Return the times with the indices in window (slice), without the others"""
+        return self.t_start + self.t_step * np.arange(*window.indices(self.n))
+
+    def searchsorted(self, t, side="left"):
+        """Return the indices where t would be inserted in the times to keep them sorted
+
+        This gives the same as `np.searchsorted(self.data, t, side)`, but by arithmetic.
+        The index estimated from t_start and t_step can be one off by rounding, so it
+        is corrected by comparing t with the times on either side of it, calculated as
+        in `get_t`.
+
+        Args:
+            t (float or np.array): The time(s), relative to self.tstamp
+            side (str): "left" to insert before equal times, "right" to insert after.
+        """
+        t = np.asarray(t, dtype=float)
+        i = np.ceil((t - self.t_start) / self.t_step)
+        i = np.clip(np.nan_to_num(i), 0, self.n).astype(np.int64)
+        t_before = self.t_start + self.t_step * (i - 1)
+        t_at = self.t_start + self.t_step * i
+        if side == "left":
+            i = i + ((i < self.n) & (t_at < t)) - ((i > 0) & (t_before >= t))
+        else:
+            i = i + ((i < self.n) & (t_at <= t)) - ((i > 0) & (t_before > t))
+        return i
+
+    def get_window(self, tspan, t_offset=0):
+        """Return the slice of indices of the times in tspan, and one on either side
+
+        This is found by arithmetic rather than a search of the data. The extra point
+        on either side (where there is one) makes up for the rounding, so that
+        selecting with tspan in the window gives the same as in the full data. For the
+        same reason, the window has at least the nearest point if tspan is outside the
+        data.
+
+        Args:
+            tspan (iter of float): The timespan, by its first and last values
+            t_offset (float): What to add to the times to be relative to tspan
+        """
+        t_start = self.t_start + t_offset
+        start = int(np.floor((tspan[0] - t_start) / self.t_step)) - 1
+        stop = int(np.ceil((tspan[-1] - t_start) / self.t_step)) + 2
+        return slice(min(max(start, 0), self.n - 1), max(min(stop, self.n), 1))
+
+    def select(self, mask, window):
+        """Return (selection, UniformTimeSeries) for the True of mask in window
+
+        Args:
+            mask (np.array of bool): The selected times among those in window. The
+                selected times of a uniform grid in a time interval are contiguous.
+            window (slice): The window of the data which mask is of
+        """
+        selected = np.flatnonzero(mask)
+        if not len(selected):
+            return slice(0, 0), None
+        start, stop = window.start + selected[0], window.start + selected[-1] + 1
+        new_tseries = UniformTimeSeries(
+            name=self.name,
+            unit_name=self.unit_name,
+            tstamp=self.tstamp,
+            t_start=self.t_start + self.t_step * start,
+            t_step=self.t_step,
+            n=stop - start,
+        )
+        return slice(start, stop), new_tseries
+
+
 class ValueSeries(DataSeries):
     """Class to store scalar values that are measured over time.
 
@@ -165,6 +378,144 @@ class ValueSeries(DataSeries):
         """The timestamp, from the TimeSeries of the ValueSeries"""
         return self.tseries.tstamp
 
+    def _hash_content(self, content):
+        """Update the hash object `content` with the TimeSeries' uid and the data"""
+        content.update(self.tseries.uid.encode())
+        hash_array(content, self.data)
+
+    def _is_read_only(self):
+        """Return whether the data and the TimeSeries' content are read-only"""
+        return self.tseries._is_read_only() and not self.data.flags.writeable
+
+
+class RLEValueSeries(ValueSeries):
+    """A ValueSeries stored as runs of equal values, for step-like data
+
+    Data like cycle numbers, loop numbers, and setpoints stays the same for many points
+    at a time. An RLEValueSeries stores it as (value, run length) pairs, `runs`, and
+    only makes the value of each point when its data is asked for. Looking up the
+    value at a time (`value_at`), testing the values (`get_mask`), and slicing
+    (`get_runs`) work on the runs. In the backend, the runs are saved as the data,
+    with n_runs marking the series as run-length encoded. `Measurement.read` makes
+    these from step-like ValueSeries, see `apply_run_length_encoding`.
+    """
+
+    extra_column_attrs = {"run_length_encodings": {"n_runs"}}
+
+    def __init__(
+        self,
+        name,
+        unit_name,
+        data=None,
+        runs=None,
+        n_runs=None,
+        t_id=None,
+        t_ids=None,
+        tseries=None,
+    ):
+        """Initiate an RLEValueSeries from its data or its runs. See the class docstring
+
+        Args (in addition to those of ValueSeries):
+            data (np.array): The value of each point, which is encoded into runs. Not
+                used if runs is given.
+            runs (np.array): The (value, length) pairs as a structured array, see
+                `get_runs_of`. Loaded from the backend if neither data nor runs is given.
+            n_runs (int): The number of runs. Only so that a backend can mark the
+                series as run-length encoded.
+        """
+        super().__init__(name, unit_name, None, t_id=t_id, t_ids=t_ids, tseries=tseries)
+        if runs is None and data is not None:
+            runs = get_runs_of(data)
+        self._runs = runs
+        self._stops = None
+
+    @property
+    def runs(self):
+        """The (value, length) pairs, loaded the first time they are needed"""
+        if self._runs is None:
+            self._runs = self.load_data()  # the saved data of an RLEValueSeries.
+        return self._runs
+
+    @property
+    def n_runs(self):
+        return len(self.runs)
+
+    @property
+    def stops(self):
+        """np.array of int: The index after the last point of each run"""
+        if self._stops is None:
+            self._stops = np.cumsum(self.runs["length"])
+        return self._stops
+
+    @property
+    def data(self):
+        """The value of each point as a np.array, made from the runs"""
+        return np.repeat(self.runs["value"], self.runs["length"])
+
+    @property
+    def shape(self):
+        return (int(self.stops[-1]) if self.n_runs else 0,)
+
+    @property
+    def size(self):
+        return self.shape[0]
+
+    def get_main_dict(self):
+        """Return the serialization of the main table, with the runs as the data"""
+        self_as_dict = {attr: getattr(self, attr) for attr in self.column_attrs}
+        self_as_dict["data"] = self.runs
+        return self_as_dict
+
+    def _hash_content(self, content):
+        """Update the hash object `content` with the TimeSeries' uid and the runs"""
+        content.update(self.tseries.uid.encode())
+        hash_array(content, self.runs)
+
+    def _is_read_only(self):
+        """Return whether the runs and the TimeSeries' content are read-only"""
+        return self.tseries._is_read_only() and not self.runs.flags.writeable
+
+    def value_at(self, t):
+        """Return the value at time(s) t, i.e. that of the last point at or before t
+
+        The index of the point is found by a binary search of the time data (or by
+        arithmetic for a UniformTimeSeries, see `UniformTimeSeries.searchsorted`), and
+        its run by a binary search of `stops`. Times before the first point get the
+        first value.
+
+        Args:
+            t (float or np.array): The time(s), relative to self.tstamp
+        """
+        tseries = self.tseries
+        if isinstance(tseries, UniformTimeSeries):
+            i = tseries.searchsorted(t, side="right") - 1
+        else:
+            i = np.searchsorted(tseries.data, t, side="right") - 1
+        i = np.clip(i, 0, self.shape[0] - 1).astype(np.int64)
+        return self.runs["value"][np.searchsorted(self.stops, i, side="right")]
+
+    def get_mask(self, criterion):
+        """Return the boolean mask of the points meeting criterion, testing the runs
+
+        Args:
+            criterion (function): Takes an array of values and returns a boolean mask
+                of the same shape. It is called with one value per run.
+        """
+        return np.repeat(criterion(self.runs["value"]), self.runs["length"])
+
+    def get_runs(self, window):
+        """Return the runs of the points in window (slice), without decoding them"""
+        start, stop, _ = window.indices(self.shape[0])
+        if stop <= start:
+            return self.runs[:0].copy()
+        i_first = np.searchsorted(self.stops, start, side="right")
+        i_stop = np.searchsorted(self.stops, stop - 1, side="right") + 1
+        runs = self.runs[i_first:i_stop].copy()
+        stops = self.stops[i_first:i_stop]
+        starts = stops - runs["length"]
+        runs["length"] = np.minimum(stops, stop) - np.maximum(starts, start)
+        return runs
+
 
 class Field(DataSeries):
     """Class for storing multi-dimensional data spanning 'axes'
@@ -257,6 +608,18 @@ class Field(DataSeries):
             if isinstance(s, (ValueSeries, TimeSeries)):
                 return s.tstamp
 
+    def _hash_content(self, content):
+        """Update the hash object `content` with the axes' uid's and the data"""
+        for axis_series in self.axes_series:
+            content.update(axis_series.uid.encode())
+        hash_array(content, self.data)
+
+    def _is_read_only(self):
+        """Return whether the data and the axes' content are read-only"""
+        return not self.data.flags.writeable and all(
+            axis_series._is_read_only() for axis_series in self.axes_series
+        )
+
 
 class ConstantValue(DataSeries):
     """This is a stand-in for a VSeries for when we know the value is constant"""
@@ -271,8 +634,377 @@ class ConstantValue(DataSeries):
             )
         self.value = value
 
+    def _hash_content(self, content):
+        """Update the hash object `content` with the value"""
+        content.update(repr(self.value).encode())
+
+    def _is_read_only(self):
+        """Return True, as only the value is hashed"""
+        return True
+
     def get_vseries(self, tseries):
-        data = self.value * np.ones(tseries.data.shape)
-        return ValueSeries(
-            name=self.name, unit_name=self.unit_name, data=data, tseries=tseries
+        """Return a ValueSeries with the value at each time in tseries, as one run"""
+        runs = make_runs([self.value * 1.0], [tseries.shape[0]])
+        return RLEValueSeries(
+            name=self.name, unit_name=self.unit_name, runs=runs, tseries=tseries
+        )
+
+
+def hash_array(content, array):
+    """Update the hash object `content` with the dtype, shape, and bytes of array"""
+    array = np.ascontiguousarray(array)
+    content.update(repr((array.dtype.str, array.shape)).encode())
+    if array.dtype.hasobject:  # then the bytes are pointers, so the values are used.
+        content.update(repr(array.tolist()).encode())
+    else:
+        content.update(array.view(np.uint8).data)
+
+
+def get_dtype_policy(dtype_policy=None):
+    """Return the full dtype policy dict, with the CFG value for any missing key
+
+    Args:
+        dtype_policy (dict): Any of "compact_integers", "value_dtype", and
+            "column_dtypes", to override the attributes of CFG with those names.
+    """
+    full_policy = {
+        "compact_integers": CFG.compact_integers,
+        "value_dtype": CFG.value_dtype,
+        "column_dtypes": CFG.column_dtypes,
+    }
+    full_policy.update(dtype_policy or {})
+    return full_policy
+
+
+def iter_windows(n, chunk_size=None, overlap=0):
+    """Yield the slices which cover n points chunk_size at a time, or all at once
+
+    Args:
+        n (int): The number of points
+        chunk_size (int): The number of points of each slice. Defaults to n.
+        overlap (int): The number of points each slice reaches into the next one,
+            e.g. 1 to compare each point with the next.
+    """
+    chunk_size = chunk_size or max(n, 1)
+    for start in range(0, n, chunk_size):
+        yield slice(start, start + chunk_size + overlap)
+
+
+def apply_dtype_policy(series_list, dtype_policy=None):
+    """Change the dtype of the data of the ValueSeries in series_list, in place
+
+    A ValueSeries named in "column_dtypes" gets the dtype given there. Otherwise, if
+    "compact_integers" is True and its values are all whole numbers, it gets the
+    smallest signed integer dtype which holds them and their differences (see
+    `get_compact_int_dtype`). Other float ValueSeries get "value_dtype", if it is
+    given, and are otherwise left as read. TimeSeries are left as they are, i.e.
+    float64, since float32 can't resolve a second in a unix time. So is
+    memory-mapped data, which is on disk. The dtypes are kept when the series are
+    saved, as numpy saves them.
+
+    Args:
+        series_list (list of DataSeries): The series, typically just read from a file
+        dtype_policy (dict): Overrides of the CFG policy. See `get_dtype_policy`.
+    """
+    dtype_policy = get_dtype_policy(dtype_policy)
+    for series in series_list:
+        if not isinstance(series, ValueSeries) or isinstance(series.data, np.memmap):
+            continue
+        dtype = get_policy_dtype(series, dtype_policy)
+        if dtype is not None:
+            series._data = series.data.astype(dtype)
+            series._uid = None  # as the data has changed.
+
+
+def get_policy_dtype(series, dtype_policy, chunk_size=None):
+    """Return the dtype a ValueSeries gets by the dtype policy, or None if unchanged
+
+    See `apply_dtype_policy`, which changes the data to this dtype.
+
+    Args:
+        series (ValueSeries): The series
+        dtype_policy (dict): The full policy, see `get_dtype_policy`
+        chunk_size (int): See `get_compact_int_dtype`
+    """
+    data = series.data
+    int_dtype = None
+    if dtype_policy["compact_integers"]:
+        int_dtype = get_compact_int_dtype(data, chunk_size)
+    if series.name in dtype_policy["column_dtypes"]:
+        dtype = np.dtype(dtype_policy["column_dtypes"][series.name])
+    elif int_dtype is not None:
+        dtype = int_dtype
+    elif data.dtype.kind == "f" and dtype_policy["value_dtype"]:
+        dtype = np.dtype(dtype_policy["value_dtype"])
+    else:
+        return None
+    return dtype if data.dtype != dtype else None
+
+
+def get_compact_int_dtype(data, chunk_size=None):
+    """Return the smallest signed int dtype for data, or None if it isn't integers
+
+    The dtype holds not just the values, but also the difference between any two of
+    them, so that e.g. `np.diff` of the data doesn't wrap around. So data from 0 to
+    100 gets int8, but data from -100 to 100 gets int16. Other arithmetic, like
+    multiplying the data by an integer, can still wrap around, as it can for any
+    integer dtype.
+
+    Args:
+        data (np.array): The data
+        chunk_size (int): If given, the data is checked this many values at a time,
+            so that memory-mapped data isn't loaded at once.
+    """
+    if not data.size or data.dtype.kind not in "iuf":
+        return None
+    low = high = None
+    for window in iter_windows(len(data), chunk_size):
+        chunk = data[window]
+        chunk_low, chunk_high = np.min(chunk), np.max(chunk)
+        if not (np.isfinite(chunk_low) and np.isfinite(chunk_high)):
+            return None
+        if data.dtype.kind == "f" and not np.all(np.floor(chunk) == chunk):
+            return None
+        # Python ints, so that the difference below can't wrap around itself:
+        chunk_low, chunk_high = int(chunk_low), int(chunk_high)
+        low = chunk_low if low is None else min(low, chunk_low)
+        high = chunk_high if high is None else max(high, chunk_high)
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max and high - low <= info.max:
+            return np.dtype(dtype)
+    return None
+
+
+def apply_uniform_time(series_list, tolerance=None, chunk_size=None):
+    """Replace the regularly sampled TimeSeries in series_list by UniformTimeSeries
+
+    The ValueSeries in series_list get the new TimeSeries too. Memory-mapped data is
+    left as it is, as it is already on disk, unless chunk_size is given.
+
+    Args:
+        series_list (list of DataSeries): The series, typically just read from a file
+        tolerance (float): See `UniformTimeSeries.from_time_series`. Defaults to
+            CFG.uniform_time_tolerance. If that is None too, nothing is replaced.
+        chunk_size (int): If given, the data is checked this many points at a time,
+            memory-mapped data included. See `readers.chunked`.
+
+    Returns list of DataSeries: The series list with the new TimeSeries
+    """
+    tolerance = CFG.uniform_time_tolerance if tolerance is None else tolerance
+    if tolerance is None:
+        return series_list
+    new_tseries = {}  # {id(tseries): uniform_tseries}
+    for series in series_list:
+        if type(series) is not TimeSeries:
+            continue
+        if isinstance(series.data, np.memmap) and not chunk_size:
+            continue
+        uniform_tseries = UniformTimeSeries.from_time_series(
+            series, tolerance, chunk_size=chunk_size
+        )
+        if uniform_tseries:
+            new_tseries[id(series)] = uniform_tseries
+    for series in series_list:
+        if isinstance(series, ValueSeries) and id(series._tseries) in new_tseries:
+            series._tseries = new_tseries[id(series._tseries)]
+    return [new_tseries.get(id(series), series) for series in series_list]
+
+
+def make_runs(values, lengths):
+    """Return a structured np.array of (value, length) pairs, as used by RLEValueSeries
+
+    Args:
+        values (np.array): The value of each run. The runs have this dtype.
+        lengths (np.array of int): The number of points in each run
+    """
+    values = np.asarray(values)
+    runs = np.empty(len(values), dtype=[("value", values.dtype), ("length", np.int64)])
+    runs["value"] = values
+    runs["length"] = lengths
+    return runs
+
+
+def get_runs_of(data, chunk_size=None):
+    """Return the runs of equal values in data (np.array), see `make_runs`
+
+    Args:
+        data (np.array): The data
+        chunk_size (int): If given, the data is compared this many values at a time,
+            so that memory-mapped data isn't loaded at once.
+    """
+    data = np.asarray(data)
+    changes = [
+        np.flatnonzero(data[w][1:] != data[w][:-1]) + w.start + 1
+        for w in iter_windows(len(data), chunk_size, overlap=1)
+    ]
+    starts = np.concatenate([[0]] + changes).astype(np.int64)[: len(data)]
+    return make_runs(data[starts], np.diff(np.append(starts, len(data))))
+
+
+def count_runs(data, chunk_size=None):
+    """Return the number of runs of equal values in data (np.array), see `get_runs_of`"""
+    n_changes = sum(
+        np.count_nonzero(data[w][1:] != data[w][:-1])
+        for w in iter_windows(len(data), chunk_size, overlap=1)
+    )
+    return n_changes + 1 if len(data) else 0
+
+
+def apply_run_length_encoding(series_list, ratio=None, chunk_size=None):
+    """Replace the step-like ValueSeries in series_list by RLEValueSeries
+
+    A ValueSeries is step-like if it has few runs of equal values compared to its
+    number of points. Memory-mapped data is left as it is, as it is already on disk,
+    unless chunk_size is given.
+
+    Args:
+        series_list (list of DataSeries): The series, typically just read from a file
+        ratio (float): The most runs per point for a ValueSeries to be replaced.
+            Defaults to CFG.run_length_encoding_ratio. If that is None too, nothing is
+            replaced.
+        chunk_size (int): If given, the data is compared this many values at a time,
+            memory-mapped data included. See `readers.chunked`.
+
+    Returns list of DataSeries: The series list with the new ValueSeries
+    """
+    ratio = CFG.run_length_encoding_ratio if ratio is None else ratio
+    if ratio is None:
+        return series_list
+    new_series_list = []
+    for series in series_list:
+        if type(series) is ValueSeries:
+            data = series.data
+            is_on_disk = isinstance(data, np.memmap) and not chunk_size
+            if data.ndim == 1 and len(data) > 1 and not is_on_disk:
+                if count_runs(data, chunk_size) <= ratio * len(data):
+                    series = RLEValueSeries(
+                        name=series.name,
+                        unit_name=series.unit_name,
+                        runs=get_runs_of(data, chunk_size),
+                        tseries=series.tseries,
+                    )
+        new_series_list.append(series)
+    return new_series_list
+
+
+class TimeSeriesInterner:
+    """Makes equal TimeSeries share one object, so their data is kept and saved once
+
+    Two TimeSeries are equal if they have the same `uid`, i.e. the same name,
+    unit, tstamp, and data. `intern` returns the first one it was given of each content
+    instead of any later equal one. ValueSeries refer to their TimeSeries by object,
+    and a backend saves each object once, so the data of the later ones is neither
+    kept in memory nor saved to a second file. The interned TimeSeries are only
+    referenced weakly, so interning doesn't keep them in memory. Memory-mapped data is
+    left as it is, as it is already on disk.
+
+    Attributes:
+        interned (WeakValueDictionary): {uid: TimeSeries}
+        replaced (WeakSet): The TimeSeries which have been replaced by an equal one
+        n_deduplicated (int): The number of TimeSeries replaced by an equal one
+        bytes_saved (int): The number of bytes of data in those TimeSeries
+    """
+
+    def __init__(self):
+        self.interned = weakref.WeakValueDictionary()
+        self.replaced = weakref.WeakSet()
+        self.n_deduplicated = 0
+        self.bytes_saved = 0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(n_interned={len(self.interned)}, "
+            f"n_deduplicated={self.n_deduplicated}, bytes_saved={self.bytes_saved})"
         )
+
+    def intern(self, tseries):
+        """Return the interned TimeSeries equal to tseries, interning tseries if new"""
+        if not isinstance(tseries, UniformTimeSeries) and isinstance(
+            tseries.data, np.memmap
+        ):
+            return tseries
+        uid = tseries.uid  # hashed once here, as it isn't cached for writeable data
+        interned = self.interned.get(uid)
+        if interned is None or interned.uid != uid:
+            # (The second case is if the interned TimeSeries' data has been replaced)
+            self.interned[uid] = tseries
+            return tseries
+        if interned is not tseries and tseries not in self.replaced:
+            self.replaced.add(tseries)
+            self.n_deduplicated += 1
+            if not isinstance(tseries, UniformTimeSeries):
+                self.bytes_saved += tseries.data.nbytes
+        return interned
+
+    def deduplicate(self, series_list):
+        """Return series_list with each TimeSeries interned, and each only once
+
+        The TimeSeries of the ValueSeries in series_list are interned too. A TimeSeries
+        not yet loaded from its backend is left as it is rather than loaded to hash it.
+
+        Args:
+            series_list (list of DataSeries): The series, e.g. of a measurement
+        """
+        new_series_list = []
+        tseries_ids = set()  # id's of the TimeSeries in new_series_list
+        for series in series_list:
+            if isinstance(series, ValueSeries) and series._tseries is not None:
+                series._tseries = self.intern(series._tseries)
+            elif isinstance(series, TimeSeries):
+                series = self.intern(series)
+                if id(series) in tseries_ids:
+                    continue
+                tseries_ids.add(id(series))
+            new_series_list.append(series)
+        return new_series_list
+
+    def report(self):
+        """Return a str saying how many TimeSeries and bytes deduplication has saved"""
+        return (
+            f"{self.n_deduplicated} duplicate TimeSeries replaced by one of "
+            f"{len(self.interned)} interned TimeSeries, saving "
+            f"{self.bytes_saved / 1e6:.3g} MB of data"
+        )
+
+
+TSERIES_INTERNER = TimeSeriesInterner()
+
+
+def make_read_only(series_list):
+    """Make the data arrays of the series in series_list read-only, in place
+
+    Then the content of the series can't change, so each one's `uid` is hashed only
+    the first time it is needed. Code that needs to change the data of a series
+    should replace it by a changed copy, e.g. `series._data = series.data * 2`.
+
+    Args:
+        series_list (list of DataSeries): The series, typically just read from a file
+
+    Returns list of DataSeries: series_list
+    """
+    for series in series_list:
+        arrays = [series.__dict__.get("_data"), series.__dict__.get("_runs")]
+        if isinstance(series, ValueSeries) and series._tseries is not None:
+            arrays.append(series._tseries.__dict__.get("_data"))
+        for array in arrays:
+            if isinstance(array, np.ndarray):
+                array.setflags(write=False)
+    return series_list
+
+
+def intern_time_series(tseries):
+    """Return TSERIES_INTERNER.intern(tseries) if CFG.intern_time_series, else tseries"""
+    if not CFG.intern_time_series:
+        return tseries
+    return TSERIES_INTERNER.intern(tseries)
+
+
+def deduplicate_time_series(series_list):
+    """Return TSERIES_INTERNER.deduplicate(series_list) if CFG.intern_time_series
+
+    See `TimeSeriesInterner.deduplicate`. Otherwise series_list is returned as is.
+    """
+    if not CFG.intern_time_series:
+        return series_list
+    return TSERIES_INTERNER.deduplicate(series_list)
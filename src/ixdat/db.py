@@ -21,6 +21,8 @@ Note on terminology:
     see: https://github.com/ixdat/ixdat/pull/1#discussion_r546400793
 """
 
+import hashlib
+import json
 from .exceptions import DataBaseError
 from .backends import DATABASE_BACKENDS
 
@@ -136,6 +138,8 @@ class Saveable:
             memory backend, which just counts objects of each table starting with 1.
             TODO: consider renaming.
                 See: https://github.com/ixdat/ixdat/pull/1#discussion_r546434676
+        uid (str): A hash of the object's content, which unlike the id is the same in
+            any backend and for equal objects. See `Saveable.uid`.
         name (str): The name of the object. `name` should be a column in ixdat tables.
     """
 
@@ -189,6 +193,29 @@ class Saveable:
         """The backend the Saveable object was loaded from or last saved to."""
         return self._backend
 
+    @property
+    def uid(self):
+        """str: A hash of the object's serialization and its data objects' uid's
+
+        The id's in the serialization (the object's own and those in linkers) are left
+        out, as they depend on the backend, while the data objects (like a
+        measurement's DataSeries) are represented by their sorted uid's. The rest is
+        hashed as JSON, as it would be saved. The uid is therefore the same for objects
+        with the same content, wherever they are saved. It is calculated each time,
+        since an object like a measurement can change. DataSeries instead cache theirs,
+        see `DataSeries.uid`.
+        """
+        self_as_dict = self.as_dict()
+        id_attrs = {"id"}.union(attr for _, attr in (self.extra_linkers or {}).values())
+        for attr in id_attrs:
+            self_as_dict.pop(attr, None)
+        content = hashlib.blake2b(digest_size=16)
+        content.update(self.__class__.__name__.encode())
+        content.update(json.dumps(self_as_dict, sort_keys=True, default=repr).encode())
+        for uid in sorted({data_obj.uid for data_obj in self.data_objects or []}):
+            content.update(uid.encode())
+        return content.hexdigest()
+
     def set_id(self, i):
         """Backends set obj.id here after loading/saving a Saveable obj"""
         self._id = i
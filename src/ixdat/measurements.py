@@ -5,17 +5,86 @@ to combine them, i.e. "build" the combined dataset. It has a number of general m
 to visualize and analyze the combined dataset. Dataset is also the base class for a
 number of technique-specific Dataset-derived classes.
 """
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import json
+import os
+import pickle
+import sys
 import numpy as np
+from .config import CFG
 from .db import Saveable, PlaceHolderObject
-from .data_series import DataSeries, TimeSeries, ValueSeries
+from .data_series import (
+    DataSeries,
+    TimeSeries,
+    UniformTimeSeries,
+    ValueSeries,
+    RLEValueSeries,
+    apply_dtype_policy,
+    apply_run_length_encoding,
+    apply_uniform_time,
+    deduplicate_time_series,
+    get_dtype_policy,
+    make_read_only,
+)
 from .projects.samples import Sample
 from .projects.lablogs import LabLog
 from .exporters.csv_exporter import CSVExporter
 from .exceptions import BuildError, SeriesNotFoundError  # , TechniqueError
 
 
+def _read_and_pickle(cls, path_to_file, reader, kwargs):
+    """Read a file in a worker process and return the measurement pickled. See
+    `Measurement.read_files`
+
+    Returns tuple: The pickle, without the data of the numpy arrays, and a list of
+        (name, size) of the blocks of shared memory with the data, in order. The name
+        is None for an empty array, which gets no block.
+    """
+    from multiprocessing import shared_memory  # Python 3.8+, see read_files
+
+    measurement = cls.read(path_to_file, reader=reader, **kwargs)
+    buffers = []
+    pickled_measurement = pickle.dumps(
+        measurement, protocol=5, buffer_callback=buffers.append
+    )
+    blocks = []
+    for buffer in buffers:
+        raw = buffer.raw()
+        if not raw.nbytes:
+            blocks.append((None, 0))
+            continue
+        block = shared_memory.SharedMemory(create=True, size=raw.nbytes)
+        block.buf[: raw.nbytes] = raw
+        blocks.append((block.name, raw.nbytes))
+        block.close()  # but not unlink(), which is up to the parent process.
+    return pickled_measurement, blocks
+
+
+def _unpickle_from_shared_memory(pickled_measurement, blocks):
+    """Return the measurement pickled by `_read_and_pickle`, freeing its shared memory
+
+    The data is copied out of each block, once, so that the block can be removed right
+    away rather than living as long as the measurement.
+    """
+    from multiprocessing import shared_memory  # Python 3.8+, see read_files
+
+    buffers = []
+    for name, size in blocks:
+        if name is None:
+            buffers.append(bytearray())
+            continue
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            block_data = np.ndarray((size,), dtype=np.uint8, buffer=block.buf)
+            buffers.append(block_data.copy())
+            del block_data  # as the block can't be closed while it is viewed.
+        finally:
+            block.close()
+            block.unlink()
+    return pickle.loads(pickled_measurement, buffers=buffers)
+
+
 class Measurement(Saveable):
     """The Measurement class"""
 
@@ -150,22 +219,106 @@ class Measurement(Saveable):
             return technique_class.from_dict(obj_as_dict)
 
     @classmethod
-    def read(cls, path_to_file, reader, **kwargs):
+    def read(
+        cls,
+        path_to_file,
+        reader,
+        cache=False,
+        dtype_policy=None,
+        uniform_time_tolerance=None,
+        **kwargs,
+    ):
         """Return a Measurement object from parsing a file with the specified reader
 
         Args:
             path_to_file (Path or str): The path to the file to read
             reader (str or Reader class): The (name of the) reader to read the file with.
+                "auto" detects the reader from the start of the file, see
+                `readers.reading_tools.sniff_reader_name`.
+            cache (bool): Whether to use the read cache. If True, the parsed file is
+                saved in `CFG.read_cache_directory` and later reads of the unchanged
+                file load it from there, memory-mapped. See `readers.read_cache`.
+            dtype_policy (dict): Overrides of the dtypes policy of CFG, which decides
+                the dtypes of the ValueSeries read. See `data_series.apply_dtype_policy`
+            uniform_time_tolerance (float): Overrides CFG.uniform_time_tolerance, the
+                tolerance for storing the TimeSeries read as UniformTimeSeries. See
+                `data_series.apply_uniform_time`.
             kwargs: key-word arguments are passed on to the reader's read() method.
+
+        The data of the series read is read-only, see `data_series.make_read_only`.
         """
+        if reader == "auto":
+            from .readers.reading_tools import sniff_reader_name
+
+            reader = sniff_reader_name(path_to_file)
+        if cache:
+            from .readers.read_cache import read_with_cache
+
+            # The full policy is part of the cache key, as are the other CFG settings
+            # which change what is read, see read_cache.READ_SETTINGS.
+            dtype_policy = get_dtype_policy(dtype_policy)
+            if uniform_time_tolerance is None:
+                uniform_time_tolerance = CFG.uniform_time_tolerance
+            return read_with_cache(
+                cls,
+                path_to_file,
+                reader=reader,
+                dtype_policy=dtype_policy,
+                uniform_time_tolerance=uniform_time_tolerance,
+                **kwargs,
+            )
         if isinstance(reader, str):
             # TODO: see if there isn't a way to put the import at the top of the module.
             #    see: https://github.com/ixdat/ixdat/pull/1#discussion_r546437471
             from .readers import READER_CLASSES
 
             reader = READER_CLASSES[reader]()
+        elif isinstance(reader, type):
+            reader = reader()
         # print(f"{__name__}. cls={cls}")  # debugging
-        return reader.read(path_to_file, cls=cls, **kwargs)
+        measurement = reader.read(path_to_file, cls=cls, **kwargs)
+        chunk_writer = getattr(reader, "chunk_writer", None)
+        if chunk_writer:  # then the data is on disk, and is processed in chunks.
+            chunk_writer.finish(measurement, dtype_policy, uniform_time_tolerance)
+            return measurement
+        apply_dtype_policy(measurement.series_list, dtype_policy)
+        measurement._series_list = deduplicate_time_series(
+            make_read_only(
+                apply_run_length_encoding(
+                    apply_uniform_time(measurement.series_list, uniform_time_tolerance)
+                )
+            )
+        )
+        return measurement
+
+    @classmethod
+    def read_header(cls, path_to_file, reader, **kwargs):
+        """Return a record of the metadata of a file, reading only its header
+
+        This is for cataloguing files without parsing their data. See the
+        `read_header()` methods of the readers and `readers.reading_tools.header_record`
+
+        Args:
+            path_to_file (Path or str): The path to the file to read
+            reader (str or Reader class): The (name of the) reader to read the file with,
+                or "auto" to detect it from the start of the file.
+            kwargs: key-word arguments are passed on to the reader's read_header()
+
+        Returns dict: The record, with at least "tstamp", "technique", "column_names",
+            and "n_rows", the latter being estimated from the file size if
+            "n_rows_is_estimate" is True.
+        """
+        if reader == "auto":
+            from .readers.reading_tools import sniff_reader_name
+
+            reader = sniff_reader_name(path_to_file)
+        if isinstance(reader, str):
+            from .readers import READER_CLASSES
+
+            reader = READER_CLASSES[reader]()
+        elif isinstance(reader, type):
+            reader = reader()
+        return reader.read_header(path_to_file, **kwargs)
 
     @classmethod
     def read_url(cls, url, reader, **kwargs):
@@ -179,7 +332,13 @@ class Measurement(Saveable):
 
     @classmethod
     def read_set(
-        cls, path_to_file_start, reader, suffix=None, file_list=None, **kwargs
+        cls,
+        path_to_file_start,
+        reader,
+        suffix=None,
+        file_list=None,
+        workers=None,
+        **kwargs,
     ):
         """Read and append a set of files.
 
@@ -194,6 +353,9 @@ class Measurement(Saveable):
                 exact files to append can be specified in a list
             suffix (str): If a suffix is given, only files with the specified ending are
                 added to the file list
+            workers (int): The number of processes to read the files in. By default,
+                the files are read one after the other in this process. See
+                `read_files()`.
             kwargs: Key-word arguments are passed via cls.read() to the reader's read()
                 method, AND to cls.from_component_measurements()
         """
@@ -205,15 +367,66 @@ class Measurement(Saveable):
             if suffix:
                 file_list = [f for f in file_list if f.suffix == suffix]
 
-        component_measurements = [
-            cls.read(f, reader=reader, **kwargs) for f in file_list
-        ]
+        component_measurements = cls.read_files(
+            file_list, reader=reader, workers=workers, **kwargs
+        )
 
         if base_name and "name" not in kwargs:
             kwargs["name"] = base_name
         measurement = cls.from_component_measurements(component_measurements, **kwargs)
         return measurement
 
+    @classmethod
+    def read_files(cls, file_list, reader, workers=None, **kwargs):
+        """Return a list of the Measurements from reading each file in file_list
+
+        With `workers`, the files are parsed in parallel in a pool of processes. Each
+        measurement is sent back pickled with protocol 5 and its numpy arrays out of
+        band, in shared memory, so that the data doesn't go through the pickle and the
+        pipe to this process. The measurements and their DataSeries get new id's when
+        they arrive, since those given in the worker processes would clash with the
+        id's of this one.
+
+        Args:
+            file_list (list of Path): The files to read
+            reader (str or Reader class): The (name of the) reader to read the files with
+            workers (int): The number of processes to read the files in. If None or 1,
+                the files are read one after the other in this process, as they also
+                are before Python 3.8, which lacks shared memory and pickle protocol 5.
+            kwargs: Key-word arguments are passed via cls.read() to the reader's read()
+        """
+        if workers and workers > 1 and sys.version_info < (3, 8):
+            print(
+                "Warning! Reading files in worker processes needs Python 3.8 or "
+                "later. Reading them one after the other instead."
+            )
+            workers = None
+        if not workers or workers == 1:
+            return [cls.read(f, reader=reader, **kwargs) for f in file_list]
+        from multiprocessing import resource_tracker
+
+        N = len(file_list)
+        if os.name == "posix":
+            # Started here, the resource tracker is shared by the worker processes, so
+            # it knows that the shared memory they make is removed by this process.
+            resource_tracker.ensure_running()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pickled_measurements = list(
+                pool.map(
+                    _read_and_pickle, [cls] * N, file_list, [reader] * N, [kwargs] * N
+                )
+            )
+        measurements = []
+        for pickled_measurement, blocks in pickled_measurements:
+            measurement = _unpickle_from_shared_memory(pickled_measurement, blocks)
+            measurement.set_id(None)
+            for series in measurement.series_list:
+                series.set_id(None)
+                if isinstance(series, ValueSeries):
+                    series.tseries.set_id(None)
+            measurements.append(measurement)
+        return measurements
+
     @classmethod
     def from_component_measurements(
         cls, component_measurements, keep_originals=True, sort=True, **kwargs
@@ -257,6 +470,10 @@ class Measurement(Saveable):
                 else:
                     series_as_dicts[s_name] = series.as_dict()
                     series_as_dicts[s_name]["data"] = series.data
+                    if isinstance(series, UniformTimeSeries):
+                        # The appended times are in general not uniform
+                        for attr in ("t_start", "t_step", "n"):
+                            del series_as_dicts[s_name][attr]
                     if isinstance(series, ValueSeries):
                         # This will serve to match it to a TimeSeries later:
                         series_as_dicts[s_name]["t_name"] = series.tseries.name
@@ -294,8 +511,8 @@ class Measurement(Saveable):
                 else:
                     # this will be the case if vseries sharing the same tseries
                     # are not present in the same subset of component_measurements.
-                    # In that case just append the vseries even though some tdata gets
-                    # duplicated.
+                    # In that case just append the vseries. The appended tdata is
+                    # deduplicated below if it's equal to that of another vseries.
                     vseries = append_series(
                         [
                             s
@@ -308,7 +525,7 @@ class Measurement(Saveable):
                 series_list.append(vseries)
 
         # Finally, add this series to the dictionary representation and return the object
-        obj_as_dict["series_list"] = series_list
+        obj_as_dict["series_list"] = deduplicate_time_series(series_list)
         return cls.from_dict(obj_as_dict)
 
     @property
@@ -373,8 +590,8 @@ class Measurement(Saveable):
 
     @property
     def series_dict(self):
-        """Dictionary mapping the id's of the measurement's series to the DataSeries"""
-        return {(s.id, s.backend_name): s for s in self.series_list}
+        """Dictionary mapping the uid's of the measurement's series to the DataSeries"""
+        return {s.uid: s for s in self.series_list}
 
     @property
     def series_names(self):
@@ -475,7 +692,13 @@ class Measurement(Saveable):
         vseries = self[item]
         tseries = vseries.tseries
         v = vseries.data
-        t = tseries.data + tseries.tstamp - self.tstamp
+        if tspan is not None and isinstance(tseries, UniformTimeSeries):
+            # Only the times in (and just around) tspan are made. See get_window.
+            window = tseries.get_window(tspan, t_offset=tseries.tstamp - self.tstamp)
+            t = tseries.get_t(window) + (tseries.tstamp - self.tstamp)
+            v = v[window]
+        else:
+            t = tseries.data + (tseries.tstamp - self.tstamp)
         if tspan is not None:  # np arrays don't boolean well :(
             if include_endpoints:
                 if t[0] < tspan[0]:  # then add a point to include tspan[0]
@@ -495,7 +718,7 @@ class Measurement(Saveable):
         vseries = self[item]
         tseries = vseries.tseries
         v_0 = vseries.data
-        t_0 = tseries.data + tseries.tstamp - self.tstamp
+        t_0 = tseries.data + (tseries.tstamp - self.tstamp)
         v = np.interp(t, t_0, v_0)
         return v
 
@@ -567,9 +790,34 @@ class Measurement(Saveable):
                 a float, this adds the float to the present tstamp. If t_zero is "start",
                 tspan[0] is added to the present tstamp.
         """
+        tstamp = None
+        if t_zero:
+            if t_zero == "start":
+                t_zero = tspan[0]
+            tstamp = self.tstamp + t_zero
+        return self._select_by_time(
+            lambda t: np.logical_and(tspan[0] <= t, t <= tspan[-1]),
+            tstamp=tstamp,
+            tspan=tspan,
+        )
+
+    def _select_by_time(self, time_mask_function, tstamp=None, tspan=None):
+        """Return a new measurement with the data at the times selected by a function
+
+        Each TimeSeries is masked only once, and the ValueSeries using it are masked
+        with the same mask.
+
+        Args:
+            time_mask_function (function): A function which takes a time vector
+                relative to self.tstamp and returns a boolean mask of the same shape.
+            tstamp (float): The tstamp of the new measurement. Defaults to self.tstamp
+            tspan (iter of float): A timespan outside of which time_mask_function is
+                all False, if known. UniformTimeSeries are then selected within their
+                window of tspan (see `UniformTimeSeries.get_window`), as a slice.
+        """
         new_series_list = []
         obj_as_dict = self.as_dict()
-        time_cutting_stuff = {}  # {tseries_id: (mask, new_tseries)}
+        time_cutting_stuff = {}  # {id(tseries): (mask, n_selected, new_tseries)}
         for series in self.series_list:
             try:
                 tseries = series.tseries
@@ -578,34 +826,45 @@ class Measurement(Saveable):
             except AttributeError:  # series independent of time are uneffected by cut
                 new_series_list.append(series)
             else:
-                t_id = (tseries.id, tseries.backend_name)
-                # FIXME: Beautiful, met my first id clash here. Local memory and loaded
-                #    each had a timeseries with id=1, but different length. Previously
-                #    the above line of code was just t_id = tseries.id as you'd expect,
-                #    meaning that time_cutting_stuff appeared to already have the needed
-                #    tseries but didn't!
-                #    Note that the id together with the backend works but should be
-                #    replaced by a single Universal Unique Identifier, or perhaps just
-                #    a property `Saveable.uid`, returning `(self.id, self.backend_name)`
+                # The id() of the object in memory, as a series in memory and one
+                # loaded can both have id 1, and hashing the data with uid is slow.
+                t_id = id(tseries)
 
                 if t_id in time_cutting_stuff:
-                    mask, new_tseries = time_cutting_stuff[t_id]
+                    mask, n_selected, new_tseries = time_cutting_stuff[t_id]
+                elif tspan is not None and isinstance(tseries, UniformTimeSeries):
+                    # Shifted like the series grab gets, so both select the same times:
+                    shifted_tseries = time_shifted(tseries, self.tstamp)
+                    window = shifted_tseries.get_window(tspan)
+                    window_mask = time_mask_function(shifted_tseries.get_t(window))
+                    mask, new_tseries = shifted_tseries.select(window_mask, window)
+                    n_selected = mask.stop - mask.start  # mask is a slice here
+                    time_cutting_stuff[t_id] = (mask, n_selected, new_tseries)
                 else:
-                    t = tseries.t + tseries.tstamp - self.tstamp
-                    mask = np.logical_and(tspan[0] <= t, t <= tspan[-1])
+                    t = tseries.t + (tseries.tstamp - self.tstamp)
+                    mask = time_mask_function(t)
+                    n_selected = np.count_nonzero(mask)
                     new_tseries = TimeSeries(
                         name=tseries.name,
                         unit_name=tseries.unit_name,
                         tstamp=tseries.tstamp,
                         data=tseries.data[mask],
                     )
-                    time_cutting_stuff[t_id] = (mask, new_tseries)
-                if True not in mask:
+                    time_cutting_stuff[t_id] = (mask, n_selected, new_tseries)
+                if not n_selected:
                     continue
-                if False not in mask:
+                if n_selected == tseries.shape[0]:
                     new_series_list.append(series)
-                elif (series.id, series.backend_name) == t_id:
+                elif series is tseries:  # i.e. series is a TimeSeries
                     new_series_list.append(new_tseries)
+                elif isinstance(series, RLEValueSeries) and isinstance(mask, slice):
+                    new_series = RLEValueSeries(
+                        name=series.name,
+                        unit_name=series.unit_name,
+                        runs=series.get_runs(mask),
+                        tseries=new_tseries,
+                    )
+                    new_series_list.append(new_series)
                 else:
                     new_series = series.__class__(
                         name=series.name,
@@ -616,10 +875,8 @@ class Measurement(Saveable):
                     new_series_list.append(new_series)
         obj_as_dict["series_list"] = new_series_list
         del obj_as_dict["s_ids"]
-        if t_zero:
-            if t_zero == "start":
-                t_zero = tspan[0]
-            obj_as_dict["tstamp"] += t_zero
+        if tstamp is not None:
+            obj_as_dict["tstamp"] = tstamp
         new_measurement = self.__class__.from_dict(obj_as_dict)
         return new_measurement
 
@@ -631,11 +888,7 @@ class Measurement(Saveable):
         Either way the argument is the `value` to be selected for.
 
         The method finds all time intervals for which `self[series_name] == value`
-        It then cuts the measurement according to each time interval and adds these
-        segments together. TODO: This can be done better, i.e. without chopping series.
-
-        TODO: greater-than and less-than kwargs.
-            Ideally you should be able to say e.g., `select(cycle=1, 0.5<potential<1)`
+        and selects the measurement for these time intervals. See `select_values`.
         """
         if len(args) >= 1:
             if not self.sel_str:
@@ -649,49 +902,37 @@ class Measurement(Saveable):
                 f"select_value got kwargs={kwargs} but can only be used for one value "
                 f"at a time. Use select_values for more."
             )
-        new_measurement = self
-        ((series_name, value),) = kwargs.items()
-
-        t, v = self.grab(series_name)
-        mask = v == value  # linter doesn't realize this is a np array
-        mask_prev = np.append(False, mask[:-1])
-        mask_next = np.append(mask[1:], False)
-        interval_starts_here = np.logical_and(
-            np.logical_not(mask_prev), mask
-        )  # True at [0] if mask[0] is True.
-        interval_ends_here = np.logical_and(
-            mask, np.logical_not(mask_next)
-        )  # True at [-1] if mask[-1] is True.
-        t_starts = list(t[interval_starts_here])
-        t_ends = list(t[interval_ends_here])
-        tspans = zip(t_starts, t_ends)
-        meas = None
-        for tspan in tspans:
-            if meas:
-                meas = meas + new_measurement.cut(tspan)
-            else:
-                meas = new_measurement.cut(tspan)
-        new_measurement = meas
-        return new_measurement
+        return self.select_values(**kwargs)
 
-    def select_values(self, *args, **kwargs):
+    def select_values(self, *args, spans=None, tspan=None, **kwargs):
         """Return a new Measurement with the time(s) in the measurement meeting criteria
 
         Any series can be selected for using the series name as a key-word. Arguments
-        can be single acceptable values or lists of acceptable values. In the latter
-        case, each acceptable value is selected for on its own and the resulting
-        measurements added together.
-        FIXME: That is sloppy because it multiplies the number of DataSeries
-        FIXME:  containing the same amount of data.
+        can be single acceptable values or lists of acceptable values. Ranges of
+        acceptable values are given in `spans`. For example,
+        `select_values(cycle=1, spans={"potential": (0.5, 1)})` selects the data
+        while `cycle == 1` and `0.5 <= potential <= 1`.
         If no key-word is given, the series name is assumed to
         be the default selector, which is named by self.sel_str. Multiple criteria are
-        applied sequentially, i.e. you get the intersection of satisfying parts.
+        combined, i.e. you get the intersection of satisfying parts.
+
+        Each criterion is evaluated as a boolean mask on the TimeSeries of the series
+        it refers to, and criteria on series sharing a TimeSeries share a mask. Each
+        mask defines the time intervals in which it is True, and the measurement is
+        then selected in one pass by masking each TimeSeries (and its ValueSeries)
+        to keep only the times which are in the intervals of every mask.
 
         Args:
             args (tuple): Argument(s) given without key-word are understood as acceptable
                 value(s) for the default selector (that named by self.sel_str)
+            spans (dict): {series_name: (low, high)} where low and high define the
+                acceptable range (inclusive) of the series named series_name.
+            tspan (iter of float): Optional timespan to which to restrict the selection
             kwargs (dict): Each key-word arguments is understood as the name
                 of a series and its acceptable value(s).
+
+        Returns:
+            Measurement: The selected measurement, or None if no data meets criteria
         """
 
         if len(args) >= 1:
@@ -703,28 +944,79 @@ class Measurement(Saveable):
             if len(args) == 1:
                 args = args[0]
             kwargs[self.sel_str] = args
-        new_measurement = self
+
+        criteria = []  # [(series_name, function returning mask given the data)]
         for series_name, allowed_values in kwargs.items():
             if not hasattr(allowed_values, "__iter__"):
                 allowed_values = [allowed_values]
-            meas = None
-            for value in allowed_values:
-                m = new_measurement.select_value(**{series_name: value})
-                if meas:
-                    meas = meas + m
-                else:
-                    meas = m
-            new_measurement = meas
-        return new_measurement
+            criteria.append(
+                (series_name, lambda v, values=list(allowed_values): np.isin(v, values))
+            )
+        for series_name, span in (spans or {}).items():
+            criteria.append(
+                (
+                    series_name,
+                    lambda v, low=min(span), high=max(span): np.logical_and(
+                        low <= v, v <= high
+                    ),
+                )
+            )
+
+        # {id(tseries): (tseries, t, mask)}. Keeping tseries keeps its id unique.
+        masks = {}
+        for series_name, criterion in criteria:
+            vseries = self[series_name]
+            tseries = vseries.tseries
+            if isinstance(vseries, RLEValueSeries):
+                series_mask = vseries.get_mask(criterion)  # tests each run once
+            else:
+                series_mask = criterion(vseries.data)
+            if id(tseries) in masks:
+                tseries, t, mask = masks[id(tseries)]
+                mask = np.logical_and(mask, series_mask)
+            else:
+                t = tseries.data + (tseries.tstamp - self.tstamp)
+                mask = series_mask
+            masks[id(tseries)] = (tseries, t, mask)
+
+        time_intervals = []  # [(t_starts, t_finishes)] for the intervals of each mask
+        for tseries, t, mask in masks.values():
+            if not mask.any():
+                return None  # no data meets the criteria.
+            mask_prev = np.append(False, mask[:-1])
+            mask_next = np.append(mask[1:], False)
+            interval_starts_here = np.logical_and(np.logical_not(mask_prev), mask)
+            interval_ends_here = np.logical_and(mask, np.logical_not(mask_next))
+            time_intervals.append((t[interval_starts_here], t[interval_ends_here]))
+
+        def time_mask_function(t):
+            """Return mask which is True for t in the intervals for all criteria"""
+            mask = np.tile(True, t.shape)
+            if tspan is not None:
+                mask = np.logical_and(tspan[0] <= t, t <= tspan[-1])
+            for t_starts, t_finishes in time_intervals:
+                i = np.searchsorted(t_starts, t, side="right") - 1
+                in_interval = np.logical_and(
+                    i >= 0, t <= t_finishes[np.maximum(i, 0)]
+                )
+                mask = np.logical_and(mask, in_interval)
+            return mask
+
+        if masks and not any(time_mask_function(t).any() for _, t, _ in masks.values()):
+            return None  # no data meets all the criteria together.
+        return self._select_by_time(time_mask_function)
 
     def select(self, *args, tspan=None, **kwargs):
-        """`cut` (with tspan) and `select_values` (with args and/or kwargs)."""
-        new_measurement = self
-        if tspan:
-            new_measurement = new_measurement.cut(tspan=tspan)
+        """`cut` (with tspan) and `select_values` (with args and/or kwargs).
+
+        If there are any args or kwargs, the selection happens in one pass by
+        `select_values`. Use the kwarg `spans` for selecting ranges of values.
+        """
         if args or kwargs:
-            new_measurement = new_measurement.select_values(*args, **kwargs)
-        return new_measurement
+            return self.select_values(*args, tspan=tspan, **kwargs)
+        if tspan:
+            return self.cut(tspan=tspan)
+        return self
 
     @property
     def tspan(self):
@@ -844,6 +1136,8 @@ def append_vseries_by_time(series_list, sort=True, tstamp=None):
     """
     name = series_list[0].name
     cls = series_list[0].__class__
+    if not all(s.__class__ == cls for s in series_list):
+        cls = ValueSeries  # e.g. for appending RLEValueSeries and ValueSeries
     unit = series_list[0].unit
     data = np.array([])
     tseries_list = [s.tseries for s in series_list]
@@ -852,7 +1146,7 @@ def append_vseries_by_time(series_list, sort=True, tstamp=None):
     )
 
     for s in series_list:
-        if not (s.unit == unit and s.__class__ == cls):
+        if not (s.unit == unit and isinstance(s, cls)):
             raise BuildError(f"can't append {series_list}")
         data = np.append(data, s.data)
     if sort:
@@ -871,13 +1165,14 @@ def append_tseries(series_list, sort=True, return_sort_indeces=False, tstamp=Non
         tstamp (unix tstamp): The t=0 of the returned TimeSeries.
     """
     name = series_list[0].name
-    cls = series_list[0].__class__
+    # The appended times are in general not uniform, even if those of each series are
+    cls = TimeSeries
     unit = series_list[0].unit
     tstamp = tstamp or series_list[0].tstamp
     data = np.array([])
 
     for s in series_list:
-        if not (s.unit == unit and s.__class__ == cls):
+        if not (s.unit == unit and isinstance(s, cls)):
             raise BuildError(f"can't append {series_list}")
         data = np.append(data, s.data + s.tstamp - tstamp)
 
@@ -925,13 +1220,29 @@ def time_shifted(series, tstamp=None):
     if tstamp == series.tstamp:
         return series
     cls = series.__class__
-    if isinstance(series, TimeSeries):
+    if isinstance(series, UniformTimeSeries):
+        return cls(
+            name=series.name,
+            unit_name=series.unit.name,
+            tstamp=tstamp,
+            t_start=series.t_start + (series.tstamp - tstamp),
+            t_step=series.t_step,
+            n=series.n,
+        )
+    elif isinstance(series, TimeSeries):
         return cls(
             name=series.name,
             unit_name=series.unit.name,
-            data=series.data + series.tstamp - tstamp,
+            data=series.data + (series.tstamp - tstamp),
             tstamp=tstamp,
         )
+    elif isinstance(series, RLEValueSeries):
+        series = cls(
+            name=series.name,
+            unit_name=series.unit.name,
+            runs=series.runs,
+            tseries=time_shifted(series.tseries, tstamp=tstamp),
+        )
     elif isinstance(series, ValueSeries):
         series = cls(
             name=series.name,
@@ -11,16 +11,21 @@ from ..techniques import TECHNIQUE_CLASSES
 from .ixdat_csv import IxdatCSVReader
 
 # potentiostats
-from .biologic import BiologicMPTReader
+from .biologic import BiologicMPTReader, BiologicMPRReader
 from .autolab import NovaASCIIReader
 from .ivium import IviumDatasetReader
 
 # mass spectrometers
-from .pfeiffer import PVMassSpecReader
+from .pfeiffer import PVMassSpecReader, PVMassSpecScanReader
 from .cinfdata import CinfdataTXTReader
 
 # ec-ms
-from .zilien import ZilienTSVReader, ZilienTMPReader, ZilienSpectrumReader
+from .zilien import (
+    ZilienTSVReader,
+    ZilienTMPReader,
+    ZilienSpectrumReader,
+    ZilienSpectraReader,
+)
 from .ec_ms_pkl import EC_MS_CONVERTER
 
 # spectroelectrochemistry
@@ -29,13 +34,17 @@ from .msrh_sec import MsrhSECReader, MsrhSECDecayReader
 READER_CLASSES = {
     "ixdat": IxdatCSVReader,
     "biologic": BiologicMPTReader,
+    "mpr": BiologicMPRReader,
+    "biologic_mpr": BiologicMPRReader,  # alias of "mpr"
     "autolab": NovaASCIIReader,
     "ivium": IviumDatasetReader,
     "pfeiffer": PVMassSpecReader,
+    "pfeiffer_scan": PVMassSpecScanReader,
     "cinfdata": CinfdataTXTReader,
     "zilien": ZilienTSVReader,
     "zilien_tmp": ZilienTMPReader,
     "zilien_spec": ZilienSpectrumReader,
+    "zilien_spectra": ZilienSpectraReader,
     "EC_MS": EC_MS_CONVERTER,
     "msrh_sec": MsrhSECReader,
     "msrh_sec_decay": MsrhSECDecayReader,
@@ -4,6 +4,8 @@ import re
 from pathlib import Path
 import pandas as pd
 from .reading_tools import (
+    header_record,
+    open_file,
     prompt_for_tstamp,
     series_list_from_dataframe,
     STANDARD_TIMESTAMP_FORM,
@@ -45,7 +47,8 @@ class NovaASCIIReader:
             else:
                 tstamp = prompt_for_tstamp(self.path_to_file)
 
-        dataframe = pd.read_csv(self.path_to_file, delimiter=";")
+        with open_file(self.path_to_file) as f:
+            dataframe = pd.read_csv(f, delimiter=";")
 
         data_series_list = series_list_from_dataframe(
             dataframe, "Time (s)", tstamp, get_column_unit
@@ -67,6 +70,32 @@ class NovaASCIIReader:
             cls = ECMeasurement
         return cls.from_dict(obj_as_dict)
 
+    def read_header(self, path_to_file, tstamp=None, estimate_rows=True):
+        """Return a record of the metadata of the ascii file, reading only its header
+
+        Nova's ascii export has only the column name line as a header, and so no
+        timestamp. tstamp is None unless given.
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the suffix (.txt)
+            tstamp (float): timestamp of the measurement, if known
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                size
+
+        Returns dict: See `reading_tools.header_record`
+        """
+        self.path_to_file = Path(path_to_file)
+        with open_file(self.path_to_file) as f:
+            column_names = [col.strip() for col in f.readline().split(";")]
+        return header_record(
+            self.path_to_file,
+            tstamp=tstamp,
+            technique="EC",
+            column_names=column_names,
+            n_header_lines=1,
+            estimate_rows=estimate_rows,
+        )
+
 
 def get_column_unit(column_name):
     """Return the unit name of an autolab column, i.e the last part of the name in ()"""
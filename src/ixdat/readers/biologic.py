@@ -1,16 +1,28 @@
-"""This module implements the Reader for .mpt files made by BioLogic's EC-Lab software
+"""This module implements the Readers for .mpt and .mpr files made by BioLogic's EC-Lab
 
 Demonstrated/tested at the bottom under `if __name__ == "__main__":`
 """
 
+from datetime import datetime, timedelta
+import io
+import mmap
 from pathlib import Path
 import re
+import time
 import numpy as np
+import pandas as pd
 
 from . import TECHNIQUE_CLASSES
 from ..data_series import TimeSeries, ValueSeries
 from ..exceptions import ReadError
-from .reading_tools import timestamp_string_to_tstamp
+from .reading_tools import (
+    timestamp_string_to_tstamp,
+    header_record,
+    open_file,
+    grow_buffer,
+    is_compressed,
+)
+from .chunked import ChunkWriter
 
 ECMeasurement = TECHNIQUE_CLASSES["EC"]
 delim = "\t"
@@ -47,9 +59,17 @@ class BiologicMPTReader:
             "Cyclic Voltammatry Advanced", etc.
         N_header_lines (int): The number of lines in the header of the file
         column_names (list of str): The names of the data columns in the file
+        loops (list of tuple): The (loop number, first point, last point) of each loop
+            specified in the header. These are used to build the "loop_number" column.
         column_data (dict of str: np.array): The data in the file as a dict.
             Note that the np arrays are the same ones as in the measurement's DataSeries,
             so this does not waste memory.
+        decimal (str): The decimal separator of the data, "." or ",".
+        n_bytes_read (int): The number of bytes read by follow()
+        buffers (dict of str: np.array): The arrays with room to spare, of which
+            column_data are views, when the file is read by follow()
+        chunk_writer (ChunkWriter): Parses the data a chunk at a time when reading with
+            a `chunk_size`, and is None otherwise.
         file_has_been_read (bool): This is used to make sure read() is only successfully
             called once by the Reader. False until read() is called, then True.
         measurement (Measurement): The measurement returned by read() when the file is
@@ -68,18 +88,26 @@ class BiologicMPTReader:
         self.ec_technique = None
         self.N_header_lines = None
         self.column_names = []
+        self.loops = []
         self.column_data = {}
+        self.decimal = None
+        self.n_bytes_read = 0
+        self.buffers = {}
+        self.header_loop_number = None
+        self.chunk_writer = None
         self.file_has_been_read = False
         self.measurement = None
 
-    def read(self, path_to_file, name=None, cls=None, **kwargs):
+    def read(
+        self, path_to_file, name=None, cls=None, chunk_size=None, backend=None, **kwargs
+    ):
         """Return an ECMeasurement with the data and metadata recorded in path_to_file
 
-        This loops through the lines of the file, processing one at a time. For header
-        lines, this involves searching for metadata. For the column name line, this
-        involves creating empty arrays for each data series. For the data lines, this
-        involves appending to these arrays. After going through all the lines, it
-        converts the arrays to DataSeries.
+        This loops through the lines of the header, processing one at a time. For
+        header lines, this involves searching for metadata. For the column name line,
+        this involves creating empty arrays for each data series. The data lines are
+        then parsed all at once by `process_data_block`. Finally, it converts the
+        arrays to DataSeries.
         For .mpt files, there is one TimeSeries, with name "time/s", and all other data
         series are ValueSeries sharing this TimeSeries.
         Finally, the method returns an ECMeasurement with these DataSeries. The
@@ -91,6 +119,12 @@ class BiologicMPTReader:
             cls (Measurement subclass): The Measurement class to return an object of.
                 Defaults to `ECMeasurement` and should probably be a subclass thereof in
                 any case.
+            chunk_size (int): If given, the data is parsed this many rows at a time
+                into files in `backend`, and the DataSeries get it memory-mapped from
+                there. This is for files too big for memory. `Measurement.read` then
+                saves the series there, see `readers.chunked`.
+            backend (DirBackend): The backend to put the data in when reading in
+                chunks. Defaults to the database's backend.
             **kwargs (dict): Key-word arguments are passed to cls.__init__
         """
         path_to_file = Path(path_to_file) if path_to_file else self.path_to_file
@@ -104,12 +138,134 @@ class BiologicMPTReader:
         self.name = name or path_to_file.name
         self.path_to_file = path_to_file
         self.measurement_class = cls or ECMeasurement
-        with open(self.path_to_file, "r", encoding="ISO-8859-1") as f:
-            for line in f:
+        if chunk_size:
+            self.chunk_writer = ChunkWriter(chunk_size, backend=backend)
+        with open_file(self.path_to_file, "r", encoding="ISO-8859-1") as f:
+            # f.readline() rather than iteration, so that process_data_block can tell()
+            for line in iter(f.readline, ""):
                 self.process_line(line)
+                if self.place_in_file == "data":
+                    self.process_data_block(f)
+                    break
         for name in self.column_names:
-            self.column_data[name] = np.array(self.column_data[name])
+            self.column_data[name] = np.asanyarray(self.column_data[name])
+
+        self.measurement = self.build_measurement(**kwargs)
+        self.file_has_been_read = True
+
+        return self.measurement
+
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the .mpt file, reading only its header
+
+        The header lines are processed as by read(), which stops after the column name
+        line. The number of points is that given by the "Loop" lines, if there are any.
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the ".mpt" extension
+            estimate_rows (bool): Whether to estimate the number of points from the file
+                size, if it isn't given by the header.
+
+        Returns dict: See `reading_tools.header_record`. Also has "ec_technique".
+        """
+        self.path_to_file = Path(path_to_file)
+        with open_file(self.path_to_file, "r", encoding="ISO-8859-1") as f:
+            for line in f:
+                self.process_line(line)
+                if self.place_in_file == "data":
+                    break
+        n_rows = self.loops[-1][2] + 1 if self.loops else None
+        return header_record(
+            self.path_to_file,
+            tstamp=self.tstamp,
+            technique="EC",
+            column_names=self.column_names,
+            n_header_lines=self.n_line,
+            n_rows=n_rows,
+            estimate_rows=estimate_rows,
+            ec_technique=self.ec_technique,
+        )
+
+    def follow(self, path_to_file=None, name=None, cls=None, **kwargs):
+        """Return the ECMeasurement, updated with the lines added to the file since
+
+        This is for files which are still being written, e.g. during a long experiment.
+        The first call reads the file like `read()`. Each later call reads on from
+        where the last one stopped, and appends the new data to the DataSeries of the
+        same measurement in place. Only complete lines are read, so a line which is
+        still being written is left for the next call.
+        The data is kept in buffers with room to spare, which are doubled in size
+        when full, so that the cost of a call is proportional to the new data.
+        Series built from the data, like "selector", are removed from the measurement
+        so that they are rebuilt when needed.
+        Points beyond the last "Loop" line in the header get the last loop number.
+        Note that the last line of a finished file is only read if it ends in a
+        newline.
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the ".mpt"
+                extension. Only needed for the first call.
+            name (str): The name to use if not the file name
+            cls (Measurement subclass): The Measurement class to return an object of.
+                Defaults to `ECMeasurement`.
+            **kwargs (dict): Key-word arguments are passed to cls.__init__
+
+        Returns ECMeasurement: The measurement, or None if the file does not yet
+            have a complete header.
+        """
+        if self.file_has_been_read and not self.n_bytes_read:
+            raise ReadError(
+                f"{self} read its file with read(). Use a new Reader to follow it."
+            )
+        if not self.path_to_file:
+            self.path_to_file = Path(path_to_file)
+            self.name = name or self.path_to_file.name
+            self.measurement_class = cls or ECMeasurement
+
+        with open_file(self.path_to_file, "rb") as f:
+            f.seek(self.n_bytes_read)
+            new_bytes = f.read()
+        new_bytes = new_bytes[: new_bytes.rfind(b"\n") + 1]  # only complete lines
+        self.n_bytes_read += len(new_bytes)
+        new_lines = new_bytes.decode("ISO-8859-1").splitlines(keepends=True)
+        while new_lines and self.place_in_file != "data":
+            self.process_line(new_lines.pop(0))
+        if self.place_in_file != "data":
+            return None  # The header isn't all written yet.
+        new_data = self.parse_data_block("".join(new_lines))
+
+        n_before = len(self.column_data[t_str]) if self.file_has_been_read else 0
+        n_after = n_before + len(new_data[t_str])
+        if "loop_number" in self.column_data:
+            # The loop number of each point is given by the "Loop" lines in the header.
+            if self.header_loop_number is None:
+                self.header_loop_number = self.column_data["loop_number"]
+            loops = self.header_loop_number[n_before:n_after]
+            last_loop = self.header_loop_number[-1]
+            new_data["loop_number"] = np.append(
+                loops, np.full(n_after - n_before - len(loops), last_loop)
+            )
+        for name, new_values in new_data.items():
+            self.column_data[name] = grow_buffer(
+                self.buffers, name, n_before, new_values
+            )
 
+        if not self.file_has_been_read:
+            self.measurement = self.build_measurement(**kwargs)
+            self.file_has_been_read = True
+            return self.measurement
+
+        # The DataSeries get the new views of the buffers:
+        series_dict = {s.name: s for s in self.measurement.series_list}
+        for name, data in self.column_data.items():
+            series_dict[name]._data = data
+            series_dict[name]._uid = None  # as the data has changed.
+        # Series built from the data, like "selector", are now too short:
+        self.measurement.clear_cache(self.column_data)
+        return self.measurement
+
+    def build_measurement(self, **kwargs):
+        """Return a measurement of self.measurement_class with self.column_data"""
         if t_str not in self.column_data:
             raise ReadError(
                 f"{self} did not find any data for t_str='{t_str}'. "
@@ -139,11 +295,7 @@ class BiologicMPTReader:
             ec_technique=self.ec_technique,
         )
         obj_as_dict.update(kwargs)
-
-        self.measurement = self.measurement_class.from_dict(obj_as_dict)
-        self.file_has_been_read = True
-
-        return self.measurement
+        return self.measurement_class.from_dict(obj_as_dict)
 
     def process_line(self, line):
         """Call the correct line processing method depending on self.place_in_file"""
@@ -182,11 +334,7 @@ class BiologicMPTReader:
             n = int(loop_match.group(1))
             start = int(loop_match.group(2))
             finish = int(loop_match.group(3))
-            if "loop_number" not in self.column_data:
-                self.column_data["loop_number"] = np.array([])
-            self.column_data["loop_number"] = np.append(
-                self.column_data["loop_number"], np.array([n] * (finish - start + 1))
-            )
+            self.loops.append((n, start, finish))
             return
 
         if self.N_header_lines and self.n_line >= self.N_header_lines - 2:
@@ -195,10 +343,90 @@ class BiologicMPTReader:
     def process_column_line(self, line):
         """Split the line to get the names of the file's data columns"""
         self.header_lines.append(line)
+        if self.loops and not self.chunk_writer:
+            # All the loops are known once the header is read, so the column is
+            # built in one go rather than appended to for each loop line.
+            n, start, finish = np.array(self.loops).T
+            self.column_data["loop_number"] = np.repeat(
+                n.astype(float), finish - start + 1
+            )
         self.column_names = line.strip().split(delim)
         self.column_data.update({name: [] for name in self.column_names})
         self.place_in_file = "data"
 
+    def process_data_block(self, f):
+        """Parse all the remaining lines of the open file f into the data columns
+
+        The file is handed to pandas as is, so that the data is parsed as it is read
+        (and decompressed), without holding the whole data block as a string. With a
+        chunk_writer, the columns are written to disk a chunk of rows at a time.
+        """
+        position = f.tell()
+        first_line = f.readline()
+        f.seek(position)
+        if self.chunk_writer:
+            self.decimal = "," if "," in first_line else "."
+            columns = self.chunk_writer.read_columns(
+                f, len(self.column_names), sep=delim, decimal=self.decimal
+            )
+            self.column_data.update(zip(self.column_names, columns))
+            if self.loops:  # first, as when it's built by process_column_line
+                loop_number = self.write_loop_numbers()
+                self.column_data = {"loop_number": loop_number, **self.column_data}
+            self.n_line += len(columns[0]) if columns else 0
+            return
+        self.column_data.update(self.parse_data_block(f, first_line=first_line))
+
+    def write_loop_numbers(self):
+        """Write the "loop_number" column with the chunk writer, a chunk at a time"""
+        appender = self.chunk_writer.new_appender()
+        chunk_size = self.chunk_writer.chunk_size
+        for n, start, finish in self.loops:
+            for i in range(start, finish + 1, chunk_size):
+                appender.append(np.full(min(chunk_size, finish + 1 - i), float(n)))
+        return appender.close()
+
+    def parse_data_block(self, data_block, first_line=None):
+        """Return {column name: np.array} with the values in data_block
+
+        The data block is handed to pandas' C parser in one go. Whether the file uses
+        decimal commas (as EC-Lab does in some locales) is decided once, from the first
+        data line, rather than for every value.
+
+        Args:
+            data_block (str or file): The data lines, or a file open at the first one
+            first_line (str): The first data line. Only needed if data_block is a file.
+        """
+        n_columns = len(self.column_names)
+        if isinstance(data_block, str):
+            if not data_block.strip():
+                return {name: np.array([]) for name in self.column_names}
+            first_line = data_block[: data_block.find("\n")]
+            data_block = io.StringIO(data_block)
+        elif not first_line.strip():
+            return {name: np.array([]) for name in self.column_names}
+        if not self.decimal:
+            self.decimal = "," if "," in first_line else "."
+        try:
+            df = pd.read_csv(
+                data_block,
+                sep=delim,
+                header=None,
+                index_col=False,
+                usecols=range(n_columns),
+                decimal=self.decimal,
+            )
+        except ValueError as e:
+            raise ReadError(f"can't parse the data after line {self.n_line}: {e}")
+        column_data = {}
+        for i, name in enumerate(self.column_names):
+            values = df[i].to_numpy()
+            if values.dtype.kind not in "iuf":
+                raise ReadError(f"{self} can't parse the values in column '{name}'")
+            column_data[name] = values.astype(float)
+        self.n_line += len(df)
+        return column_data
+
     def process_data_line(self, line):
         """Split the line and append the numbers the corresponding data column arrays"""
         data_strings_from_line = line.strip().split()
@@ -223,6 +451,342 @@ class BiologicMPTReader:
         return f"{self.__class__.__name__}({self.path_to_file})"
 
 
+class BiologicMPRReader:
+    """A class to read the binary .mpr files written by Biologic's EC-Lab.
+
+    An .mpr file is a sequence of "modules", each starting with b"MODULE" and a header
+    giving its name and length. The data module holds a list of column ID's followed by
+    the data as a plain array of fixed-size records. The reader memory-maps the file
+    and the float columns of the returned measurement are views of the mapped records,
+    so no parsing or copying of them is done. The flags and the integer columns are
+    converted to float, as in .mpt files. The column names are those EC-Lab uses in
+    .mpt files, so the ECMeasurement is the same as `BiologicMPTReader` would give.
+
+    The file format is not documented by BioLogic. The module layouts and column ID's
+    here are as far as they are understood from files in the wild.
+
+    Attributes:
+        path_to_file (Path): the location and name of the file read by the reader
+        modules (list of dict): The header of each module in the file, with "offset"
+            and "length" giving the location of its contents in the file
+        tstamp (str): The unix time corresponding to t=0, from the log module. See
+            `get_fallback_tstamp` for files without one.
+        ec_technique (str): The name of the electrochemical sub-technique. Not yet
+            parsed from .mpr files, so None.
+        column_names (list of str): The names of the data columns in the file
+        column_data (dict of str: np.array): The data in the file as a dict.
+            Note that the np arrays are the same ones as in the measurement's DataSeries,
+            so this does not waste memory.
+        file_has_been_read (bool): This is used to make sure read() is only successfully
+            called once by the Reader. False until read() is called, then True.
+        measurement (Measurement): The measurement returned by read() when the file is
+            read. self.measureemnt is None before read() is called.
+    """
+
+    def __init__(self):
+        """Initialize a Reader for .mpr files. See class docstring."""
+        self.name = None
+        self.path_to_file = None
+        self.modules = []
+        self.tstamp = None
+        self.ec_technique = None
+        self.column_names = []
+        self.column_data = {}
+        self.file_has_been_read = False
+        self.measurement = None
+
+    def read(self, path_to_file, name=None, cls=None, **kwargs):
+        """Return an ECMeasurement with the data and metadata recorded in path_to_file
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the ".mpr" extension
+            name (str): The name to use if not the file name
+            cls (Measurement subclass): The Measurement class to return an object of.
+                Defaults to `ECMeasurement` and should probably be a subclass thereof in
+                any case.
+            **kwargs (dict): Key-word arguments are passed to cls.__init__
+        """
+        path_to_file = Path(path_to_file) if path_to_file else self.path_to_file
+        if self.file_has_been_read:
+            print(
+                f"This {self.__class__.__name__} has already read {self.path_to_file}."
+                " Returning the measurement resulting from the original read. "
+                "Use a new Reader if you want to read another file."
+            )
+            return self.measurement
+        self.name = name or path_to_file.name
+        self.path_to_file = path_to_file
+        self.measurement_class = cls or ECMeasurement
+
+        buffer = map_mpr_file(self.path_to_file)
+        if buffer[: len(MPR_MAGIC)] != MPR_MAGIC:
+            raise ReadError(f"{self.path_to_file} is not an EC-Lab .mpr file")
+        self.modules = self.read_modules(buffer)
+        modules = {module["shortname"]: module for module in self.modules}
+        if "VMP data" not in modules:
+            raise ReadError(f"{self} did not find a data module in the file.")
+        self.read_data_module(buffer, modules["VMP data"])
+        if "VMP loop" in modules:
+            self.read_loop_module(buffer, modules["VMP loop"])
+        if "VMP LOG" in modules:
+            self.tstamp = self.read_tstamp(buffer, modules["VMP LOG"])
+        if self.tstamp is None:
+            self.tstamp = self.get_fallback_tstamp(modules)
+
+        if t_str not in self.column_data:
+            raise ReadError(
+                f"{self} did not find any data for t_str='{t_str}'. "
+                f"This reader only works for files with a '{t_str}' column"
+            )
+        tseries = TimeSeries(
+            name=t_str, data=self.column_data[t_str], tstamp=self.tstamp, unit_name="s",
+        )
+        data_series_list = [tseries]
+        for column_name, data in self.column_data.items():
+            if column_name == t_str:
+                continue
+            vseries = ValueSeries(
+                name=column_name,
+                data=data,
+                tseries=tseries,
+                unit_name=get_column_unit(column_name),
+            )
+            data_series_list.append(vseries)
+
+        obj_as_dict = dict(
+            name=self.name,
+            technique="EC",
+            reader=self,
+            series_list=data_series_list,
+            tstamp=self.tstamp,
+            ec_technique=self.ec_technique,
+        )
+        obj_as_dict.update(kwargs)
+
+        self.measurement = self.measurement_class.from_dict(obj_as_dict)
+        self.file_has_been_read = True
+
+        return self.measurement
+
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the .mpr file, without reading its data
+
+        Only the module headers, the column ID's of the data module, and the log
+        module are read. The number of points is given in the data module, so it is
+        exact.
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the ".mpr" extension
+            estimate_rows (bool): Not used, as the number of points is known.
+
+        Returns dict: See `reading_tools.header_record`.
+        """
+        self.path_to_file = Path(path_to_file)
+        buffer = map_mpr_file(self.path_to_file)
+        try:
+            if buffer[: len(MPR_MAGIC)] != MPR_MAGIC:
+                raise ReadError(f"{self.path_to_file} is not an EC-Lab .mpr file")
+            self.modules = self.read_modules(buffer)
+            modules = {module["shortname"]: module for module in self.modules}
+            if "VMP data" not in modules:
+                raise ReadError(f"{self} did not find a data module in the file.")
+            N, record_fields, flags, _ = self.read_data_module_header(
+                buffer, modules["VMP data"]
+            )
+            if "VMP LOG" in modules:
+                self.tstamp = self.read_tstamp(buffer, modules["VMP LOG"])
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+        if self.tstamp is None:
+            self.tstamp = self.get_fallback_tstamp(modules)
+        column_names = ["loop_number"] if "VMP loop" in modules else []
+        for name, _ in record_fields:
+            column_names += list(flags) if name == "flags" else [name]
+        return header_record(
+            self.path_to_file,
+            tstamp=self.tstamp,
+            technique="EC",
+            column_names=column_names,
+            n_rows=N,
+        )
+
+    def read_modules(self, buffer):
+        """Return a list with the header, offset, and length of each module in buffer"""
+        modules = []
+        position = len(MPR_MAGIC)
+        while position < len(buffer):
+            start, position = position, position + len(b"MODULE")
+            if buffer[start:position] != b"MODULE":
+                raise ReadError(
+                    f"{self} expected a module at byte {start}, but found "
+                    f"{buffer[start:position]}"
+                )
+            header_dtype = MPR_MODULE_HEADER_DTYPE
+            max_length = np.frombuffer(buffer, "<u4", 1, position + 35)[0]
+            if max_length == 0xFFFFFFFF:
+                # In files from EC-Lab v11.50 and later, there is an extra "max length"
+                header_dtype = MPR_MODULE_HEADER_DTYPE_V11_50
+            header = np.frombuffer(buffer, dtype=header_dtype, count=1, offset=position)
+            module = {
+                key: header[key][0].decode("ISO-8859-1").strip()
+                for key in ("shortname", "longname", "date")
+            }
+            module.update(
+                version=int(header["version"][0]),
+                offset=position + header_dtype.itemsize,
+                length=int(header["length"][0]),
+            )
+            modules.append(module)
+            position = module["offset"] + module["length"]
+        return modules
+
+    def read_data_module_header(self, buffer, module):
+        """Return the number of points, record fields, flags, and data offset
+
+        Returns tuple: N (int), the number of points. record_fields (list of tuple),
+            the (name, dtype) of each field of a point's record. flags (dict), the
+            {name: bit mask} of the flag columns packed in the record's "flags" field.
+            data_offset (int), the position of the first record in the buffer.
+        """
+        offset = module["offset"]
+        N = int(np.frombuffer(buffer, dtype="<u4", count=1, offset=offset)[0])
+        n_columns = buffer[offset + 4]
+        if module["version"] == 0 and buffer[offset + 5]:
+            column_ids = np.frombuffer(buffer, "u1", n_columns, offset + 5)
+            data_offset = offset + 100
+        elif module["version"] == 0:
+            # EC-Lab v11.50 and later writes the ID's as two bytes, big-endian.
+            column_ids = np.frombuffer(buffer, ">u2", n_columns, offset + 5)
+            data_offset = offset + 1007
+        elif module["version"] in (2, 3):
+            column_ids = np.frombuffer(buffer, "<u2", n_columns, offset + 5)
+            data_offset = offset + 405 + (module["version"] == 3)
+        else:
+            raise ReadError(
+                f"{self} can't read version {module['version']} of the data module."
+            )
+
+        record_fields = []
+        flags = {}
+        for column_id in column_ids:
+            if column_id in BIOLOGIC_MPR_FLAG_COLUMNS:
+                # All the flag columns are packed into a single byte, placed where the
+                # first of them is in the list of ID's.
+                if not flags:
+                    record_fields.append(("flags", "u1"))
+                name, mask = BIOLOGIC_MPR_FLAG_COLUMNS[column_id]
+                flags[name] = mask
+            elif column_id in BIOLOGIC_MPR_COLUMNS:
+                name, dtype = BIOLOGIC_MPR_COLUMNS[column_id]
+                names = [field[0] for field in record_fields]
+                n = 1
+                while name in names:  # numpy needs unique field names.
+                    n += 1
+                    name = f"{BIOLOGIC_MPR_COLUMNS[column_id][0]} {n}"
+                record_fields.append((name, dtype))
+            else:
+                raise ReadError(
+                    f"{self} does not know the column with ID={column_id} and so "
+                    "can't read the file. Please export it as .mpt instead."
+                )
+        return N, record_fields, flags, data_offset
+
+    def read_data_module(self, buffer, module):
+        """Put views of the records in the data module into self.column_data"""
+        N, record_fields, flags, data_offset = self.read_data_module_header(
+            buffer, module
+        )
+        record_dtype = np.dtype(record_fields)
+        if data_offset + N * record_dtype.itemsize > module["offset"] + module["length"]:
+            raise ReadError(
+                f"{self} expected {N} points of {record_dtype.itemsize} bytes, which "
+                f"don't fit in the data module."
+            )
+        records = np.frombuffer(buffer, dtype=record_dtype, count=N, offset=data_offset)
+
+        for name, dtype in record_fields:
+            if name == "flags":
+                for flag_name, mask in flags.items():
+                    shift = (mask & -mask).bit_length() - 1
+                    flag = (records["flags"] & mask) >> shift
+                    self.column_data[flag_name] = flag.astype(float)
+            elif np.dtype(dtype).kind in "iu":
+                self.column_data[name] = records[name].astype(float)
+            else:
+                self.column_data[name] = records[name]
+        self.column_names = list(self.column_data.keys())
+
+    def read_loop_module(self, buffer, module):
+        """Build the "loop_number" column from the loop start indices in the module"""
+        N = len(self.column_data.get(t_str, []))
+        offset = module["offset"]
+        n_loops = int(np.frombuffer(buffer, "<u4", 1, offset)[0])
+        starts = np.frombuffer(buffer, "<u4", n_loops, offset + 4)
+        starts = starts[starts < N]
+        if not len(starts) or starts[0] != 0:
+            return
+        loop_number = np.repeat(
+            np.arange(len(starts), dtype=float), np.diff(np.append(starts, N))
+        )
+        self.column_data = {"loop_number": loop_number, **self.column_data}
+
+    def get_fallback_tstamp(self, modules):
+        """Return the tstamp to use if the log module doesn't give the start time
+
+        This is midnight of the date of the settings module, if there is one, and
+        otherwise the time the file was last modified.
+
+        Args:
+            modules (dict): {shortname: module} of the modules in the file
+        """
+        if "VMP Set" in modules:
+            date_string = modules["VMP Set"]["date"]
+            print(
+                f"Warning! {self} did not find the start time in the log module. "
+                f"Using midnight of the settings date, '{date_string}', as tstamp."
+            )
+            return timestamp_string_to_tstamp(date_string, forms=BIOLOGIC_MPR_DATE_FORMS)
+        print(
+            f"Warning! {self} found neither a log nor a settings module, so it uses "
+            "the time the file was last modified as tstamp."
+        )
+        return self.path_to_file.stat().st_mtime
+
+    def read_tstamp(self, buffer, module):
+        """Return the start time from the log module, or None if it's not found
+
+        The log module has the start time as an OLE date, i.e. days since 1899-12-30
+        in local time. Its position in the module varies, so we check the known ones.
+        """
+        for position in (465, 469, 473, 585):
+            if position + 8 > module["length"]:
+                continue
+            ole_date = np.frombuffer(buffer, "<f8", 1, module["offset"] + position)[0]
+            if 40000 < ole_date < 50000:  # between 2009 and 2036
+                start_time = datetime(1899, 12, 30) + timedelta(days=float(ole_date))
+                return time.mktime(start_time.timetuple()) + (
+                    start_time.microsecond * 1e-6
+                )
+        return None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path_to_file})"
+
+
+def map_mpr_file(path_to_file):
+    """Return the contents of an .mpr file, memory-mapped unless it is compressed
+
+    The arrays made by np.frombuffer keep the map open after the file is closed. A
+    compressed file (see `reading_tools.open_file`) is decompressed into memory.
+    """
+    if is_compressed(path_to_file):
+        with open_file(path_to_file, "rb") as f:
+            return f.read()
+    with open(path_to_file, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def get_column_unit(column_name):
     """Return the unit name of a .mpt column, i.e the part of the name after the '/'"""
     if "/" in column_name:
@@ -280,8 +844,97 @@ BIOLOGIC_COLUMN_NAMES = (
     "Energy discharge/W.h",
     "Efficiency/%",
     "Rcmp/Ohm",
+    "control/V/mA",
+    "dq/mA.h",
+    "dQ/mA.h",
+    "Ece/V",
+    "(Q-Qo)/mA.h",
+    "I Range",
+)
+
+# The start of every .mpr file
+MPR_MAGIC = b"BIO-LOGIC MODULAR FILE\x1a".ljust(48) + b"\x00\x00\x00\x00"
+
+# Formats of the dates in the .mpr module headers # with example encountered
+BIOLOGIC_MPR_DATE_FORMS = (
+    "%m/%d/%y",  # like 07/29/20
+    "%m-%d-%y",  # like 07-29-20
+    "%m.%d.%y",  # like 07.29.20
+)
+
+# The header following b"MODULE" at the start of each module in an .mpr file
+MPR_MODULE_HEADER_DTYPE = np.dtype(
+    [
+        ("shortname", "S10"),
+        ("longname", "S25"),
+        ("length", "<u4"),
+        ("version", "<u4"),
+        ("date", "S8"),
+    ]
+)
+MPR_MODULE_HEADER_DTYPE_V11_50 = np.dtype(
+    [
+        ("shortname", "S10"),
+        ("longname", "S25"),
+        ("max length", "<u4"),
+        ("length", "<u4"),
+        ("version", "<u4"),
+        ("unknown", "<u4"),
+        ("date", "S8"),
+    ]
 )
 
+# The .mpr column ID's of flags, which are packed in one byte, as {ID: (name, mask)}
+BIOLOGIC_MPR_FLAG_COLUMNS = {
+    1: ("mode", 0x03),
+    2: ("ox/red", 0x04),
+    3: ("error", 0x08),
+    21: ("control changes", 0x10),
+    31: ("Ns changes", 0x20),
+    65: ("counter inc.", 0x80),
+}
+
+# The .mpr column ID's of the other columns, as {ID: (name in .mpt files, dtype)}
+BIOLOGIC_MPR_COLUMNS = {
+    4: ("time/s", "<f8"),
+    5: ("control/V/mA", "<f4"),
+    6: ("Ewe/V", "<f4"),
+    7: ("dq/mA.h", "<f8"),
+    8: ("I/mA", "<f4"),
+    9: ("Ece/V", "<f4"),
+    11: ("<I>/mA", "<f8"),
+    13: ("(Q-Qo)/mA.h", "<f8"),
+    19: ("control/V", "<f4"),
+    20: ("control/mA", "<f4"),
+    23: ("dQ/mA.h", "<f8"),
+    24: ("cycle number", "<f8"),
+    27: ("Ewe-Ece/V", "<f4"),
+    39: ("I Range", "<u2"),
+    70: ("P/W", "<f4"),
+    76: ("<I>/mA", "<f4"),
+    77: ("<Ewe>/V", "<f4"),
+    123: ("Energy charge/W.h", "<f8"),
+    124: ("Energy discharge/W.h", "<f8"),
+    125: ("Capacitance charge/µF", "<f8"),
+    126: ("Capacitance discharge/µF", "<f8"),
+    131: ("Ns", "<u2"),
+    168: ("Rcmp/Ohm", "<f4"),
+    174: ("<Ewe>/V", "<f4"),
+    178: ("(Q-Qo)/C", "<f4"),
+    179: ("dQ/C", "<f4"),
+    211: ("Q charge/discharge/mA.h", "<f8"),
+    212: ("half cycle", "<u4"),
+    434: ("(Q-Qo)/C", "<f4"),
+    435: ("dQ/C", "<f4"),
+    467: ("Q charge/discharge/mA.h", "<f8"),
+    468: ("half cycle", "<u4"),
+    471: ("<Ece>/V", "<f4"),
+    498: ("Q charge/mA.h", "<f8"),
+    499: ("Q discharge/mA.h", "<f8"),
+    501: ("Efficiency/%", "<f8"),
+    502: ("Capacity/mA.h", "<f8"),
+}
+
 
 if __name__ == "__main__":
     """Module demo here.
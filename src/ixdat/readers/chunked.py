@@ -0,0 +1,227 @@
+"""Module for reading data files too big for memory, a chunk of rows at a time
+
+A reader given a `chunk_size` parses its file's data block with a `ChunkWriter`,
+which hands the open file to pandas and appends the columns of each chunk of rows to
+.npy files in the folder of a DirBackend. Only one chunk is in memory at a time. The
+columns come back as read-only memory-mapped arrays, so the measurement built from
+them only loads the parts of its data that are used. Finally, `Measurement.read` calls
+`ChunkWriter.finish`, which post-processes the DataSeries as for any other read (see
+`Measurement.read`), a chunk at a time, and moves the files into the backend as their
+data, so that saving the measurement in that backend later doesn't copy the data again.
+"""
+
+from pathlib import Path
+import shutil
+import struct
+import uuid
+import numpy as np
+import pandas as pd
+from ..backends import DirBackend
+from ..data_series import (
+    TimeSeries,
+    ValueSeries,
+    apply_dtype_policy,
+    apply_run_length_encoding,
+    apply_uniform_time,
+    deduplicate_time_series,
+    get_dtype_policy,
+    get_policy_dtype,
+    iter_windows,
+    make_read_only,
+)
+from ..db import DB
+from ..exceptions import ReadError
+
+NPY_HEADER_SIZE = 128  # bytes. A multiple of 64 with room for any 1-D shape.
+CHUNK_FOLDER_NAME = "chunks"  # in the project directory of the DirBackend
+
+
+class NpyAppender:
+    """A 1-D .npy file which is written a chunk of values at a time
+
+    The header is written first with the shape (0,) and rewritten with the real
+    shape by close(). It is padded to NPY_HEADER_SIZE either way, so the data after
+    it stays in place.
+    """
+
+    def __init__(self, path, dtype=float):
+        """Create the file at path, with a header but no data yet"""
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.n_values = 0
+        self.file = open(self.path, "wb")
+        self.file.write(self.get_header(0))
+
+    def get_header(self, n_values):
+        """Return the bytes of the .npy header for n_values values"""
+        header = repr(
+            {
+                "descr": np.lib.format.dtype_to_descr(self.dtype),
+                "fortran_order": False,
+                "shape": (n_values,),
+            }
+        )
+        magic = np.lib.format.magic(1, 0)
+        # the header is the magic string, its length (2 bytes), and then the dict
+        # padded by spaces and ending in a newline.
+        header = header.ljust(NPY_HEADER_SIZE - len(magic) - 3) + "\n"
+        return magic + struct.pack("<H", len(header)) + header.encode("latin1")
+
+    def append(self, values):
+        """Write values (np.array) to the end of the file"""
+        np.asarray(values, dtype=self.dtype).tofile(self.file)
+        self.n_values += len(values)
+
+    def close(self, n_values=None):
+        """Finish the file with its first n_values and return it memory-mapped
+
+        Args:
+            n_values (int): The number of values to keep. Defaults to all of them.
+        """
+        n_values = self.n_values if n_values is None else n_values
+        self.file.truncate(NPY_HEADER_SIZE + n_values * self.dtype.itemsize)
+        self.file.seek(0)
+        self.file.write(self.get_header(n_values))
+        self.file.close()
+        return np.load(self.path, mmap_mode="r")
+
+
+class ChunkWriter:
+    """Writes the data columns of a file a chunk at a time into a DirBackend's folder
+
+    Attributes:
+        chunk_size (int): The number of rows to parse at a time
+        backend (DirBackend): The backend that the data ends up saved in
+        folder (Path): The folder of this ChunkWriter's files until they are saved
+    """
+
+    def __init__(self, chunk_size, backend=None):
+        """Initiate a ChunkWriter. See the class docstring.
+
+        Args:
+            chunk_size (int): The number of rows to parse at a time
+            backend (DirBackend): The backend to save the data in. Defaults to that of
+                the database, DB.backend, which must then be a DirBackend.
+        """
+        backend = backend or DB.backend
+        if not isinstance(backend, DirBackend):
+            raise ReadError(
+                f"Reading in chunks needs a DirBackend to put the data in, not {backend}"
+            )
+        self.chunk_size = int(chunk_size)
+        self.backend = backend
+        self.folder = backend.project_directory / CHUNK_FOLDER_NAME / uuid.uuid4().hex
+        self.folder.mkdir(parents=True)
+        self.n_files = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.folder})"
+
+    def new_appender(self, dtype=float):
+        """Return an NpyAppender writing a new file of dtype in self.folder"""
+        self.n_files += 1
+        return NpyAppender(self.folder / f"{self.n_files}.npy", dtype=dtype)
+
+    def convert(self, data, dtype):
+        """Return data converted to dtype, written a chunk at a time to a new file"""
+        appender = self.new_appender(dtype)
+        for window in iter_windows(len(data), self.chunk_size):
+            appender.append(data[window])
+        return appender.close()
+
+    def read_columns(self, f, n_columns, trim=None, **kwargs):
+        """Return memory-mapped arrays with the columns in the rest of the open file f
+
+        Columns padded by empty cells (NaN) at the end can be cut, which is done as
+        each chunk is written, so that the data never needs to be in memory at once.
+
+        Args:
+            f (file): The file, open at the first data line
+            n_columns (int): The number of columns to read
+            trim (str): How to cut columns padded with NaN. "first_nan" cuts each
+                column at its first NaN, and "trailing_nans" cuts off its last NaNs.
+                By default, the columns are not cut.
+            kwargs: Key-word arguments to pandas.read_csv, like `sep`
+
+        Returns list of np.memmap: The columns, as float arrays
+        """
+        appenders = [self.new_appender() for _ in range(n_columns)]
+        lengths = [None] * n_columns
+        try:
+            chunks = pd.read_csv(
+                f,
+                header=None,
+                index_col=False,
+                usecols=range(n_columns),
+                dtype=float,
+                chunksize=self.chunk_size,
+                **kwargs,
+            )
+            for chunk in chunks:
+                for i, appender in enumerate(appenders):
+                    n_before = appender.n_values
+                    values = chunk[i].to_numpy()
+                    appender.append(values)
+                    if trim == "first_nan" and lengths[i] is None:
+                        is_nan = np.isnan(values)
+                        if is_nan.any():
+                            lengths[i] = n_before + np.argmax(is_nan)
+                    elif trim == "trailing_nans":
+                        is_value = ~np.isnan(values)
+                        if is_value.any():
+                            lengths[i] = appender.n_values - np.argmax(is_value[::-1])
+        except pd.errors.EmptyDataError:
+            pass  # There are no data lines, so the columns are empty.
+        except ValueError as e:
+            for appender in appenders:
+                appender.file.close()
+            shutil.rmtree(self.folder, ignore_errors=True)
+            raise ReadError(f"{self} can't parse the data: {e}")
+        if trim == "trailing_nans":
+            lengths = [n or 0 for n in lengths]
+        return [appender.close(n) for appender, n in zip(appenders, lengths)]
+
+    def finish(self, measurement, dtype_policy=None, uniform_time_tolerance=None):
+        """Post-process and save the series of measurement read with this ChunkWriter
+
+        The series are given the dtype policy, uniform time, run-length encoding, and
+        deduplication, as the series of any read are by `Measurement.read`, but a
+        chunk at a time. Data that changes dtype is written to new files. Then they
+        are saved with `save_series`.
+
+        Args:
+            measurement (Measurement): The measurement just read
+            dtype_policy (dict): Overrides of the CFG policy. See `get_dtype_policy`.
+            uniform_time_tolerance (float): Overrides CFG.uniform_time_tolerance
+        """
+        series_list = measurement.series_list
+        apply_dtype_policy(series_list, dtype_policy)  # the series not on disk
+        dtype_policy = get_dtype_policy(dtype_policy)
+        for series in series_list:
+            if isinstance(series, ValueSeries) and isinstance(series.data, np.memmap):
+                dtype = get_policy_dtype(series, dtype_policy, self.chunk_size)
+                if dtype is not None:
+                    series._data = self.convert(series.data, dtype)
+                    series._uid = None  # as the data has changed.
+        series_list = apply_uniform_time(
+            series_list, uniform_time_tolerance, chunk_size=self.chunk_size
+        )
+        series_list = apply_run_length_encoding(series_list, chunk_size=self.chunk_size)
+        measurement._series_list = deduplicate_time_series(make_read_only(series_list))
+        self.save_series(measurement.series_list)
+
+    def save_series(self, series_list):
+        """Save the series in the backend, moving their files from self.folder into it
+
+        TimeSeries are saved first, since the other series refer to them by id. Series
+        whose data isn't from this ChunkWriter (like the ones made from a header) are
+        saved as usual. Files which end up in no series are removed with the folder.
+        """
+        for series in sorted(series_list, key=lambda s: not isinstance(s, TimeSeries)):
+            data = series.data
+            data_file = None
+            if isinstance(data, np.memmap) and data.filename:
+                if Path(data.filename).parent == self.folder.resolve():
+                    data_file = data.filename
+            self.backend.save_data_obj(series, data_file=data_file)
+        shutil.rmtree(self.folder, ignore_errors=True)
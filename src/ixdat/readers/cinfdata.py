@@ -2,10 +2,12 @@
 
 from pathlib import Path
 import numpy as np
+import pandas as pd
 from ..exceptions import ReadError
 from ..data_series import ValueSeries, TimeSeries
 from ..techniques import MSMeasurement
-from .reading_tools import timestamp_string_to_tstamp
+from .reading_tools import timestamp_string_to_tstamp, header_record, open_file
+from .chunked import ChunkWriter
 
 
 class CinfdataTXTReader:
@@ -36,6 +38,8 @@ class CinfdataTXTReader:
         column_data (dict of str: np.array): The data in the file as a dict.
             Note that the np arrays are the same ones as in the measurement's DataSeries,
             so this does not waste memory.
+        chunk_writer (ChunkWriter): Parses the data a chunk at a time when reading with
+            a `chunk_size`, and is None otherwise.
         file_has_been_read (bool): This is used to make sure read() is only successfully
             called once by the Reader. False until read() is called, then True.
         measurement (Measurement): The measurement returned by read() when the file is
@@ -59,17 +63,20 @@ class CinfdataTXTReader:
         self.column_data = {}
         self.technique = "MS"  # TODO: Figure out how to tell if it's something else
         self.measurement_class = MSMeasurement
+        self.chunk_writer = None
         self.file_has_been_read = False
         self.measurement = None
 
-    def read(self, path_to_file, name=None, cls=None, **kwargs):
+    def read(
+        self, path_to_file, name=None, cls=None, chunk_size=None, backend=None, **kwargs
+    ):
         """Return an MSMeasurement with the data and metadata recorded in path_to_file
 
-        This loops through the lines of the file, processing one at a time. For header
-        lines, this involves searching for metadata. For the column name line, this
-        involves creating empty arrays for each data series. For the data lines, this
-        involves appending to these arrays. After going through all the lines, it
-        converts the arrays to DataSeries.
+        This loops through the lines of the header, processing one at a time. For
+        header lines, this involves searching for metadata. For the column name line,
+        this involves creating empty arrays for each data series. The data lines are
+        then parsed all at once by `process_data_block`. Finally, it converts the
+        arrays to DataSeries.
         For cinfdata text files, each value column has its own timecolumn, and they are
         not necessarily all the same length.
         Finally, the method returns an ECMeasurement with these DataSeries. The
@@ -79,6 +86,12 @@ class CinfdataTXTReader:
 
         Args:
             path_to_file (Path): The full abs or rel path including the ".mpt" extension
+            chunk_size (int): If given, the data is parsed this many rows at a time
+                into files in `backend`, and the DataSeries get it memory-mapped from
+                there. This is for files too big for memory. `Measurement.read` then
+                saves the series there, see `readers.chunked`.
+            backend (DirBackend): The backend to put the data in when reading in
+                chunks. Defaults to the database's backend.
             **kwargs (dict): Key-word arguments are passed to ECMeasurement.__init__
         """
         path_to_file = Path(path_to_file) if path_to_file else self.path_to_file
@@ -91,11 +104,16 @@ class CinfdataTXTReader:
             return self.measurement
         self.name = name or path_to_file.name
         self.path_to_file = path_to_file
-        with open(self.path_to_file, "r") as f:
+        if chunk_size:
+            self.chunk_writer = ChunkWriter(chunk_size, backend=backend)
+        with open_file(self.path_to_file) as f:
             for line in f:
                 self.process_line(line)
+                if self.place_in_file == "data":
+                    self.process_data_block(f)
+                    break
         for name in self.column_names:
-            self.column_data[name] = np.array(self.column_data[name])
+            self.column_data[name] = np.asanyarray(self.column_data[name])
 
         data_series_list = []
         for name, (tcol, vcol) in self.t_and_v_cols.items():
@@ -132,6 +150,31 @@ class CinfdataTXTReader:
         self.file_has_been_read = True
         return self.measurement
 
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the text file, reading only its header
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the extension
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                size. The columns have different lengths, so this is of the longest.
+
+        Returns dict: See `reading_tools.header_record`
+        """
+        self.path_to_file = Path(path_to_file)
+        with open_file(self.path_to_file) as f:
+            for line in f:
+                self.process_line(line)
+                if self.place_in_file == "data":
+                    break
+        return header_record(
+            self.path_to_file,
+            tstamp=self.tstamp,
+            technique=self.technique,
+            column_names=self.column_names,
+            n_header_lines=self.n_line,
+            estimate_rows=estimate_rows,
+        )
+
     def process_line(self, line):
         """Call the correct line processing method depending on self.place_in_file"""
         if self.place_in_file == "header":
@@ -180,6 +223,42 @@ class CinfdataTXTReader:
 
         self.place_in_file = "data"
 
+    def process_data_block(self, f):
+        """Parse all the remaining lines of the open file f into the data columns
+
+        The data block is read column-wise by pandas' C parser in one go. Each column
+        pair is as long as its mass was measured, and the shorter ones are padded by
+        empty cells, so each column is cut at its first empty cell. With a chunk_writer,
+        the columns are instead written to disk a chunk of rows at a time.
+        """
+        n_columns = len(self.column_names)
+        if self.chunk_writer:
+            columns = self.chunk_writer.read_columns(
+                f, n_columns, trim="first_nan", sep=self.delim
+            )
+            self.column_data.update(zip(self.column_names, columns))
+            self.n_line += max((len(column) for column in columns), default=0)
+            return
+        try:
+            df = pd.read_csv(
+                f,
+                sep=self.delim,
+                header=None,
+                index_col=False,
+                usecols=range(n_columns),
+                dtype=float,
+            )
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame(np.empty((0, n_columns)))
+        except ValueError as e:
+            raise ReadError(f"{self} can't parse the data in {self.path_to_file}: {e}")
+        for i, name in enumerate(self.column_names):
+            values = df[i].to_numpy()
+            is_empty = np.isnan(values)
+            N = np.argmax(is_empty) if is_empty.any() else len(values)
+            self.column_data[name] = values[:N]
+        self.n_line += len(df)
+
     def process_data_line(self, line):
         """Split the line and append the numbers the corresponding data column arrays"""
         data_strings_from_line = line.strip().split(self.delim)
@@ -4,6 +4,7 @@ import pickle
 from ..data_series import TimeSeries, ValueSeries
 from ..measurements import Measurement
 from .biologic import BIOLOGIC_COLUMN_NAMES, get_column_unit
+from .reading_tools import header_record, open_file
 
 
 ECMSMeasruement = TECHNIQUE_CLASSES["EC-MS"]
@@ -23,7 +24,7 @@ class EC_MS_CONVERTER:
             path_to_file (Path): The full abs or rel path including the
             ".pkl" extension.
         """
-        with open(file_path, "rb") as f:
+        with open_file(file_path, "rb") as f:
             ec_ms_dict = pickle.load(f)
 
         return measurement_from_ec_ms_dataset(
@@ -35,6 +36,34 @@ class EC_MS_CONVERTER:
             **kwargs,
         )
 
+    def read_header(self, file_path, estimate_rows=True):
+        """Return a record of the metadata of an EC_MS .pkl file
+
+        A pickle can't be read in part, so the whole file is loaded, but no
+        DataSeries are made.
+
+        Args:
+            file_path (Path): The full abs or rel path including the ".pkl" extension
+            estimate_rows (bool): Not used, as the number of points is known.
+
+        Returns dict: See `reading_tools.header_record`. n_rows is the length of the
+            longest column.
+        """
+        with open_file(file_path, "rb") as f:
+            ec_ms_dict = pickle.load(f)
+        column_names = sorted(ec_ms_dict["data_cols"])
+        n_rows = max(
+            (len(ec_ms_dict[col]) for col in column_names if col in ec_ms_dict),
+            default=0,
+        )
+        return header_record(
+            file_path,
+            tstamp=ec_ms_dict["tstamp"],
+            technique="EC-MS",
+            column_names=column_names,
+            n_rows=n_rows,
+        )
+
 
 def measurement_from_ec_ms_dataset(
     ec_ms_dict, name=None, cls=ECMSMeasruement, reader=None, **kwargs,
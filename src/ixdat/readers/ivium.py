@@ -3,7 +3,13 @@
 import re
 from pathlib import Path
 import pandas as pd
-from .reading_tools import timestamp_string_to_tstamp, series_list_from_dataframe
+from ..exceptions import ReadError
+from .reading_tools import (
+    timestamp_string_to_tstamp,
+    series_list_from_dataframe,
+    header_record,
+    open_file,
+)
 
 
 class IviumDataReader:
@@ -25,31 +31,11 @@ class IviumDataReader:
         self.path_to_file = Path(path_to_file)
         name = name or self.path_to_file.name
 
-        with open(path_to_file, "r") as f:
-            timesting_line = f.readline()  # we need this for tstamp
-            columns_line = f.readline()  # we need this to get the column names
-            first_data_line = f.readline()  # we need this to check the column names
-        tstamp = timestamp_string_to_tstamp(
-            timesting_line.strip(),
-            form="%d/%m/%Y %H:%M:%S",  # like '04/03/2021 19:42:30'
-        )
-
-        # ivium files do something really dumb. They add an extra column of data, which
-        # looks like the measured potential (to complement 'E/V' which is presumably the
-        # setpoint), but don't add the name of this column in the column name line.
-        # So in order for pandas' csv reader to read it, we need assign a name to this
-        # extra column (it becomes 'Unlabeled_1') and specify the column names.
-        # Here we prepare the thus-corrected column name list, `column_names`:
-        column_names = [col.strip() for col in columns_line.split(" ") if col.strip()]
-        first_dat = [dat.strip() for dat in first_data_line.split(" ") if dat.strip()]
-        if len(first_dat) > len(column_names):
-            for i in range(len(first_dat) - len(column_names)):
-                column_names.append(f"unlabeled_{i}")
+        tstamp, column_names = self.process_header(self.path_to_file)
 
         # And now we can read the data. Notice also the variable whitespace delimiter.
-        dataframe = pd.read_csv(
-            self.path_to_file, delimiter=r"\s+", header=1, names=column_names
-        )
+        with open_file(self.path_to_file) as f:
+            dataframe = pd.read_csv(f, delimiter=r"\s+", header=1, names=column_names)
 
         # All that's left is getting the data from the dataframe into DataSeries and
         # into the Measurement, starting with the TimeSeries:
@@ -76,11 +62,56 @@ class IviumDataReader:
             cls = ECMeasurement
         return cls.from_dict(obj_as_dict)
 
+    def process_header(self, path_to_file):
+        """Return the tstamp and the (corrected) column names of an ivium file"""
+        with open_file(path_to_file) as f:
+            timesting_line = f.readline()  # we need this for tstamp
+            columns_line = f.readline()  # we need this to get the column names
+            first_data_line = f.readline()  # we need this to check the column names
+        tstamp = timestamp_string_to_tstamp(
+            timesting_line.strip(),
+            form="%d/%m/%Y %H:%M:%S",  # like '04/03/2021 19:42:30'
+        )
+
+        # ivium files do something really dumb. They add an extra column of data, which
+        # looks like the measured potential (to complement 'E/V' which is presumably the
+        # setpoint), but don't add the name of this column in the column name line.
+        # So in order for pandas' csv reader to read it, we need assign a name to this
+        # extra column (it becomes 'Unlabeled_1') and specify the column names.
+        # Here we prepare the thus-corrected column name list, `column_names`:
+        column_names = [col.strip() for col in columns_line.split(" ") if col.strip()]
+        first_dat = [dat.strip() for dat in first_data_line.split(" ") if dat.strip()]
+        if len(first_dat) > len(column_names):
+            for i in range(len(first_dat) - len(column_names)):
+                column_names.append(f"unlabeled_{i}")
+        return tstamp, column_names
+
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of an ivium file, reading only its header
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the suffix (.txt)
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                size
+
+        Returns dict: See `reading_tools.header_record`
+        """
+        self.path_to_file = Path(path_to_file)
+        tstamp, column_names = self.process_header(self.path_to_file)
+        return header_record(
+            self.path_to_file,
+            tstamp=tstamp,
+            technique="EC",
+            column_names=column_names,
+            n_header_lines=2,
+            estimate_rows=estimate_rows,
+        )
+
 
 class IviumDatasetReader:
     """Class for reading sets of ivium files exported together"""
 
-    def read(self, path_to_file, cls=None, name=None, **kwargs):
+    def read(self, path_to_file, cls=None, name=None, workers=None, **kwargs):
         """Return a Measurement containing the data of an ivium dataset,
 
         An ivium dataset is a group of ivium files exported together. They share a
@@ -94,36 +125,83 @@ class IviumDatasetReader:
                 the full path of any one of them.
             cls (Measurement class): The measurement class. Defaults to ECMeasurement.
             name (str): The name of the dataset. Defaults to the base name of the dataset
+            workers (int): The number of processes to read the files in. By default, the
+                files are read one after the other. See `Measurement.read_files()`.
             kwargs: key-word arguments are included in the dictionary for cls.from_dict()
 
         Returns cls or ECMeasurement: a measurement object with the ivium data
         """
         self.path_to_file = Path(path_to_file)
-
-        folder = self.path_to_file.parent
-        base_name = self.path_to_file.name
-        if re.search(r"_[0-9]", base_name):
-            base_name = base_name.rpartition("_")[0]
+        base_name, all_file_paths = self.get_dataset_files()
         name = name or base_name
 
-        # With two list comprehensions, we get the Measurement object for each file
-        # in the folder who's name starts with base_name:
-        all_file_paths = [f for f in folder.iterdir() if f.name.startswith(base_name)]
-        component_measurements = [
-            IviumDataReader().read(f, cls=cls) for f in all_file_paths
-        ]
-
-        # Now we append these using the from_component_measurements class method of the
-        # right TechniqueMeasurement class, and return the result.
         if not cls:
             from ..techniques.ec import ECMeasurement
 
             cls = ECMeasurement
+
+        # We get the Measurement object for each file in the folder who's name starts
+        # with base_name, each read by its own IviumDataReader:
+        component_measurements = cls.read_files(
+            all_file_paths, reader=IviumDataReader, workers=workers
+        )
+
+        # Now we append these using the from_component_measurements class method of the
+        # right TechniqueMeasurement class, and return the result.
         measurement = cls.from_component_measurements(
             component_measurements, name=name, **kwargs
         )
         return measurement
 
+    def get_dataset_files(self):
+        """Return the base name and the paths of the files of the dataset"""
+        folder = self.path_to_file.parent
+        base_name = self.path_to_file.name
+        if re.search(r"_[0-9]", base_name):
+            base_name = base_name.rpartition("_")[0]
+        all_file_paths = [f for f in folder.iterdir() if f.name.startswith(base_name)]
+        return base_name, all_file_paths
+
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of an ivium dataset, reading only headers
+
+        Args:
+            path_to_file (Path or str): The base name of the dataset or the path to any
+                of its files. See `read()`.
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                sizes
+
+        Returns dict: See `reading_tools.header_record`. The tstamp is the earliest
+            and n_rows the sum of those of the files, which are listed as "files".
+            n_rows is None if that of any file isn't known, like for a .bz2 file.
+        """
+        self.path_to_file = Path(path_to_file)
+        base_name, all_file_paths = self.get_dataset_files()
+        if not all_file_paths:
+            raise ReadError(f"Found no files of the ivium dataset {self.path_to_file}")
+        records = [
+            IviumDataReader().read_header(path, estimate_rows=estimate_rows)
+            for path in sorted(all_file_paths)
+        ]
+        column_names = []
+        for record in records:
+            column_names += [
+                col for col in record["column_names"] if col not in column_names
+            ]
+        n_rows = None
+        file_n_rows = [record["n_rows"] for record in records]
+        if estimate_rows and None not in file_n_rows:
+            n_rows = sum(file_n_rows)
+        return header_record(
+            self.path_to_file,
+            tstamp=min(record["tstamp"] for record in records),
+            technique="EC",
+            column_names=column_names,
+            n_rows=n_rows,
+            n_rows_is_estimate=any(record["n_rows_is_estimate"] for record in records),
+            files=[record["path_to_file"] for record in records],
+        )
+
 
 def get_column_unit(column_name):
     """Return the unit name of an ivium column, i.e what follows the first '/'."""
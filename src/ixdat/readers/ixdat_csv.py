@@ -9,6 +9,7 @@ from ..data_series import ValueSeries, TimeSeries, DataSeries, Field
 from ..measurements import Measurement
 from ..spectra import Spectrum, SpectrumSeries
 from ..techniques import TECHNIQUE_CLASSES
+from .reading_tools import header_record, open_file
 
 regular_expressions = {
     "tstamp": r"tstamp = ([0-9\.]+)",
@@ -68,6 +69,7 @@ class IxdatCSVReader:
         self.column_names = []
         self.column_data = {}
         self.technique = None
+        self.aux_files = {}
         self.aux_series_list = []
         self.measurement_class = Measurement
         self.file_has_been_read = False
@@ -76,11 +78,11 @@ class IxdatCSVReader:
     def read(self, path_to_file, name=None, cls=None, **kwargs):
         """Return a Measurement with the data and metadata recorded in path_to_file
 
-        This loops through the lines of the file, processing one at a time. For header
-        lines, this involves searching for metadata. For the column name line, this
-        involves creating empty arrays for each data series. For the data lines, this
-        involves appending to these arrays. After going through all the lines, it
-        converts the arrays to DataSeries.
+        This loops through the lines of the header, processing one at a time. For
+        header lines, this involves searching for metadata. For the column name line,
+        this involves creating empty arrays for each data series. The data lines are
+        then parsed all at once by `process_data_block`. Finally, it converts the
+        arrays to DataSeries.
         The technique is specified in the header, and used to pick the
         TechniqueMeasurement class.
         Finally, the method returns a TechniqueMeasurement object `measurement`
@@ -108,9 +110,14 @@ class IxdatCSVReader:
         self.name = name or path_to_file.name
         self.path_to_file = path_to_file
 
-        with open(self.path_to_file, "r") as f:
+        with open_file(self.path_to_file) as f:
             for line in f:
                 self.process_line(line)
+                if self.place_in_file == "data":
+                    self.process_data_block(f)
+                    break
+        for aux_file_name, aux_file in self.aux_files.items():
+            self.read_aux_file(aux_file, name=aux_file_name)
 
         for name in self.column_names:
             self.column_data[name] = np.array(self.column_data[name])
@@ -170,6 +177,33 @@ class IxdatCSVReader:
         self.file_has_been_read = True
         return self.measurement
 
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the .csv file, reading only its header
+
+        Args:
+            path_to_file (Path): The full abs or rel path including the ".csv" extension
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                size
+
+        Returns dict: See `reading_tools.header_record`. Also has "aux_files", the
+            {name: path} of the auxiliary files with e.g. spectra, which are not read.
+        """
+        self.path_to_file = Path(path_to_file)
+        with open_file(self.path_to_file) as f:
+            for line in f:
+                self.process_line(line)
+                if self.place_in_file == "data":
+                    break
+        return header_record(
+            self.path_to_file,
+            tstamp=self.tstamp,
+            technique=self.technique,
+            column_names=self.column_names,
+            n_header_lines=self.n_line,
+            estimate_rows=estimate_rows,
+            aux_files={name: str(path) for name, path in self.aux_files.items()},
+        )
+
     def process_line(self, line):
         """Call the correct line processing method depending on self.place_in_file"""
         if self.place_in_file == "header":
@@ -212,7 +246,7 @@ class IxdatCSVReader:
         if aux_file_match:
             aux_file_name = aux_file_match.group(1)
             aux_file = self.path_to_file.parent / aux_file_match.group(2)
-            self.read_aux_file(aux_file, name=aux_file_name)
+            self.aux_files[aux_file_name] = aux_file
 
         if self.N_header_lines and self.n_line >= self.N_header_lines - 2:
             self.place_in_file = "column names"
@@ -224,6 +258,32 @@ class IxdatCSVReader:
         self.column_data.update({name: [] for name in self.column_names})
         self.place_in_file = "data"
 
+    def process_data_block(self, f):
+        """Parse all the remaining lines of the open file f into the data columns
+
+        The data block is read column-wise by pandas' C parser in one go. Columns are
+        different lengths if they have different time columns. The shorter ones are
+        padded with empty cells, which come out as NaN and are trimmed off the end.
+        """
+        n_columns = len(self.column_names)
+        try:
+            df = pd.read_csv(
+                TabDroppingFile(f),
+                sep=self.delim,
+                header=None,
+                index_col=False,
+                usecols=range(n_columns),
+                float_precision="round_trip",
+            )
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame(np.empty((0, n_columns)))
+        for i, name in enumerate(self.column_names):
+            values = pd.to_numeric(df[i], errors="coerce").to_numpy(dtype=float)
+            is_value = ~np.isnan(values)
+            N = len(values) - np.argmax(is_value[::-1]) if is_value.any() else 0
+            self.column_data[name] = values[:N]
+        self.n_line += len(df)
+
     def process_data_line(self, line):
         """Split the line and append the numbers the corresponding data column arrays"""
         data_strings_from_line = line.strip().split(self.delim)
@@ -249,6 +309,24 @@ class IxdatCSVReader:
         print(header)
 
 
+class TabDroppingFile:
+    """Wrapper of an open text file which drops the tabs from what is read from it
+
+    CSVExporter separates values by ",\t". Dropping the tabs lets pandas' C parser
+    split on "," alone, while still reading the file (which may be decompressing, see
+    `reading_tools.open_file`) a chunk at a time.
+    """
+
+    def __init__(self, f):
+        self.f = f
+
+    def read(self, size=-1):
+        return self.f.read(size).replace("\t", "")
+
+    def __iter__(self):
+        return (line.replace("\t", "") for line in self.f)
+
+
 def get_column_unit(column_name):
     """Return the unit name of an ixdat column, i.e the part of the name after the '/'"""
     unit_match = re.search(regular_expressions["unit"], column_name)
@@ -278,14 +356,15 @@ class IxdatSpectrumReader(IxdatCSVReader):
 
         Returns cls: a Spectrum of type cls
         """
-        with open(path_to_file, "r") as f:
+        with open_file(path_to_file) as f:
             for line in f:
                 if self.place_in_file == "header":
                     self.process_line(line)
                 else:
                     break
 
-        df = pd.read_csv(path_to_file, sep=",", header=self.N_header_lines - 2)
+        with open_file(path_to_file) as f:
+            df = pd.read_csv(f, sep=",", header=self.N_header_lines - 2)
         if self.technique == "spectrum":
             # FIXME: in the future, this needs to cover all spectrum classes
             x_name, y_name = tuple(df.keys())
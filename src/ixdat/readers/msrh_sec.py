@@ -1,11 +1,30 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from .reading_tools import prompt_for_tstamp
+from .reading_tools import prompt_for_tstamp, header_record, open_file
 from ..techniques import TECHNIQUE_CLASSES
 from ..data_series import DataSeries, TimeSeries, ValueSeries, Field
 from ..techniques.analysis_tools import calc_t_using_scan_rate
 
+SEC_SERIES_NAMES = [  # The series of a measurement read by MsrhSECReader
+    "time from scan rate",
+    "raw potential / [V]",
+    "raw current / [mA]",
+    "wavelength / [nm]",
+    "reference",
+    "spectra",
+]
+SEC_DECAY_SERIES_NAMES = [  # The series of a measurement read by MsrhSECDecayReader
+    "t for current",
+    "t for potential",
+    "t for spectra",
+    "raw potential / [V]",
+    "raw current / [mA]",
+    "wavelength / [nm]",
+    "reference",
+    "spectra",
+]
+
 
 class MsrhSECReader:
     """A reader for SEC saved in three files: spectra vs v; wavelengths; current vs v"""
@@ -137,6 +156,32 @@ class MsrhSECReader:
 
         return measurement
 
+    def read_header(self, path_to_file, tstamp=None, estimate_rows=True):
+        """Return a record of the metadata of the SEC spectra file, reading one line
+
+        Only the spectra file is read. Its first line has the potential of each
+        spectrum, and so gives the number of spectra exactly. The files have no
+        timestamp, so tstamp is None unless given.
+
+        Args:
+            path_to_file (Path or str): The full path to the file containing the
+                spectra data. See read().
+            tstamp (float): Timestamp, if known
+            estimate_rows (bool): Not used, as the number of spectra is known.
+
+        Returns dict: See `reading_tools.header_record`. The rows are the spectra.
+            Also has "v_span", the first and last potential of the spectra.
+        """
+        v = read_first_row(path_to_file)
+        return header_record(
+            path_to_file,
+            tstamp=tstamp,
+            technique="S-EC",
+            column_names=SEC_SERIES_NAMES,
+            n_rows=len(v),
+            v_span=[v[0], v[-1]] if len(v) else None,
+        )
+
 
 class MsrhSECDecayReader:
     def read(
@@ -238,3 +283,36 @@ class MsrhSECDecayReader:
         )
 
         return measurement
+
+    def read_header(self, path_to_file, tstamp=None, estimate_rows=True):
+        """Return a record of the metadata of the SEC spectra file, reading one line
+
+        Only the spectra file is read. Its first line has the time of each spectrum,
+        and so gives the number of spectra exactly. The files have no timestamp, so
+        tstamp is None unless given.
+
+        Args:
+            path_to_file (Path or str): The full path to the file containing the
+                spectra data. See read().
+            tstamp (float): Timestamp, if known
+            estimate_rows (bool): Not used, as the number of spectra is known.
+
+        Returns dict: See `reading_tools.header_record`. The rows are the spectra.
+            Also has "tspan", the first and last time of the spectra.
+        """
+        t = read_first_row(path_to_file)
+        return header_record(
+            path_to_file,
+            tstamp=tstamp,
+            technique="S-EC",
+            column_names=SEC_DECAY_SERIES_NAMES,
+            n_rows=len(t),
+            tspan=[t[0], t[-1]] if len(t) else None,
+        )
+
+
+def read_first_row(path_to_file):
+    """Return the numbers in the first row of an SEC spectra file, after the first"""
+    with open_file(path_to_file) as f:
+        first_row = f.readline().split(",")
+    return [float(value) for value in first_row[1:]]
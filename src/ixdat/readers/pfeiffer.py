@@ -2,10 +2,23 @@
 
 import re
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from .reading_tools import timestamp_string_to_tstamp, series_list_from_dataframe
+from .reading_tools import (
+    timestamp_string_to_tstamp,
+    series_list_from_dataframe,
+    header_record,
+    open_file,
+    FLOAT_MATCH,
+)
+from ..data_series import DataSeries, TimeSeries, Field
+from ..exceptions import ReadError
+from ..spectra import SpectrumSeries
 from ..techniques import MSMeasurement
 
+MID_N_HEADER_LINES = 7  # in a '- Bin.dat' file, including the column name line
+SCAN_T_STR = "Time Relative (sec)"  # the time of each scan in a '- Scan.dat' file
+
 
 class PVMassSpecReader:
     """A reader for (advanced) MID files exported from PVMassSpec ('... - Bin.dat')"""
@@ -28,14 +41,10 @@ class PVMassSpecReader:
         """
         self.path_to_file = Path(path_to_file)
         name = name or self.path_to_file.name
-        with open(path_to_file, "r") as f:
-            # timestamp is on the the third line, which we select here:
-            tstamp_line = [f.readline() for _ in range(3)][-1]
-        tstamp = timestamp_string_to_tstamp(
-            tstamp_line.split(".")[-2][-19:],  # last 19 characters before the last '.'
-            form="%m-%d-%Y %H'%M'%S",  # like "03-02-2021 12'58'40"
-        )
-        df = pd.read_csv(self.path_to_file, header=6, delimiter="\t")
+        with open_file(path_to_file) as f:
+            tstamp = read_tstamp(f)
+        with open_file(path_to_file) as f:
+            df = pd.read_csv(f, header=MID_N_HEADER_LINES - 1, delimiter="\t")
         # PV MassSpec calls masses <x>_amu, information we need to pass on to
         # MSMeasurement, so that the data will be accessible by the 'M<x>' mass string.
         mass_aliases = {
@@ -58,11 +67,181 @@ class PVMassSpecReader:
         cls = cls or MSMeasurement
         return cls.from_dict(meas_as_dict)
 
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the MID file, reading only its header
+
+        Args:
+            path_to_file (Path or str): a path to the file exported by PVMassSpec with
+                (advanced) MID data.
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                size
+
+        Returns dict: See `reading_tools.header_record`
+        """
+        self.path_to_file = Path(path_to_file)
+        with open_file(self.path_to_file) as f:
+            tstamp = read_tstamp(f)
+            for _ in range(MID_N_HEADER_LINES - 4):
+                f.readline()
+            column_names = [col.strip() for col in f.readline().split("\t")]
+        return header_record(
+            self.path_to_file,
+            tstamp=tstamp,
+            technique="MS",
+            column_names=column_names,
+            n_header_lines=MID_N_HEADER_LINES,
+            estimate_rows=estimate_rows,
+        )
+
 
 class PVMassSpecScanReader:
-    """A reader for mass spectra files exported from PVMassSpec ('... - Scan.dat')"""
+    """A reader for mass spectra files exported from PVMassSpec ('... - Scan.dat')
+
+    A scan file has the same header as an MID file. After it, each row is one mass
+    scan, with a column per m/z value, named by the m/z value (like "28.00").
+
+    No scan file exported by PVMassSpec is in ixdat's test data, so the reader is
+    written for this layout, assumed from the MID ('- Bin.dat') files, and tested on
+    files made by development_scripts/make_pfeiffer_test_file.py:
+
+    - Tab-separated, with MID_N_HEADER_LINES non-blank header lines. Blank lines in
+      the header are skipped, as pandas does for an MID file.
+    - The third line holds the original file name, which ends with the start time
+      like "03-02-2021 12'58'40.dat". The timestamp is read from there.
+    - The last header line has the column names. It must include SCAN_T_STR, the
+      time of each scan in seconds since the start. Columns whose names are numbers
+      are the m/z values, in any order, and other columns (like the absolute times)
+      are ignored.
+    - Then there is a row per scan, with every value of every m/z column filled.
+
+    A file that differs from this layout may not be read correctly, so check the
+    result of the first read of a real export against PVMassSpec.
+    """
+
+    def read(self, path_to_file, cls=None, name=None, **kwargs):
+        """Return a SpectrumSeries with all the mass scans in the PVMassSpec file
+
+        The data is parsed in one pass by pandas' C parser, and the m/z columns go
+        straight into one (scan) x (m/z) array, which is the data of the Field.
+
+        Args:
+            path_to_file (Path or str): a path to the file exported by PVMassSpec with
+                mass scans. This file is typically exported with a name that ends in
+                '- Scan.dat'. As for MID files, the timestamp is read from the file.
+            cls (Spectrum subclass): The class of which to return an object. Defaults
+                to SpectrumSeries. A Spectrum class which is not a SpectrumSeries can
+                only be used for a file with a single scan.
+            name (str): The name of the spectra. Defaults to Path(path_to_file).name
+            kwargs: key-word args are used to initiate the object via cls.as_dict()
+
+        Return cls: The spectrum series (or spectrum) object
+        """
+        self.path_to_file = Path(path_to_file)
+        name = name or self.path_to_file.name
+        cls = cls or SpectrumSeries
+        with open_file(self.path_to_file) as f:
+            tstamp, column_names, _ = self.process_header(f)
+            mass_columns = [
+                i for i, col in enumerate(column_names) if re.fullmatch(FLOAT_MATCH, col)
+            ]
+            t_column = column_names.index(SCAN_T_STR)
+            df = pd.read_csv(
+                f,
+                sep="\t",
+                header=None,
+                index_col=False,
+                usecols=[t_column] + mass_columns,
+                dtype=float,
+            )
+        x = np.array([float(column_names[i]) for i in mass_columns])
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        data = df.to_numpy()  # a view of pandas' column-major block of floats
+        columns = list(df.columns)
+        t = data[:, columns.index(t_column)].copy()
+        # Copy the m/z columns, sorted, into one row-major (scan) x (m/z) array:
+        y = np.empty((len(t), len(x)))
+        np.take(data, [columns.index(mass_columns[i]) for i in order], axis=1, out=y)
+
+        xseries = DataSeries(name="m/z", unit_name="", data=x)
+        if not issubclass(cls, SpectrumSeries):
+            if not len(t) == 1:
+                raise ReadError(
+                    f"{self.path_to_file} has {len(t)} scans. Read it as a "
+                    f"SpectrumSeries or use a single-scan file for a {cls.__name__}."
+                )
+            field = Field(
+                name="signal", unit_name="A", data=y[0], axes_series=[xseries]
+            )
+            tstamp = tstamp + t[0]
+        else:
+            tseries = TimeSeries(name=SCAN_T_STR, unit_name="s", data=t, tstamp=tstamp)
+            field = Field(
+                name="signal", unit_name="A", data=y, axes_series=[tseries, xseries]
+            )
+        spectrum_as_dict = {
+            "name": name,
+            "technique": "MS",
+            "tstamp": tstamp,
+            "field": field,
+            "reader": self,
+        }
+        spectrum_as_dict.update(kwargs)
+        return cls.from_dict(spectrum_as_dict)
+
+    def process_header(self, f):
+        """Read the header of the open file f. Return tstamp, column names, n lines
+
+        As for an MID file, the column names are on the MID_N_HEADER_LINES'th line,
+        not counting blank lines (as pandas doesn't in `PVMassSpecReader.read`).
+        """
+        tstamp = read_tstamp(f)
+        n_header_lines = n_non_blank_lines = 3
+        for line in f:
+            n_header_lines += 1
+            if line.strip():
+                n_non_blank_lines += 1
+                if n_non_blank_lines == MID_N_HEADER_LINES:
+                    break
+        else:
+            raise ReadError(f"{self.path_to_file} ends in its header")
+        column_names = [col.strip() for col in line.split("\t")]
+        return tstamp, column_names, n_header_lines
+
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the scan file, reading only its header
+
+        Args:
+            path_to_file (Path or str): a path to the file exported by PVMassSpec with
+                mass scans.
+            estimate_rows (bool): Whether to estimate the number of scans from the file
+                size
+
+        Returns dict: See `reading_tools.header_record`. The rows are the scans.
+        """
+        self.path_to_file = Path(path_to_file)
+        with open_file(self.path_to_file) as f:
+            tstamp, column_names, n_header_lines = self.process_header(f)
+        return header_record(
+            self.path_to_file,
+            tstamp=tstamp,
+            technique="MS",
+            column_names=column_names,
+            n_header_lines=n_header_lines,
+            estimate_rows=estimate_rows,
+        )
+
+
+def read_tstamp(f):
+    """Return the unix time of the PVMassSpec file open as f, reading its first lines
 
-    pass
+    The timestamp is in the original file name, on the third line of the header.
+    """
+    tstamp_line = [f.readline() for _ in range(3)][-1]
+    return timestamp_string_to_tstamp(
+        tstamp_line.split(".")[-2][-19:],  # last 19 characters before the last '.'
+        form="%m-%d-%Y %H'%M'%S",  # like "03-02-2021 12'58'40"
+    )
 
 
 def mass_from_column_name(mass):
@@ -0,0 +1,270 @@
+"""Module implementing a cache of parsed files, used by `Measurement.read(cache=True)`
+
+Each cached file is a folder in `CFG.read_cache_directory`, named by a hash of the
+reader, the absolute path, size, and modification time of the file (or files, for
+readers of data sets), the key-word arguments to the reader, and the `READ_SETTINGS`
+of CFG, which decide the dtypes and classes of the series read. It contains the
+measurement's metadata as JSON and the data of each DataSeries as a .npy file. A
+cache hit opens the .npy files memory-mapped, so nothing is parsed or copied until it
+is used. Editing the file changes its size or modification time and thus the hash,
+so a stale entry is never used. Instead it ends up removed, as the least recently
+used entries are removed whenever the cache is bigger than `CFG.read_cache_max_size`.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import shutil
+from pathlib import Path
+import numpy as np
+from ..config import CFG
+from ..data_series import (
+    DataSeries,
+    TimeSeries,
+    UniformTimeSeries,
+    ValueSeries,
+    RLEValueSeries,
+    Field,
+    ConstantValue,
+)
+
+SERIES_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        DataSeries,
+        TimeSeries,
+        UniformTimeSeries,
+        ValueSeries,
+        RLEValueSeries,
+        Field,
+        ConstantValue,
+    )
+}
+PARAMETRIC_SERIES_CLASSES = (ConstantValue, UniformTimeSeries)  # no .npy needed
+METADATA_FILE_NAME = "measurement.json"
+READ_SETTINGS = (  # the attributes of CFG which change what Measurement.read returns
+    "compact_integers",
+    "value_dtype",
+    "column_dtypes",
+    "uniform_time_tolerance",
+    "run_length_encoding_ratio",
+    "intern_time_series",
+)
+
+
+def read_with_cache(cls, path_to_file, reader, **kwargs):
+    """Return the measurement from the read cache, reading the file if not cached
+
+    Args:
+        cls (Measurement class): The class to read with, as in `cls.read()`
+        path_to_file (Path or str): The path to the file to read
+        reader (str or Reader class): The (name of the) reader to read the file with.
+        kwargs: key-word arguments are passed on to the reader's read() method.
+    """
+    path_to_file = Path(path_to_file).resolve()
+    cache_directory = CFG.read_cache_directory
+    entry = cache_directory / get_cache_key(cls, path_to_file, reader, kwargs)
+    if (entry / METADATA_FILE_NAME).exists():
+        os.utime(entry / METADATA_FILE_NAME)  # marks the entry as recently used
+        return load_measurement(entry)
+
+    measurement = cls.read(path_to_file, reader=reader, **kwargs)
+    try:
+        save_measurement(measurement, entry)
+    except (TypeError, ValueError) as e:
+        print(f"Could not cache {measurement} read from {path_to_file}: {e}")
+        return measurement
+    remove_least_recently_used(cache_directory, keep=entry)
+    return measurement
+
+
+def get_cache_key(cls, path_to_file, reader, kwargs):
+    """Return a hash (str) identifying the reading of a file and its state on disk"""
+    if isinstance(reader, str):
+        reader_name = reader
+    else:
+        reader_class = reader if isinstance(reader, type) else type(reader)
+        reader_name = f"{reader_class.__module__}.{reader_class.__qualname__}"
+    key_items = [
+        reader_name,
+        f"{cls.__module__}.{cls.__qualname__}",
+        str(path_to_file),
+        repr(sorted(kwargs.items())),
+        repr([getattr(CFG, setting) for setting in READ_SETTINGS]),
+    ]
+    for path in get_files_read(path_to_file):
+        stat = path.stat()
+        key_items += [str(path), stat.st_size, stat.st_mtime_ns]
+    return hashlib.sha256(json.dumps(key_items).encode()).hexdigest()[:32]
+
+
+def get_files_read(path_to_file):
+    """Return a sorted list of the files which may be read when reading path_to_file
+
+    This is just path_to_file for most readers. Some readers, though, read all the
+    files in a folder (like "zilien_tmp") or all the files in the folder starting
+    with the name of path_to_file (like "ivium").
+    """
+    if path_to_file.is_file():
+        return [path_to_file]
+    if path_to_file.is_dir():
+        return sorted(p for p in path_to_file.rglob("*") if p.is_file())
+    return sorted(
+        p
+        for p in path_to_file.parent.iterdir()
+        if p.name.startswith(path_to_file.name) and p.is_file()
+    )
+
+
+def save_measurement(measurement, entry):
+    """Save the measurement as JSON metadata and .npy data in the folder `entry`
+
+    The folder is written under a temporary name and then renamed, so that a
+    half-written entry is never read. If another process has meanwhile saved the
+    entry, its entry is kept and this one is removed.
+    """
+    temp_entry = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    temp_entry.mkdir(parents=True, exist_ok=True)
+    try:
+        series_dicts = []
+        series_numbers = {}  # {id(series): number in series_dicts}
+        measurement_dict = measurement_to_dict(
+            measurement, series_dicts, series_numbers, temp_entry
+        )
+        metadata = {"measurement": measurement_dict, "series": series_dicts}
+        with open(temp_entry / METADATA_FILE_NAME, "w") as f:
+            json.dump(metadata, f, default=numpy_to_json)
+        try:
+            temp_entry.rename(entry)
+        except OSError:
+            if not (entry / METADATA_FILE_NAME).exists():
+                raise
+    finally:
+        if temp_entry.exists():
+            shutil.rmtree(temp_entry)
+
+
+def measurement_to_dict(measurement, series_dicts, series_numbers, entry):
+    """Return a serialization of measurement, adding its DataSeries to series_dicts"""
+    measurement_dict = measurement.as_dict()
+    del measurement_dict["s_ids"], measurement_dict["m_ids"]
+    measurement_cls = type(measurement)
+    measurement_dict["class"] = (
+        f"{measurement_cls.__module__}.{measurement_cls.__qualname__}"
+    )
+    measurement_dict["series_list"] = [
+        series_to_number(s, series_dicts, series_numbers, entry)
+        for s in measurement.series_list
+    ]
+    measurement_dict["component_measurements"] = [
+        measurement_to_dict(m, series_dicts, series_numbers, entry)
+        for m in measurement.component_measurements
+        if m is not measurement  # a pure measurement is its own component.
+    ]
+    return measurement_dict
+
+
+def series_to_number(series, series_dicts, series_numbers, entry):
+    """Return the number of series in series_dicts, adding it and its data if needed
+
+    The series that a series depends on (like a ValueSeries' TimeSeries) are added
+    first, so that they are built first when loading.
+    """
+    if id(series) in series_numbers:
+        return series_numbers[id(series)]
+    series_dict = {
+        "class": type(series).__name__,
+        "name": series.name,
+        "unit_name": series.unit_name,
+    }
+    if isinstance(series, TimeSeries):
+        series_dict["tstamp"] = series.tstamp
+        if isinstance(series, UniformTimeSeries):
+            series_dict.update(t_start=series.t_start, t_step=series.t_step, n=series.n)
+    elif isinstance(series, ValueSeries):
+        series_dict["tseries"] = series_to_number(
+            series.tseries, series_dicts, series_numbers, entry
+        )
+    elif isinstance(series, Field):
+        series_dict["axes_series"] = [
+            series_to_number(a, series_dicts, series_numbers, entry)
+            for a in series.axes_series
+        ]
+    elif isinstance(series, ConstantValue):
+        series_dict["value"] = series.value
+    number = len(series_dicts)
+    if isinstance(series, RLEValueSeries):
+        np.save(entry / f"{number}.npy", series.runs, allow_pickle=False)
+    elif not isinstance(series, PARAMETRIC_SERIES_CLASSES):
+        np.save(entry / f"{number}.npy", series.data, allow_pickle=False)
+    series_dicts.append(series_dict)
+    series_numbers[id(series)] = number
+    return number
+
+
+def load_measurement(entry):
+    """Return the measurement saved in the folder `entry`, with memory-mapped data"""
+    with open(entry / METADATA_FILE_NAME, "r") as f:
+        metadata = json.load(f)
+    series_list = []
+    for number, series_dict in enumerate(metadata["series"]):
+        series_cls = SERIES_CLASSES[series_dict.pop("class")]
+        if "tseries" in series_dict:
+            series_dict["tseries"] = series_list[series_dict["tseries"]]
+        if "axes_series" in series_dict:
+            series_dict["axes_series"] = [
+                series_list[i] for i in series_dict["axes_series"]
+            ]
+        if series_cls is RLEValueSeries:
+            series_dict["runs"] = np.load(entry / f"{number}.npy", mmap_mode="r")
+        elif series_cls not in PARAMETRIC_SERIES_CLASSES:
+            series_dict["data"] = np.load(entry / f"{number}.npy", mmap_mode="r")
+        series_list.append(series_cls(**series_dict))
+    return measurement_from_dict(metadata["measurement"], series_list)
+
+
+def measurement_from_dict(measurement_dict, series_list):
+    """Return the measurement serialized by `measurement_to_dict`"""
+    module_name, _, class_name = measurement_dict.pop("class").rpartition(".")
+    measurement_cls = getattr(importlib.import_module(module_name), class_name)
+    measurement_dict["series_list"] = [
+        series_list[i] for i in measurement_dict["series_list"]
+    ]
+    measurement_dict["component_measurements"] = [
+        measurement_from_dict(m_dict, series_list)
+        for m_dict in measurement_dict["component_measurements"]
+    ] or None
+    return measurement_cls.from_dict(measurement_dict)
+
+
+def remove_least_recently_used(cache_directory, keep=None):
+    """Remove the least recently used entries until the cache is small enough
+
+    Args:
+        cache_directory (Path): The folder with the cache entries
+        keep (Path): An entry not to remove, i.e. the one just added
+    """
+    entries = []
+    total_size = 0
+    for entry in cache_directory.iterdir():
+        metadata_file = entry / METADATA_FILE_NAME
+        if not metadata_file.exists():
+            continue  # it's being written by another process
+        size = sum(f.stat().st_size for f in entry.iterdir())
+        entries.append((metadata_file.stat().st_mtime, size, entry))
+        total_size += size
+    for last_used, size, entry in sorted(entries):
+        if total_size <= CFG.read_cache_max_size:
+            break
+        if entry == keep:
+            continue
+        shutil.rmtree(entry, ignore_errors=True)
+        total_size -= size
+
+
+def numpy_to_json(obj):
+    """Convert numpy scalars and arrays, which json can't handle, to python types"""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -1,8 +1,16 @@
 """Module with possibly general-use tools for readers"""
 
+import bz2
+import gzip
+import io
+import lzma
 from pathlib import Path
+import re
+import struct
 import time
 import urllib.request
+import zipfile
+import numpy as np
 from ..config import CFG
 from ..exceptions import ReadError
 from ..measurements import TimeSeries, ValueSeries
@@ -13,6 +21,167 @@ USA_TIMESTAMP_FORM = "%m/%d/%Y %H:%M:%S"  # like '12/31/2020 23:59:59'
 FLOAT_MATCH = "[-]?\\d+[\\.]?\\d*(?:e[-]?\\d+)?"  # matches floats like '5' or '-2.3e5'
 
 
+# {suffix: function opening a file so compressed}, see `open_file`:
+DECOMPRESSORS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+COMPRESSED_SUFFIXES = tuple(DECOMPRESSORS) + (".zip",)
+
+# The number of bytes read from the start of a file to detect which reader it needs:
+SNIFF_SIZE = 4096
+# {reader name: regular expression matching the start of its files}, in order of trial.
+# The ^'s match at the start of any line, and \A only at the start of the file.
+READER_SIGNATURES = {
+    "ixdat": r"^N_header_lines = [0-9]+$",
+    "biologic": r"\AEC-Lab ASCII FILE|^Nb header lines : ",
+    "zilien": r"^data_start\t",
+    "zilien_spec": r"^Mass scan started at \[s\]",
+    "cinfdata": r"^Recorded at\t",
+    "pfeiffer": r"^Time Absolute \(UTC\)\t.*\t[0-9.]+_amu",
+    "pfeiffer_scan": (
+        r"^Time Absolute \(UTC\)\t.*\tTime Relative \(sec\)\t[0-9.]+\t"
+    ),
+    "ivium": r"\A[0-9]{2}/[0-9]{2}/[0-9]{4} [0-9:]{8}\s*\n\s*time/s ",
+    "autolab": r"\A[^\n]*;WE\([0-9]+\)\.",
+}
+
+
+def open_file(path_to_file, mode="r", encoding=None):
+    """Open a file for reading, decompressing it on the fly if it is compressed
+
+    Files ending in .gz, .bz2, or .xz are decompressed as they are read, as is the
+    single file in a .zip archive. Nothing is decompressed to disk or all at once, so
+    the readers can hand the returned file straight to pandas' parser.
+
+    Args:
+        path_to_file (Path or str): The file, possibly compressed
+        mode (str): "r" to read text or "rb" to read bytes
+        encoding (str): The encoding of the text. Not used with mode="rb".
+
+    Returns file: An open file object, to be used with a `with` statement
+    """
+    path_to_file = Path(path_to_file)
+    suffix = path_to_file.suffix.lower()
+    if suffix == ".zip":
+        f = open_zip_member(path_to_file)
+        return f if "b" in mode else io.TextIOWrapper(f, encoding=encoding)
+    if suffix in DECOMPRESSORS:
+        if "b" in mode:
+            return DECOMPRESSORS[suffix](path_to_file, "rb")
+        return DECOMPRESSORS[suffix](path_to_file, "rt", encoding=encoding)
+    return open(path_to_file, mode, encoding=encoding)
+
+
+def is_compressed(path_to_file):
+    """Return whether path_to_file is a compressed file which `open_file` decompresses"""
+    return Path(path_to_file).suffix.lower() in COMPRESSED_SUFFIXES
+
+
+def open_zip_member(path_to_file):
+    """Return the single file in the zip archive path_to_file opened for reading"""
+    with zipfile.ZipFile(path_to_file) as zip_file:
+        members = [info for info in zip_file.infolist() if not info.is_dir()]
+        if len(members) != 1:
+            raise ReadError(
+                f"{path_to_file} has {len(members)} files. ixdat can only read zip "
+                "archives with exactly one file."
+            )
+        # The opened member keeps the archive file open after zip_file is closed.
+        return zip_file.open(members[0])
+
+
+def get_uncompressed_size(path_to_file):
+    """Return the size in bytes of the contents of a (possibly compressed) file
+
+    The size of a .gz file's contents is read from its last four bytes, which gives
+    the size modulo 4 GiB and only of its last member (fine for an estimate). The size
+    is not stored in a .bz2 or .xz file, so for those None is returned.
+    """
+    path_to_file = Path(path_to_file)
+    suffix = path_to_file.suffix.lower()
+    if suffix == ".zip":
+        with zipfile.ZipFile(path_to_file) as zip_file:
+            return sum(info.file_size for info in zip_file.infolist())
+    if suffix == ".gz":
+        with open(path_to_file, "rb") as f:
+            f.seek(-4, 2)
+            return struct.unpack("<I", f.read(4))[0]
+    if suffix in DECOMPRESSORS:
+        return None
+    return path_to_file.stat().st_size
+
+
+def sniff_reader_name(path_to_file):
+    """Return the name in READER_CLASSES of the reader for a file, from its first bytes
+
+    Only the first SNIFF_SIZE bytes of the file are read. These are checked for the
+    binary signature of .mpr files and pickles, and then for the text signatures in
+    READER_SIGNATURES. A folder is sniffed by its files, and a path that does not
+    exist can be the base name of an ivium dataset.
+
+    Args:
+        path_to_file (Path or str): The file (or folder) to find a reader for
+
+    Raises ReadError: if the file is not recognized
+    """
+    path_to_file = Path(path_to_file)
+    if path_to_file.is_dir():
+        for path in path_to_file.iterdir():
+            if re.search(r"\.[^\.]+\.data", path.name):
+                return "zilien_tmp"
+            if ".tsv" in path.suffixes and sniff_reader_name(path) == "zilien_spec":
+                return "zilien_spectra"
+            break
+        raise ReadError(f"Could not detect which reader to read folder {path_to_file}")
+    if not path_to_file.exists():
+        if path_to_file.parent.is_dir() and any(
+            path.name.startswith(path_to_file.name + "_")
+            and sniff_reader_name(path) == "ivium"
+            for path in path_to_file.parent.iterdir()
+        ):
+            return "ivium"
+        raise ReadError(f"{path_to_file} does not exist")
+
+    with open_file(path_to_file, "rb") as f:
+        start = f.read(SNIFF_SIZE)
+    if start.startswith(b"BIO-LOGIC MODULAR FILE"):
+        return "mpr"
+    if start.startswith(b"\x80"):  # the first byte of a pickle, as from EC_MS
+        return "EC_MS"
+    text = start.decode("ISO-8859-1").replace("\r\n", "\n")
+    for reader_name, signature in READER_SIGNATURES.items():
+        if re.search(signature, text, flags=re.MULTILINE):
+            return reader_name
+    raise ReadError(
+        f"Could not detect which reader to read {path_to_file} with. Please specify "
+        "the reader, e.g. `reader='biologic'`."
+    )
+
+
+def grow_buffer(buffers, key, n_before, new_values):
+    """Put new_values after the first n_before values in buffers[key]
+
+    This is for data which arrives a bit at a time, like that read by the readers'
+    follow() methods. The buffer is replaced by one twice the needed size whenever it
+    is too small, so that the copying is proportional to the data overall.
+
+    Args:
+        buffers (dict of np.array): The buffers, which buffers[key] is put in if new
+        key (str): The key of the buffer in buffers, e.g. the name of a column
+        n_before (int): The number of values in the buffer to keep
+        new_values (np.array): The values to put after them
+
+    Returns np.array: A view of the data in the buffer, i.e. its first
+        `n_before + len(new_values)` values.
+    """
+    buffer = buffers.get(key, np.array([]))
+    N = n_before + len(new_values)
+    if N > len(buffer):
+        new_buffer = np.empty(max(2 * N, 1024))
+        new_buffer[:n_before] = buffer[:n_before]
+        buffer = buffers[key] = new_buffer
+    buffer[n_before:N] = new_values
+    return buffer[:N]
+
+
 def timestamp_string_to_tstamp(
     timestamp_string, form=None, forms=(STANDARD_TIMESTAMP_FORM,),
 ):
@@ -86,6 +255,76 @@ def prompt_for_tstamp(path_to_file, default="creation", form=STANDARD_TIMESTAMP_
     return tstamp or default_tstamp
 
 
+def header_record(
+    path_to_file,
+    tstamp,
+    technique,
+    column_names,
+    n_header_lines=None,
+    n_rows=None,
+    estimate_rows=True,
+    **kwargs,
+):
+    """Return the dict describing a data file returned by the readers' read_header()
+
+    Args:
+        path_to_file (Path or str): The file (or folder) described
+        tstamp (float): The unix time of the measurement's t=0, if known, else None
+        technique (str): The measurement technique
+        column_names (list of str): The names of the data columns or series
+        n_header_lines (int): The number of lines before the data, including the
+            column name line(s). Used to estimate n_rows, if it isn't given.
+        n_rows (int): The number of rows (data points or spectra), if known
+        estimate_rows (bool): Whether to estimate n_rows if it isn't given. See
+            `estimate_n_rows`.
+        kwargs: Any other reader-specific information to include in the record
+
+    Returns dict: With the keys "path_to_file", "tstamp", "technique",
+        "column_names", "n_rows", and "n_rows_is_estimate", and those in kwargs.
+    """
+    n_rows_is_estimate = False
+    if n_rows is None and estimate_rows and n_header_lines is not None:
+        n_rows, n_rows_is_estimate = estimate_n_rows(path_to_file, n_header_lines)
+    record = {
+        "path_to_file": str(path_to_file),
+        "tstamp": tstamp,
+        "technique": technique,
+        "column_names": list(column_names),
+        "n_rows": n_rows,
+        "n_rows_is_estimate": n_rows_is_estimate,
+    }
+    record.update(kwargs)
+    return record
+
+
+def estimate_n_rows(path_to_file, n_header_lines, sample_size=2 ** 16):
+    """Return (n_rows, is_estimate) for the data lines after the header of a text file
+
+    Only up to sample_size bytes after the header are read. If that is the rest of
+    the file, its lines are counted. Otherwise the number of lines is extrapolated from
+    the sample to the size of the file, which is that of the decompressed contents
+    for a compressed file. If that size isn't known (.bz2 and .xz), n_rows is None.
+
+    Args:
+        path_to_file (Path or str): The text file
+        n_header_lines (int): The number of lines before the data
+        sample_size (int): The number of bytes of data to read
+    """
+    with open_file(path_to_file, "rb") as f:
+        for _ in range(n_header_lines):
+            f.readline()
+        n_header_bytes = f.tell()
+        sample = f.read(sample_size)
+        is_estimate = bool(f.read(1))
+    n_lines = sample.count(b"\n") + bool(sample and not sample.endswith(b"\n"))
+    if not is_estimate:
+        return n_lines, False
+    size = get_uncompressed_size(path_to_file)
+    if size is None:
+        return None, True
+    return round(n_lines * (size - n_header_bytes) / len(sample)), True
+
+
 def series_list_from_dataframe(dataframe, t_str, tstamp, unit_finding_function):
     """Return a list of DataSeries with the data in a pandas dataframe.
 
@@ -1,37 +1,394 @@
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import io
 import re
 import pandas as pd
 import numpy as np
 from ..data_series import DataSeries, TimeSeries, ValueSeries, Field
 from ..techniques.ec_ms import ECMSMeasurement
 from ..techniques.ms import MSSpectrum
-from .reading_tools import timestamp_string_to_tstamp, FLOAT_MATCH
-from .ec_ms_pkl import measurement_from_ec_ms_dataset
+from ..spectra import SpectrumSeries
+from ..exceptions import ReadError
+from .chunked import ChunkWriter
+from .reading_tools import (
+    timestamp_string_to_tstamp,
+    header_record,
+    estimate_n_rows,
+    open_file,
+    grow_buffer,
+    FLOAT_MATCH,
+)
 
 ZILIEN_TIMESTAMP_FORM = "%Y-%m-%d %H_%M_%S"  # like 2021-03-15 18_50_10
+# The non-blank lines before the column header line of a mass scan:
+ZILIEN_SPECTRUM_N_HEADER_LINES = 9
+ZILIEN_EC_COLUMNS = {  # {start of column header: (ixdat name, unit)} for "pot" data
+    "Time": ("time/s", "s"),
+    "Voltage": ("Ewe/V", "V"),
+    "Current": ("I/mA", "mA"),
+    "Cycle": ("cycle number", None),
+}
 
 
 class ZilienTSVReader:
-    """Class for reading files saved by Spectro Inlets' Zilien software"""
+    """Class for reading files saved by Spectro Inlets' Zilien software
 
-    def read(self, path_to_file, cls=None, name=None, **kwargs):
-        """Read a zilien file
+    A Zilien .tsv file has a header of tab-separated metadata lines, one of which,
+    "data_start", gives the number of lines before the data. The last two lines of the
+    header are the series headers, naming the group of each column (like "C0M2" for a
+    mass channel or "pot" for the potentiostat, written only above a group's first
+    column), and the column headers (like "Time [s]"). Each group starts with its own
+    time column. Groups with less data than others are padded with empty cells.
 
-        TODO: This is a hack using EC_MS to read the .tsv. Will be replaced.
+    Attributes:
+        path_to_file (Path): The path to the file read
+        metadata (dict): The metadata items of the header, as {key: value}
+        series_headers (list of str): The group of each column
+        column_headers (list of str): The header of each column
+        column_data (dict of str: np.array): The data of each column, by its name in
+            ixdat. See `get_zilien_series_name`
+        chunk_writer (ChunkWriter): Parses the data a chunk at a time when reading with
+            a `chunk_size`, and is None otherwise.
+        n_bytes_read (int): The number of bytes read by follow()
+        n_rows (int): The number of data lines read by follow()
+        buffers (dict of int: np.array): The arrays with room to spare, of which
+            column_data are views, by column number, when the file is read by follow()
+        n_values (dict of int: int): The length of each column read by follow(), i.e.
+            without the empty cells after its last value
+        measurement (Measurement): The measurement made by follow(), else None
+    """
+
+    def __init__(self):
+        """Initialize a Reader for Zilien .tsv files. See class docstring."""
+        self.name = None
+        self.path_to_file = None
+        self.measurement_class = None
+        self.metadata = {}
+        self.series_headers = []
+        self.column_headers = []
+        self.column_data = {}
+        self.chunk_writer = None
+        self.n_bytes_read = 0
+        self.n_rows = 0
+        self.buffers = {}
+        self.n_values = {}
+        self.measurement = None
+
+    def read(
+        self, path_to_file, cls=None, name=None, chunk_size=None, backend=None, **kwargs
+    ):
+        """Return an ECMSMeasurement with the data and metadata in a Zilien .tsv file
+
+        The header is read line by line. The data block is then parsed by pandas' C
+        parser in one pass, and each column, trimmed of its padding, becomes a
+        TimeSeries or a ValueSeries of its group's TimeSeries. Mass channels are named
+        like "M2" with time "M2-x", and the potentiostat data like "Ewe/V" and "I/mA"
+        with time "time/s", as in the legacy EC_MS package.
+
+        Args:
+            path_to_file (Path or str): The path to the .tsv file
+            cls (Measurement class): Defaults to ECMSMeasurement
+            name (str): The name to use if not the file name
+            chunk_size (int): If given, the data is parsed this many rows at a time
+                into files in `backend`, and the DataSeries get it memory-mapped from
+                there. This is for files too big for memory. `Measurement.read` then
+                saves the series there, see `readers.chunked`.
+            backend (DirBackend): The backend to put the data in when reading in
+                chunks. Defaults to the database's backend.
+            kwargs: key-word arguments are passed on to cls.__init__
         """
+        self.path_to_file = Path(path_to_file)
         cls = cls or ECMSMeasurement
-        from EC_MS import Zilien_Dataset
-
-        ec_ms_dataset = Zilien_Dataset(path_to_file)
-        return measurement_from_ec_ms_dataset(
-            ec_ms_dataset.data,
-            cls=cls,
-            name=name,
-            reader=self,
+        name = name or self.path_to_file.name
+        tstamp = self.get_tstamp()
+        if chunk_size:
+            self.chunk_writer = ChunkWriter(chunk_size, backend=backend)
+        with open_file(self.path_to_file, "r", encoding="ISO-8859-1") as f:
+            self.process_header(f)
+            series_list = self.process_data_block(f, tstamp)
+
+        obj_as_dict = {
+            "name": name,
+            "technique": "EC-MS",
+            "tstamp": tstamp,
+            "series_list": series_list,
+            "metadata": self.metadata,
+            "reader": self,
+        }
+        obj_as_dict.update(kwargs)
+        return cls.from_dict(obj_as_dict)
+
+    def read_header(self, path_to_file, estimate_rows=True):
+        """Return a record of the metadata of the .tsv file, reading only its header
+
+        Args:
+            path_to_file (Path or str): The path to the .tsv file
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                size. The columns have different lengths, so this is of the longest.
+
+        Returns dict: See `reading_tools.header_record`. The column names are those
+            of the series in the measurement read by read(). Also has "metadata".
+        """
+        self.path_to_file = Path(path_to_file)
+        tstamp = self.get_tstamp()
+        with open_file(self.path_to_file, "r", encoding="ISO-8859-1") as f:
+            self.process_header(f)
+        column_names = [
+            get_zilien_series_name(group, header)[0]
+            for group, header in zip(self.series_headers, self.column_headers)
+        ]
+        return header_record(
+            self.path_to_file,
+            tstamp=tstamp,
             technique="EC-MS",
-            **kwargs,
+            column_names=column_names,
+            n_header_lines=int(self.metadata["data_start"]),
+            estimate_rows=estimate_rows,
+            metadata=self.metadata,
+        )
+
+    def follow(self, path_to_file=None, cls=None, name=None, **kwargs):
+        """Return the ECMSMeasurement, updated with the lines added to the file since
+
+        This is for files which are still being written, e.g. during a long experiment.
+        The first call reads the file like `read()`. Each later call reads on from
+        where the last one stopped, and appends the new data to the DataSeries of the
+        same measurement in place. Only complete lines are read, so a line which is
+        still being written is left for the next call.
+        The data is kept in buffers with room to spare, which are doubled in size
+        when full, so that the cost of a call is proportional to the new data. A
+        group's empty cells are only cut off while they are after all its values, so
+        the ValueSeries of a group get the length of its time column.
+        Series built from the data, like "selector", are removed from the measurement
+        so that they are rebuilt when needed. See `ECMeasurement.clear_cache`.
+
+        Args:
+            path_to_file (Path or str): The path to the .tsv file. Only needed for the
+                first call.
+            cls (Measurement class): Defaults to ECMSMeasurement
+            name (str): The name to use if not the file name
+            kwargs: key-word arguments are passed on to cls.__init__
+
+        Returns ECMSMeasurement: The measurement, or None if the file does not yet
+            have a complete header.
+        """
+        if self.column_data and not self.n_bytes_read:
+            raise ReadError(
+                f"{self} read its file with read(). Use a new Reader to follow it."
+            )
+        if not self.n_bytes_read:
+            self.path_to_file = Path(path_to_file or self.path_to_file)
+            self.name = name or self.name or self.path_to_file.name
+            self.measurement_class = cls or self.measurement_class or ECMSMeasurement
+
+        with open_file(self.path_to_file, "rb") as f:
+            f.seek(self.n_bytes_read)
+            new_bytes = f.read()
+        new_bytes = new_bytes[: new_bytes.rfind(b"\n") + 1]  # only complete lines
+        new_lines = iter(new_bytes.decode("ISO-8859-1").splitlines(keepends=True))
+        if not self.n_bytes_read:
+            try:
+                self.process_header(new_lines)
+            except ReadError:
+                self.metadata, self.series_headers = {}, []
+                return None  # The header isn't all written yet.
+        self.n_bytes_read += len(new_bytes)
+        new_columns = self.parse_data_block(io.StringIO("".join(new_lines)))
+
+        n_before = self.n_rows
+        self.n_rows += len(new_columns[0]) if new_columns else 0
+        group_length = 0
+        for i, (group, header, new_values) in enumerate(
+            zip(self.series_headers, self.column_headers, new_columns)
+        ):
+            data = grow_buffer(self.buffers, i, n_before, new_values)
+            if header.startswith("Time"):
+                is_value = ~np.isnan(new_values)
+                if is_value.any():
+                    self.n_values[i] = self.n_rows - np.argmax(is_value[::-1])
+                group_length = self.n_values.get(i, 0)
+            name, _ = get_zilien_series_name(group, header)
+            self.column_data[name] = data[:group_length]
+
+        if self.measurement is None:
+            tstamp = self.get_tstamp()
+            series_list = self.build_series_list(
+                list(self.column_data.values()), tstamp
+            )
+            obj_as_dict = {
+                "name": self.name,
+                "technique": "EC-MS",
+                "tstamp": tstamp,
+                "series_list": series_list,
+                "metadata": self.metadata,
+                "reader": self,
+            }
+            obj_as_dict.update(kwargs)
+            self.measurement = self.measurement_class.from_dict(obj_as_dict)
+            return self.measurement
+
+        # The DataSeries get the new views of the buffers:
+        for series in self.measurement.series_list:
+            if series.name in self.column_data:
+                series._data = self.column_data[series.name]
+                series._uid = None  # as the data has changed.
+        # Series built from the data, like "selector", are now too short:
+        self.measurement.clear_cache(self.column_data)
+        return self.measurement
+
+    def get_tstamp(self):
+        """Return the tstamp from the file name, or the file's modification time"""
+        try:
+            timestamp_string = self.path_to_file.name[:19]  # like 2021-02-01 17_44_12
+            return timestamp_string_to_tstamp(
+                timestamp_string, form=ZILIEN_TIMESTAMP_FORM
+            )
+        except ReadError:
+            print(
+                f"Could not find a Zilien timestamp in the name of {self.path_to_file}."
+                " Using the file's modification time."
+            )
+            return self.path_to_file.stat().st_mtime
+
+    def process_header(self, f):
+        """Read the header lines of the open file f, leaving it at the data block"""
+        n_header_lines = None
+        for n_line, line in enumerate(f):
+            if n_header_lines and n_line == n_header_lines - 2:
+                self.series_headers = fill_forward(line.rstrip("\r\n").split("\t"))
+            elif n_header_lines and n_line == n_header_lines - 1:
+                self.column_headers = [
+                    header.strip() for header in line.rstrip("\r\n").split("\t")
+                ]
+                return
+            else:
+                items = [item.strip() for item in line.split("\t") if item.strip()]
+                if not items:
+                    continue
+                key, value = items[0], items[-1]
+                self.metadata[key] = value
+                if key == "data_start":
+                    n_header_lines = int(value)
+        raise ReadError(
+            f"{self} did not find the column headers of {self.path_to_file}. "
+            "Is it a Zilien .tsv file?"
         )
 
+    def process_data_block(self, f, tstamp):
+        """Return the list of DataSeries with the data in the rest of the open file f
+
+        Args:
+            f (file): The file, after `process_header` has read its header. It is
+                handed to pandas as is, so the data is parsed as it is read. With a
+                chunk_writer, the columns are written to disk a chunk at a time.
+            tstamp (float): The unix time that the file's time columns are relative to
+        """
+        n_columns = len(self.column_headers)
+        if self.chunk_writer:
+            columns = self.chunk_writer.read_columns(
+                f, n_columns, trim="trailing_nans", sep="\t"
+            )
+        else:
+            columns = []
+            for values in self.parse_data_block(f):
+                is_value = ~np.isnan(values)
+                N = len(values) - np.argmax(is_value[::-1]) if is_value.any() else 0
+                columns.append(values[:N])
+        return self.build_series_list(columns, tstamp)
+
+    def parse_data_block(self, f):
+        """Return the columns in the rest of the open file f, with their empty cells
+
+        Args:
+            f (file): The file, after `process_header` has read its header. It is
+                handed to pandas as is, so the data is parsed as it is read.
+
+        Returns list of np.array: The columns, with NaN for empty cells
+        """
+        n_columns = len(self.column_headers)
+        try:
+            df = pd.read_csv(
+                f,
+                sep="\t",
+                header=None,
+                index_col=False,
+                usecols=range(n_columns),
+                dtype=float,
+            )
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame(np.empty((0, n_columns)))
+        return [df[i].to_numpy() for i in range(n_columns)]
+
+    def build_series_list(self, columns, tstamp):
+        """Return the DataSeries with the columns' data, putting it in column_data
+
+        Args:
+            columns (list of np.array): The data of each column, without padding
+            tstamp (float): The unix time that the file's time columns are relative to
+        """
+        series_list = []
+        tseries = None
+        last_group = None
+        for group, header, values in zip(
+            self.series_headers, self.column_headers, columns
+        ):
+            name, unit = get_zilien_series_name(group, header)
+            self.column_data[name] = values
+            if header.startswith("Time"):
+                tseries = TimeSeries(
+                    name=name, unit_name=unit, data=values, tstamp=tstamp
+                )
+                series_list.append(tseries)
+            elif group != last_group or tseries is None:
+                print(f"Not including '{group} - {header}' as it has no time column.")
+                continue
+            elif not len(values) == len(tseries.data):
+                print(f"Not including '{name}' due to mismatch size with {tseries}")
+            else:
+                series_list.append(
+                    ValueSeries(name=name, unit_name=unit, data=values, tseries=tseries)
+                )
+            last_group = group
+        return series_list
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path_to_file})"
+
+
+def fill_forward(series_headers):
+    """Return the series headers with the blanks filled by the last one before them"""
+    filled_headers = []
+    for header in series_headers:
+        header = header.strip()
+        filled_headers.append(header or (filled_headers[-1] if filled_headers else ""))
+    return filled_headers
+
+
+def get_zilien_series_name(group, header):
+    """Return the ixdat name and unit of the Zilien column with group and header
+
+    These are the names given by the legacy EC_MS package, so that e.g. mass
+    channels are "M<x>" and EC data have the names ECMeasurement looks for.
+
+    Args:
+        group (str): The series header of the column, like "C0M2" or "pot"
+        header (str): The column header, like "Time [s]" or "Voltage [V]"
+    """
+    unit_match = re.search(r"\[(.*)\]", header)
+    unit = unit_match.group(1) if unit_match else None
+    mass_match = re.search("M[0-9]+", group)
+    if re.search("^C[0-9]+", group) and mass_match:
+        mass = mass_match.group()
+        if header.startswith("Time"):
+            return mass + "-x", "s"
+        return mass, "A"
+    if group.startswith("pot"):
+        for header_start, (name, ec_unit) in ZILIEN_EC_COLUMNS.items():
+            if header.startswith(header_start):
+                return name, ec_unit
+    return f"{group} - {header}", unit
+
 
 class ZilienTMPReader:
     """A class for stitching the files in a Zilien tmp directory to an ECMSMeasurement
@@ -43,24 +400,28 @@ class ZilienTMPReader:
     def __init__(self, path_to_tmp_dir=None):
         self.path_to_tmp_dir = Path(path_to_tmp_dir) if path_to_tmp_dir else None
 
-    def read(self, path_to_tmp_dir, cls=None, **kwargs):
+    def read(self, path_to_tmp_dir, cls=None, workers=None, **kwargs):
         """Make a measurement from all the single-value .tsv files in a Zilien tmp dir
 
+        The files are many and small, so they are parsed concurrently in a pool of
+        threads, in which pandas' C parser can run without holding the GIL.
+
         Args:
             path_to_tmp_dir (Path or str): the path to the tmp dir
             cls (Measurement class): Defaults to ECMSMeasurement
+            workers (int): The number of threads to parse the files in. Defaults to
+                that of `concurrent.futures.ThreadPoolExecutor`.
         """
         if path_to_tmp_dir:
             self.path_to_tmp_dir = Path(path_to_tmp_dir)
         cls = cls or ECMSMeasurement
         name = self.path_to_tmp_dir.parent.name
-        timestamp_string = name[:19]  # the zilien timestamp is the first 19 chars
-        tstamp = timestamp_string_to_tstamp(
-            timestamp_string, form=ZILIEN_TIMESTAMP_FORM
-        )
+        tstamp = self.get_tstamp()
+        tmp_files = sorted(self.path_to_tmp_dir.iterdir())
         series_list = []
-        for tmp_file in self.path_to_tmp_dir.iterdir():
-            series_list += series_list_from_tmp(tmp_file)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for tmp_series_list in pool.map(series_list_from_tmp, tmp_files):
+                series_list += tmp_series_list
         obj_as_dict = {
             "name": name,
             "tstamp": tstamp,
@@ -71,16 +432,51 @@ class ZilienTMPReader:
         obj_as_dict.update(kwargs)
         return cls.from_dict(obj_as_dict)
 
+    def get_tstamp(self):
+        """Return the tstamp from the name of the folder containing the tmp dir"""
+        timestamp_string = self.path_to_tmp_dir.parent.name[:19]  # the zilien timestamp
+        return timestamp_string_to_tstamp(timestamp_string, form=ZILIEN_TIMESTAMP_FORM)
 
-def series_list_from_tmp(path_to_file):
-    """Return [ValueSeries, TimeSeries] with the data in a zilien tmp .tsv file"""
-    file_name = Path(path_to_file).name
-    timestamp_string = file_name[:19]  # the zilien timestamp form is 19 chars long
-    tstamp = timestamp_string_to_tstamp(timestamp_string, form=ZILIEN_TIMESTAMP_FORM)
+    def read_header(self, path_to_tmp_dir, estimate_rows=True):
+        """Return a record of the metadata of a Zilien tmp dir, without reading data
+
+        Only the first line of each file is read, for estimating its number of rows.
+
+        Args:
+            path_to_tmp_dir (Path or str): the path to the tmp dir
+            estimate_rows (bool): Whether to estimate the number of rows from the file
+                sizes. This is the sum of the number of rows in the files.
+
+        Returns dict: See `reading_tools.header_record`
+        """
+        self.path_to_tmp_dir = Path(path_to_tmp_dir)
+        column_names = []
+        n_rows = 0 if estimate_rows else None
+        n_rows_is_estimate = False
+        for tmp_file in sorted(self.path_to_tmp_dir.iterdir()):
+            names = get_tmp_series_names(tmp_file.name)
+            if not names:
+                continue
+            column_names += names[:2]
+            if estimate_rows:
+                n_rows_in_file, is_estimate = estimate_n_rows(tmp_file, 1)
+                n_rows += n_rows_in_file
+                n_rows_is_estimate = n_rows_is_estimate or is_estimate
+        return header_record(
+            self.path_to_tmp_dir,
+            tstamp=self.get_tstamp(),
+            technique="EC-MS",
+            column_names=column_names,
+            n_rows=n_rows,
+            n_rows_is_estimate=n_rows_is_estimate,
+        )
+
+
+def get_tmp_series_names(file_name):
+    """Return (t_name, v_name, unit) of the series in a zilien tmp file, or None"""
     column_match = re.search(r"\.([^\.]+)\.data", file_name)
     if not column_match:
-        print(f"could not find column name in {path_to_file}")
-        return []
+        return None
     v_name = column_match.group(1)
     mass_match = re.search("M[0-9]+", v_name)
     if mass_match:
@@ -88,8 +484,21 @@ def series_list_from_tmp(path_to_file):
         unit = "A"
     else:
         unit = None
-    t_name = v_name + "-x"
-    df = pd.read_csv(path_to_file, delimiter="\t", names=[t_name, v_name], header=0)
+    return v_name + "-x", v_name, unit
+
+
+def series_list_from_tmp(path_to_file):
+    """Return [ValueSeries, TimeSeries] with the data in a zilien tmp .tsv file"""
+    file_name = Path(path_to_file).name
+    timestamp_string = file_name[:19]  # the zilien timestamp form is 19 chars long
+    tstamp = timestamp_string_to_tstamp(timestamp_string, form=ZILIEN_TIMESTAMP_FORM)
+    names = get_tmp_series_names(file_name)
+    if not names:
+        print(f"could not find column name in {path_to_file}")
+        return []
+    t_name, v_name, unit = names
+    with open_file(path_to_file) as f:
+        df = pd.read_csv(f, delimiter="\t", names=[t_name, v_name], header=0)
     t_data, v_data = df[t_name].to_numpy(), df[v_name].to_numpy()
     tseries = TimeSeries(name=t_name, unit_name="s", data=t_data, tstamp=tstamp)
     vseries = ValueSeries(name=v_name, unit_name=unit, data=v_data, tseries=tseries)
@@ -97,36 +506,25 @@ def series_list_from_tmp(path_to_file):
 
 
 class ZilienSpectrumReader:
-    """A reader for individual Zilien spectra
-    TODO: A Zilien reader which loads all spectra at once in a SpectrumSeries object
-    """
+    """A reader for individual Zilien spectra. See also ZilienSpectraReader"""
 
     def __init__(self, path_to_spectrum=None):
         self.path_to_spectrum = Path(path_to_spectrum) if path_to_spectrum else None
 
     def read(self, path_to_spectrum, cls=None, **kwargs):
-        """Make a measurement from all the single-value .tsv files in a Zilien tmp dir
+        """Make a spectrum from a Zilien mass scan .tsv file
         FIXME: This reader was written hastily and could be designed better.
 
         Args:
-            path_to_tmp_dir (Path or str): the path to the tmp dir
+            path_to_spectrum (Path or str): the path to the mass scan file
             cls (Spectrum class): Defaults to MSSpectrum
             kwargs: Key-word arguments are passed on ultimately to cls.__init__
         """
         if path_to_spectrum:
             self.path_to_spectrum = Path(path_to_spectrum)
         cls = cls or MSSpectrum
-        df = pd.read_csv(path_to_spectrum, header=9, delimiter="\t",)
-        x_name = "Mass  [AMU]"
-        y_name = "Current [A]"
-        x = df[x_name].to_numpy()
-        y = df[y_name].to_numpy()
-        with open(self.path_to_spectrum, "r") as f:
-            for i in range(10):
-                line = f.readline()
-                if "Mass scan started at [s]" in line:
-                    tstamp_match = re.search(FLOAT_MATCH, line)
-                    tstamp = float(tstamp_match.group())
+        tstamp, (x_name, y_name), data = read_zilien_spectrum(self.path_to_spectrum)
+        x, y = data[:, 0], data[:, 1]
         xseries = DataSeries(data=x, name=x_name, unit_name="m/z")
         tseries = TimeSeries(
             data=np.array([0]), name="spectrum time / [s]", unit_name="s", tstamp=tstamp
@@ -138,14 +536,231 @@ class ZilienSpectrumReader:
             axes_series=[xseries, tseries],
         )
         obj_as_dict = {
-            "name": path_to_spectrum.name,
+            "name": self.path_to_spectrum.name,
+            "technique": "MS",
+            "field": field,
+            "reader": self,
+        }
+        obj_as_dict.update(kwargs)
+        return cls.from_dict(obj_as_dict)
+
+    def read_header(self, path_to_spectrum, estimate_rows=True):
+        """Return a record of the metadata of a mass scan file, reading only its header
+
+        Args:
+            path_to_spectrum (Path or str): the path to the mass scan file
+            estimate_rows (bool): Whether to estimate the number of m/z values from the
+                file size
+
+        Returns dict: See `reading_tools.header_record`. The tstamp is the time the
+            scan started at, in the Zilien measurement, as for read().
+        """
+        self.path_to_spectrum = Path(path_to_spectrum)
+        with open_file(self.path_to_spectrum) as f:
+            t, column_names, n_header_lines = process_zilien_spectrum_header(f)
+        return header_record(
+            self.path_to_spectrum,
+            tstamp=t,
+            technique="MS",
+            column_names=column_names,
+            n_header_lines=n_header_lines,
+            estimate_rows=estimate_rows,
+        )
+
+
+class ZilienSpectraReader:
+    """A reader for a folder of Zilien spectra, loaded into one SpectrumSeries
+
+    Zilien saves each mass scan of a measurement as a .tsv file in a "mass scans"
+    folder. The spectra are read into one preallocated (time) x (m/z) Field, so the
+    files are parsed straight into their rows, concurrently in a pool of threads.
+    All the spectra must share the same m/z axis, which is checked by a hash of each
+    file's m/z data.
+    """
+
+    def __init__(self, path_to_dir=None):
+        self.path_to_dir = Path(path_to_dir) if path_to_dir else None
+
+    def read(
+        self, path_to_dir, cls=None, name=None, tstamp=None, workers=None, **kwargs
+    ):
+        """Make a SpectrumSeries from all the Zilien mass scan .tsv files in a folder
+
+        Args:
+            path_to_dir (Path or str): the path to the folder of mass scans
+            cls (SpectrumSeries class): Defaults to SpectrumSeries
+            name (str): The name to use if not the name of the folder
+            tstamp (float): The unix time of the start of the Zilien measurement, which
+                the "Mass scan started at [s]" times in the files are relative to.
+                Defaults to the timestamp that the name of the folder, or of a folder
+                it is in, starts with. See `get_zilien_spectra_tstamp`.
+            workers (int): The number of threads to parse the files in. Defaults to
+                that of `concurrent.futures.ThreadPoolExecutor`.
+            kwargs: Key-word arguments are passed on ultimately to cls.__init__
+        """
+        if path_to_dir:
+            self.path_to_dir = Path(path_to_dir)
+        cls = cls or SpectrumSeries
+        if tstamp is None:
+            tstamp = get_zilien_spectra_tstamp(self.path_to_dir)
+        # Zilien zero-pads the scan time in the file names, so this sorts them in time
+        spectrum_files = sorted(self.path_to_dir.glob("*.tsv"))
+        if not spectrum_files:
+            raise ReadError(f"{self} found no .tsv files in {self.path_to_dir}")
+
+        t_0, (x_name, y_name), data = read_zilien_spectrum(spectrum_files[0])
+        x = data[:, 0]
+        x_hash = hashlib.sha1(x.tobytes()).hexdigest()
+        y = np.empty((len(spectrum_files), len(x)))
+        y[0] = data[:, 1]
+        t = np.empty(len(spectrum_files))
+        t[0] = t_0
+
+        def read_into_row(i):
+            """Read the i'th spectrum into y[i] and its time into t[i]. Return x hash"""
+            t[i], _, data_i = read_zilien_spectrum(spectrum_files[i])
+            if not data_i.shape == data.shape:
+                return None
+            y[i] = data_i[:, 1]
+            return hashlib.sha1(data_i[:, 0].tobytes()).hexdigest()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            x_hashes = pool.map(read_into_row, range(1, len(spectrum_files)))
+            for spectrum_file, hash_i in zip(spectrum_files[1:], x_hashes):
+                if not hash_i == x_hash:
+                    raise ReadError(
+                        f"{spectrum_file} does not have the same m/z values as "
+                        f"{spectrum_files[0]}, so they can't be in one SpectrumSeries."
+                    )
+        if np.any(np.diff(t) < 0):
+            order = np.argsort(t)
+            t, y = t[order], y[order]
+
+        tseries = TimeSeries(
+            name="spectrum time / [s]", unit_name="s", data=t, tstamp=tstamp
+        )
+        xseries = DataSeries(data=x, name=x_name, unit_name="m/z")
+        field = Field(
+            data=y, name=y_name, unit_name="A", axes_series=[tseries, xseries],
+        )
+        obj_as_dict = {
+            "name": name or self.path_to_dir.name,
             "technique": "MS",
+            "tstamp": tstamp,
             "field": field,
             "reader": self,
         }
         obj_as_dict.update(kwargs)
         return cls.from_dict(obj_as_dict)
 
+    def read_header(self, path_to_dir, tstamp=None, estimate_rows=True):
+        """Return a record of the metadata of a folder of mass scans, without the data
+
+        Only the header of the first file is read. The rows are the spectra, so their
+        number is that of the files.
+
+        Args:
+            path_to_dir (Path or str): the path to the folder of mass scans
+            tstamp (float): The unix time of the start of the Zilien measurement. See
+                read().
+            estimate_rows (bool): Not used, as the number of spectra is known.
+
+        Returns dict: See `reading_tools.header_record`. Also has "scan_span", the
+            times that the first and last scans started at, relative to tstamp.
+        """
+        self.path_to_dir = Path(path_to_dir)
+        if tstamp is None:
+            tstamp = get_zilien_spectra_tstamp(self.path_to_dir)
+        spectrum_files = sorted(self.path_to_dir.glob("*.tsv"))
+        if not spectrum_files:
+            raise ReadError(f"{self} found no .tsv files in {self.path_to_dir}")
+        scan_span = []
+        for spectrum_file in (spectrum_files[0], spectrum_files[-1]):
+            with open_file(spectrum_file) as f:
+                t, column_names, _ = process_zilien_spectrum_header(f)
+            scan_span.append(t)
+        return header_record(
+            self.path_to_dir,
+            tstamp=tstamp,
+            technique="MS",
+            column_names=column_names,
+            n_rows=len(spectrum_files),
+            scan_span=scan_span,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path_to_dir})"
+
+
+def get_zilien_spectra_tstamp(path_to_dir):
+    """Return the tstamp of the Zilien measurement that a folder of mass scans is from
+
+    Zilien names what it saves for a measurement by when the measurement started,
+    like "2021-02-01 17_44_12 name". This is the timestamp that the name of the
+    folder, or else of the nearest folder it is in, starts with.
+
+    Raises ReadError: if none of the folders' names start with a timestamp.
+    """
+    path_to_dir = Path(path_to_dir).resolve()
+    for folder in [path_to_dir, *path_to_dir.parents]:
+        try:
+            return timestamp_string_to_tstamp(
+                folder.name[:19], form=ZILIEN_TIMESTAMP_FORM
+            )
+        except ReadError:
+            continue
+    raise ReadError(
+        f"Could not find a Zilien timestamp in the name of {path_to_dir} or the "
+        "folders it is in. Give the tstamp of the Zilien measurement instead."
+    )
+
+
+def read_zilien_spectrum(path_to_file):
+    """Return (t, column_names, data) of a Zilien mass scan .tsv file
+
+    The data is parsed by pandas' C parser, after the header.
+
+    Returns tuple: The time (float) that the scan started at in the Zilien
+        measurement, the column names (list of str), and the data (np.array) with
+        one column per column name.
+    """
+    with open_file(path_to_file) as f:
+        t, column_names, _ = process_zilien_spectrum_header(f)
+        df = pd.read_csv(
+            f, delimiter="\t", header=None, names=column_names, engine="c"
+        )
+    return t, column_names, df.to_numpy(dtype=float)
+
+
+def process_zilien_spectrum_header(f):
+    """Read the header of the open mass scan file f, leaving it at the data
+
+    The header is `ZILIEN_SPECTRUM_N_HEADER_LINES` non-blank lines and then the
+    column header line, as pandas counts them with `header=9`.
+
+    Returns tuple: The time (float) that the scan started at in the Zilien
+        measurement, the column names (list of str), and the number of header lines
+        (int) including the column name line.
+    """
+    t = None
+    n_header_lines = 0
+    n_non_blank_lines = 0
+    for line in f:
+        n_header_lines += 1
+        if not line.strip():
+            continue
+        n_non_blank_lines += 1
+        if n_non_blank_lines > ZILIEN_SPECTRUM_N_HEADER_LINES:
+            break
+        if "Mass scan started at [s]" in line:
+            t = float(re.search(FLOAT_MATCH, line).group())
+    else:
+        raise ReadError(f"The mass scan in {f.name} ends in its header")
+    column_names = [name.strip() for name in line.split("\t")]
+    if t is None:
+        raise ReadError(f"Could not find when the mass scan in {f.name} started")
+    return t, column_names, n_header_lines
+
 
 if __name__ == "__main__":
     """Module demo here.
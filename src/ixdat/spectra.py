@@ -87,9 +87,14 @@ class Spectrum(Saveable):
 
         Args:
             path_to_file (Path or str): The path to the file to read
-            reader (str or Reader class): The (name of the) reader to read the file with.
+            reader (str or Reader class): The (name of the) reader to read the file with,
+                or "auto" to detect it from the start of the file.
             kwargs: key-word arguments are passed on to the reader's read() method.
         """
+        if reader == "auto":
+            from .readers.reading_tools import sniff_reader_name
+
+            reader = sniff_reader_name(path_to_file)
         if isinstance(reader, str):
             # TODO: see if there isn't a way to put the import at the top of the module.
             #    see: https://github.com/ixdat/ixdat/pull/1#discussion_r546437471
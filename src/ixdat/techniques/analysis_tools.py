@@ -67,6 +67,130 @@ def tspan_passing_through(t, v, vspan, direction=None, t_i=None, v_res=None):
     return [t_start, t_finish]
 
 
+def tspans_passing_through(t, v, vspans, t_i_list=None, v_res=None):
+    """Return the tspans corresponding to t when v first passes through each vspan
+
+    This gives the same result as calling `tspan_passing_through` for each vspan (and
+    corresponding t_i), but is much faster for many vspans. Rather than scanning the
+    full arrays for each step of each vspan, it builds a crossing index (a tree of
+    the minima and maxima of v over blocks of data points) once, after which each
+    step for all the vspans is a vectorized O(log(N)) search in the index.
+    Like `tspan_passing_through`, this assumes that t is sorted.
+
+    Args:
+        t (np.array): independent varible data (usually time)
+        v (np.array): dependent variable data
+        vspans (iter of iter of float): The ranges of v that we are interested in.
+            The direction of each vspan defines whether v should be increasing or
+            decreasing as it passes through it, as in `tspan_passing_through`.
+        t_i_list (iter of float): The lowest value of t acceptable for each tspan.
+            Optional. Can also contain None's.
+        v_res (float): The uncertainty or resolution of the v data. Defaults to a
+            hundredth of the width of each vspan, as in `tspan_passing_through`.
+
+    Returns:
+        np.array: The tspans, with shape (len(vspans), 2)
+    """
+    vspans = np.array(vspans, dtype=float)
+    K = len(vspans)
+    if t_i_list is None:
+        t_i_list = [None] * K
+    t_i_array = np.array(
+        [t_i if t_i is not None else t[0] - 1 for t_i in t_i_list], dtype=float
+    )
+    v_res = np.abs(vspans[:, -1] - vspans[:, 0]) / 100 if v_res is None else v_res
+    v_res = np.abs(v_res) * np.ones(K)
+
+    # For decreasing vspans, we negate v and vspan to always look for increasing v.
+    direction = vspans[:, 0] < vspans[:, -1]
+    v_start = np.where(direction, vspans.min(axis=1), -vspans.max(axis=1))
+    v_finish = np.where(direction, vspans.max(axis=1), -vspans.min(axis=1))
+
+    min_tree, max_tree = _build_extrema_trees(v)
+
+    def first_index(i_0, compare, threshold):
+        """Return first index >= i_0 of compare(+/-v, threshold), or 0 if none"""
+        if compare is np.less:  # -v < threshold <==> v > -threshold
+            i_pos = _find_first_index(min_tree, i_0, np.less, threshold)
+            i_neg = _find_first_index(max_tree, i_0, np.greater, -threshold)
+        elif compare is np.greater:  # -v > threshold <==> v < -threshold
+            i_pos = _find_first_index(max_tree, i_0, np.greater, threshold)
+            i_neg = _find_first_index(min_tree, i_0, np.less, -threshold)
+        else:  # np.greater_equal. -v >= threshold <==> v <= -threshold
+            i_pos = _find_first_index(max_tree, i_0, np.greater_equal, threshold)
+            i_neg = _find_first_index(min_tree, i_0, np.less_equal, -threshold)
+        i = np.where(direction, i_pos, i_neg)
+        return np.where(i < v.size, i, 0)  # like np.argmax of an all-False mask
+
+    def first_index_after(i):
+        """Return the first index for which t is greater than t[i]"""
+        return np.searchsorted(t, t[i], side="right")
+
+    # Each step here corresponds to a step in tspan_passing_through:
+    i_before = first_index(
+        np.searchsorted(t, t_i_array, side="right"), np.less, v_start - v_res
+    )
+    i_just_before = (
+        first_index(first_index_after(i_before), np.greater_equal, v_start) - 1
+    )
+    i_start = first_index(first_index_after(i_just_before), np.greater, v_start)
+    i_finish = first_index(first_index_after(i_start), np.greater, v_finish) - 1
+    return np.stack([t[i_start], t[i_finish]], axis=1)
+
+
+def _build_extrema_trees(v):
+    """Return lists of arrays with the min and max of v over blocks of 2^level points
+
+    The n'th element of the l'th array in each list is the min (or max) of
+    `v[n * 2**l : (n + 1) * 2**l]`. v is padded to a power of two with values that
+    never satisfy comparisons. NaN's in v are ignored.
+    """
+    size = 1 << int(np.ceil(np.log2(max(v.size, 1))))
+    min_tree = [np.append(v, np.tile(np.inf, size - v.size))]
+    max_tree = [np.append(v, np.tile(-np.inf, size - v.size))]
+    while min_tree[-1].size > 1:
+        min_tree.append(np.fmin(min_tree[-1][0::2], min_tree[-1][1::2]))
+        max_tree.append(np.fmax(max_tree[-1][0::2], max_tree[-1][1::2]))
+    return min_tree, max_tree
+
+
+def _find_first_index(tree, i_0, compare, threshold):
+    """Return the first indeces i >= i_0 where compare(v[i], threshold), vectorized
+
+    Args:
+        tree (list of np.array): The min tree (for np.less and np.less_equal) or max
+            tree (for np.greater and np.greater_equal) from `_build_extrema_trees`
+        i_0 (np.array of int): The starting indeces
+        compare (np.ufunc): The comparison, e.g. np.less
+        threshold (np.array of float): The value to compare v to, for each i_0
+
+    Returns:
+        np.array of int: The first indeces, or the padded size of v where not found
+    """
+    N_levels = len(tree) - 1
+    size = tree[0].size
+    i = np.array(i_0, dtype=int)
+    level = np.full(i.shape, -1)  # the level of the node known to contain a hit
+    # Climb: jump over the aligned blocks that start at i as long as they have no hits
+    for lvl in range(N_levels):
+        at_block = (level < 0) & (i < size) & ((i >> lvl) & 1).astype(bool)
+        node = np.where(at_block, i >> lvl, 0)
+        has_hit = at_block & compare(tree[lvl][node], threshold)
+        level[has_hit] = lvl
+        i = np.where(at_block & ~has_hit, i + (1 << lvl), i)
+    at_root = (level < 0) & (i == 0)
+    level[at_root & compare(tree[N_levels][0], threshold)] = N_levels
+    # Descend: in each node with a hit, go to the left child if it has a hit.
+    node = np.where(level >= 0, i >> np.maximum(level, 0), 0)
+    for lvl in range(N_levels - 1, -1, -1):
+        descending = level > lvl
+        left = np.where(descending, 2 * node, 0)
+        go_left = compare(tree[lvl][left], threshold)
+        node = np.where(descending, np.where(go_left, left, left + 1), node)
+        level = np.where(descending, lvl, level)
+    return np.where(level == 0, node, size)
+
+
 def calc_sharp_v_scan(t, v, res_points=10):
     """Calculate the discontinuous rate of change of v with respect to t
 
@@ -82,12 +206,12 @@ def calc_sharp_v_scan(t, v, res_points=10):
     t_behind = np.append(np.tile(t[0], res_points), t[:-res_points])
     t_ahead = np.append(t[res_points:], np.tile(t[-1], res_points))
 
-    v_scan_middle = (v_ahead - v_behind) / (t_ahead - t_behind)
+    v_scan_middle = _calc_slope(v_ahead - v_behind, t_ahead - t_behind)
     # ^ this is "softened" at the anodic and cathodic turns.
 
     # We can "sharpen" it by selectively looking ahead and behind:
-    v_scan_behind = (v - v_behind) / (t - t_behind)
-    v_scan_ahead = (v_ahead - v) / (t_ahead - t)
+    v_scan_behind = _calc_slope(v - v_behind, t - t_behind)
+    v_scan_ahead = _calc_slope(v_ahead - v, t_ahead - t)
 
     # but this gives problems right at the beginning, so set those to zeros
     v_scan_behind[:res_points] = np.zeros(res_points)
@@ -110,6 +234,13 @@ def calc_sharp_v_scan(t, v, res_points=10):
     return v_scan
 
 
+def _calc_slope(dv, dt):
+    """Return dv / dt, with zero where dt is zero (e.g. at the ends of the data)"""
+    slope = np.zeros(np.shape(dv))
+    np.divide(dv, dt, out=slope, where=dt != 0)
+    return slope
+
+
 def find_signed_sections(x, x_res=0.001, res_points=10):
     """Return list of tuples ((i_start, i_finish), section_type) describing the vector x
 
@@ -168,20 +299,46 @@ def find_signed_sections(x, x_res=0.001, res_points=10):
     return sections
 
 
-def calc_t_using_scan_rate(v, dvdt):
+def calc_t_using_scan_rate(v, dvdt, res_points=10):
     """Return a numpy array describing the time corresponding to v given scan rate dvdt
 
     This is useful for data sets where time is missing. It depends on another value
     having a constant absolute rate of change (such as electrode potential in cyclic
     voltammatry).
-    It uses the `calc_sharp_v_scan` algorithm to match the scan rate implied by the
-    timevector returned with the given scan rate.
+    Since the absolute rate of change is constant, the time passed between two points
+    is directly the absolute change in v divided by dvdt. So the time is calculated
+    as the cumulative sum of |dv| divided by dvdt.
+    If v is noisy, the noise adds to the cumulative sum of |dv|, and the time would
+    run ahead. So if the cumulative sum of |dv| is more than 2% above
+    what it would be with the typical change in v between points (the median of the
+    change over res_points points, divided by res_points), the points are assumed to
+    be evenly spaced in time, by the typical change in v divided by dvdt.
+    If neither gives a strictly increasing time (i.e. v has repeated values, as in a
+    hold), this falls back on the original method: assuming evenly spaced points,
+    the total time is optimized with the `calc_sharp_v_scan` algorithm to match the
+    scan rate implied by the time vector returned with the given scan rate.
+
     Args:
         v (np array): The value
-        dvdt (float): The scan rate in units of v's unit per second
+        dvdt (float): The scan rate in units of v's unit per second. Can't be zero.
+        res_points (int): The number of points over which the typical change in v
+            between points is calculated, to average out noise.
     Returns:
         np array: t, the time vector corresponding to v
     """
+    if dvdt == 0:
+        raise ValueError("Can't calculate the time from a scan rate of zero")
+    dv = np.abs(np.diff(v))
+    if np.all(dv > 0):
+        if v.size > res_points:
+            dv_span = np.abs(v[res_points:] - v[:-res_points])
+            dv_typical = np.median(dv_span) / res_points
+        else:
+            dv_typical = np.median(dv)
+        if np.sum(dv) <= 1.02 * dv_typical * dv.size:
+            return np.append(0, np.cumsum(dv)) / dvdt
+        if dv_typical > 0:  # v is noisy.
+            return np.arange(v.size) * dv_typical / dvdt
 
     def error(t_tot):
         t = np.linspace(0, t_tot[0], v.size)
@@ -1,9 +1,11 @@
+import warnings
 import numpy as np
 from .ec import ECMeasurement
-from ..data_series import ValueSeries, TimeSeries
+from ..data_series import ValueSeries, TimeSeries, RLEValueSeries
 from ..exceptions import SeriesNotFoundError, BuildError
 from .analysis_tools import (
     tspan_passing_through,
+    tspans_passing_through,
     calc_sharp_v_scan,
     find_signed_sections,
 )
@@ -123,6 +125,121 @@ class CyclicVoltammagram(ECMeasurement):
         self.sel_str = "cycle"
         return self.cycle
 
+    def iter_cycles(self):
+        """Iterate over the cycles, yielding a light-weight CyclicVoltammagram for each
+
+        This gives the same cycles as `(self[n] for n in <the cycle numbers>)`, but
+        much cheaper: The boundaries of all the cycles are found in a single pass
+        through `self[self.sel_str]`, and the yielded CyclicVoltammagrams contain
+        slices of (rather than copies of) this one's data, including the calibrated
+        potential. They should therefore be treated as read-only.
+        """
+        selector = self[self.sel_str]
+        t = selector.t + (selector.tstamp - self.tstamp)
+        if isinstance(selector, RLEValueSeries):
+            i_finishes = selector.stops - 1  # the runs of the selector are the cycles.
+            i_starts = i_finishes + 1 - selector.runs["length"]
+        else:
+            values = selector.data
+            i_changes = np.flatnonzero(values[1:] != values[:-1]) + 1
+            i_starts = np.append(0, i_changes)
+            i_finishes = np.append(i_changes, values.size) - 1
+        tspans = np.stack([t[i_starts], t[i_finishes]], axis=1)
+        yield from self._iter_views(tspans)
+
+    def iter_sweeps(self, sweep_types=("anodic", "cathodic"), **kwargs):
+        """Iterate over the sweeps, yielding a light-weight CyclicVoltammagram for each
+
+        The yielded CyclicVoltammagrams share their data with this one, as described
+        in `iter_cycles`.
+
+        Args:
+            sweep_types (iter of str): The types of sweeps to include. Options are
+                "anodic", "cathodic", and "hold". Defaults to ("anodic", "cathodic")
+            kwargs: Key-word arguments are passed on to `get_timed_sweeps`
+        """
+        tspans = [
+            tspan
+            for tspan, sweep_type in self.get_timed_sweeps(**kwargs)
+            if sweep_type in sweep_types
+        ]
+        yield from self._iter_views(np.array(tspans))
+
+    def _iter_views(self, tspans):
+        """Yield a CyclicVoltammagram slicing self's data for each tspan in tspans
+
+        This does what `cut` does for each tspan, but the slicing indices for all of
+        the tspans are found at once for each TimeSeries using `np.searchsorted`.
+        This assumes the time data is sorted, as it is when read or appended.
+        The potential is calibrated once here, and the sliced calibrated potential is
+        included in the yielded CyclicVoltammagrams so that they don't re-calibrate.
+
+        Args:
+            tspans (np.array): The time intervals relative to self.tstamp, shape (K, 2)
+        """
+        series_list = self.series_list
+        if self.RE_vs_RHE is not None and not self.R_Ohm:
+            series_list = series_list + [self.potential]
+        # {id(tseries): (t_data, i_starts, i_stops)}. Not Saveable id's! The data is
+        # got once, as that of a UniformTimeSeries is made when it is asked for.
+        index_spans = {}
+        for series in series_list:
+            tseries = getattr(series, "tseries", None)
+            if tseries is None or id(tseries) in index_spans:
+                continue
+            t_data = tseries.data
+            t = t_data + (tseries.tstamp - self.tstamp)  # exactly as in `cut`
+            index_spans[id(tseries)] = (
+                t_data,
+                np.searchsorted(t, tspans[:, 0], side="left"),
+                np.searchsorted(t, tspans[:, -1], side="right"),
+            )
+        obj_as_dict = self.as_dict()
+        del obj_as_dict["s_ids"]
+        for k in range(len(tspans)):
+            new_tseries_dict = {}
+            new_series_list = []
+            for series in series_list:
+                tseries = getattr(series, "tseries", None)
+                if tseries is None:  # series independent of time are uneffected
+                    new_series_list.append(series)
+                    continue
+                t_data, i_starts, i_stops = index_spans[id(tseries)]
+                i_start, i_stop = i_starts[k], i_stops[k]
+                if i_start >= i_stop:
+                    continue
+                if id(tseries) not in new_tseries_dict:
+                    new_tseries_dict[id(tseries)] = TimeSeries(
+                        name=tseries.name,
+                        unit_name=tseries.unit_name,
+                        data=t_data[i_start:i_stop],
+                        tstamp=tseries.tstamp,
+                    )
+                new_tseries = new_tseries_dict[id(tseries)]
+                if series is tseries:
+                    new_series_list.append(new_tseries)
+                elif isinstance(series, RLEValueSeries):
+                    new_series_list.append(
+                        RLEValueSeries(
+                            name=series.name,
+                            unit_name=series.unit_name,
+                            runs=series.get_runs(slice(i_start, i_stop)),
+                            tseries=new_tseries,
+                        )
+                    )
+                else:
+                    new_series_list.append(
+                        series.__class__(
+                            name=series.name,
+                            unit_name=series.unit_name,
+                            data=series.data[i_start:i_stop],
+                            tseries=new_tseries,
+                        )
+                    )
+            view_as_dict = obj_as_dict.copy()
+            view_as_dict["series_list"] = new_series_list
+            yield self.__class__.from_dict(view_as_dict)
+
     def select_sweep(self, vspan, t_i=None):
         """Return a CyclicVoltammagram for while the potential is sweeping through vspan
 
@@ -136,6 +253,23 @@ class CyclicVoltammagram(ECMeasurement):
         tspan = tspan_passing_through(t=self.t, v=self.v, vspan=vspan, t_i=t_i,)
         return self.cut(tspan=tspan)
 
+    def select_sweeps(self, vspans, t_i_list=None):
+        """Return a list of CyclicVoltammagrams for sweeps through each of vspans
+
+        This is equivalent to `[self.select_sweep(vspan, t_i) for ...]` but uses
+        `tspans_passing_through` to find all the tspans at once. The returned
+        CyclicVoltammagrams share their data with this one, as in `iter_cycles`.
+
+        Args:
+            vspans (iter of iter of float): The potential ranges. See `select_sweep`
+            t_i_list (iter of float): Optional. Times before which each sweep can't
+                start. Can also contain None's.
+        """
+        tspans = tspans_passing_through(
+            t=self.t, v=self.v, vspans=vspans, t_i_list=t_i_list
+        )
+        return list(self._iter_views(tspans))
+
     def integrate(self, item, tspan=None, vspan=None, ax=None):
         """Return the time integral of item while time in tspan or potential in vspan
 
@@ -302,6 +436,122 @@ class CyclicVoltammagram(ECMeasurement):
         diff.cv_2 = other
         return diff
 
+    @classmethod
+    def stack(
+        cls,
+        cvs,
+        potential_grid,
+        cycles=None,
+        item="current",
+        v_scan_res=5e-4,
+        res_points=10,
+    ):
+        """Project the sweeps of many CyclicVoltammagrams onto a shared potential grid
+
+        The anodic and cathodic sweeps of each CyclicVoltammagram (see
+        `get_timed_sweeps`) are lined up, and `item` is interpolated onto
+        `potential_grid` for each one. This is done for all sweeps of all the cvs in
+        a single call to `np.interp`, by offsetting the potential of each sweep so
+        that the sweeps follow each other in one increasing vector.
+        Grid points outside of the potential range of a sweep get NaN.
+
+        Args:
+            cvs (list of CyclicVoltammagram): The nominally identical CVs to stack
+            potential_grid (np.array): The potentials in [V] to interpolate onto
+            cycles (int or list of int): The cycle(s) of each cv to include.
+                Defaults to all of them.
+            item (str): The name of the ValueSeries to stack. Defaults to "current".
+            v_scan_res (float): see CyclicVoltammagram.get_timed_sweeps()
+            res_points (int): see CyclicVoltammagram.get_timed_sweeps()
+
+        Returns:
+            np.array: The stacked data, shape (len(cvs), N_sweeps, len(potential_grid))
+            ValueSeries: The mean over the cvs. Its TimeSeries is the time at which
+                the first cv passes through each grid potential in each sweep. The
+                data is ordered by sweep and then grid potential, leaving out the grid
+                potentials that the first cv doesn't pass through.
+            ValueSeries: The standard deviation over the cvs, with the same TimeSeries
+        """
+        potential_grid = np.array(potential_grid, dtype=float)
+        sweep_types = None
+        x_list, y_list, t_list = [], [], []
+        for cv in cvs:
+            if cycles is not None:
+                cv = cv[cycles]
+            t, v = cv.grab("potential")
+            y = cv.grab_for_t(item, t)
+            sweep_specs = [
+                spec
+                for spec in cv.get_timed_sweeps(
+                    v_scan_res=v_scan_res, res_points=res_points
+                )
+                if spec[1] in ["anodic", "cathodic"]
+            ]
+            if sweep_types is None:
+                sweep_types = [spec[1] for spec in sweep_specs]
+            elif not [spec[1] for spec in sweep_specs] == sweep_types:
+                raise BuildError(
+                    "Can only stack CyclicVoltammagrams with the same sweeps. "
+                    f"{cvs[0]} has {sweep_types} and {cv} has {sweep_specs}."
+                )
+            for tspan, sweep_type in sweep_specs:
+                i_start = np.searchsorted(t, tspan[0], side="left")
+                i_stop = np.searchsorted(t, tspan[-1], side="right")
+                # Cathodic sweeps are negated so that all sweeps are increasing:
+                sign = 1 if sweep_type == "anodic" else -1
+                x_list.append(sign * v[i_start:i_stop])
+                y_list.append(y[i_start:i_stop])
+                t_list.append(t[i_start:i_stop])
+        N_cvs, N_sweeps, N_grid = len(cvs), len(sweep_types), len(potential_grid)
+
+        # Sort the points of each sweep by potential, and offset each sweep by a step
+        # larger than the potential range so that they don't overlap:
+        lengths = np.array([len(x) for x in x_list])
+        sweep_number = np.repeat(np.arange(len(x_list)), lengths)
+        x = np.concatenate(x_list)
+        sort_indeces = np.lexsort((x, sweep_number))
+        x = x[sort_indeces]
+        y = np.concatenate(y_list)[sort_indeces]
+        t = np.concatenate(t_list)[sort_indeces]
+        step = 2 * max(np.max(np.abs(x)), np.max(np.abs(potential_grid))) + 1
+        x_offset = x + sweep_number * step
+
+        signs = np.tile([1 if s == "anodic" else -1 for s in sweep_types], N_cvs)
+        x_grid = signs[:, np.newaxis] * potential_grid[np.newaxis, :]
+        x_grid_offset = x_grid + (np.arange(len(x_list)) * step)[:, np.newaxis]
+        y_grid = np.interp(x_grid_offset, x_offset, y)
+        t_grid = np.interp(x_grid_offset, x_offset, t)
+
+        i_ends = np.cumsum(lengths)
+        x_min = x[np.minimum(i_ends - lengths, x.size - 1)][:, np.newaxis]
+        x_max = x[np.maximum(i_ends - 1, 0)][:, np.newaxis]
+        outside = (x_grid < x_min) | (x_max < x_grid) | (lengths == 0)[:, np.newaxis]
+        y_grid[outside] = np.nan
+        t_grid[outside] = np.nan
+
+        stacked = y_grid.reshape(N_cvs, N_sweeps, N_grid)
+        with warnings.catch_warnings():  # for grid points with no data at all
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            mean = np.nanmean(stacked, axis=0).flatten()
+            std = np.nanstd(stacked, axis=0).flatten()
+
+        t_first = t_grid[:N_sweeps].flatten()
+        mask = np.logical_not(np.isnan(t_first))
+        unit_name = cvs[0][item].unit_name
+        tseries = TimeSeries(
+            name="time/[s] for stack",
+            unit_name="s",
+            data=t_first[mask],
+            tstamp=cvs[0].tstamp,
+        )
+        mean_series = ValueSeries(
+            name=item + " mean", unit_name=unit_name, data=mean[mask], tseries=tseries
+        )
+        std_series = ValueSeries(
+            name=item + " std", unit_name=unit_name, data=std[mask], tseries=tseries
+        )
+        return stacked, mean_series, std_series
+
 
 class CyclicVoltammagramDiff(CyclicVoltammagram):
 
@@ -3,7 +3,14 @@
 import numpy as np
 
 from ..measurements import Measurement, append_series, time_shifted
-from ..data_series import ValueSeries, ConstantValue
+from ..config import CFG
+from ..data_series import (
+    ValueSeries,
+    RLEValueSeries,
+    ConstantValue,
+    get_compact_int_dtype,
+    intern_time_series,
+)
 from ..exceptions import SeriesNotFoundError
 from ..exporters.ec_exporter import ECExporter
 
@@ -208,6 +215,7 @@ class ECMeasurement(Measurement):
         self._raw_current = None
         self._selector = None
         self._file_number = None
+        self._constants = {}  # {name: ConstantValue} of those populated
         if self.potential:
             if all(
                 [
@@ -265,6 +273,41 @@ class ECMeasurement(Measurement):
                 tseries = self.potential.tseries
                 series = s.get_vseries(tseries=tseries)
                 self.series_list[i] = series
+                self._constants[s.name] = s  # so that clear_cache can do it again.
+
+    def clear_cache(self, data_names):
+        """Forget the series built from the data, so that they are built again
+
+        This is needed when the data of the measurement's series changes in place, as
+        when a reader follows a file which is still being written. Series which are
+        not among the data but share a TimeSeries with it, like `selector`, are
+        removed and rebuilt when needed, except for those populated from
+        ConstantValues, which are populated again right away. The raw potential and
+        current are found again the next time they are needed.
+
+        Args:
+            data_names (iter of str): The names of the series holding the data
+        """
+        data_names = set(data_names)
+        data_tseries = [
+            s.tseries
+            for s in self.series_list
+            if s.name in data_names and getattr(s, "tseries", None) is not None
+        ]
+        self._series_list = [
+            s
+            for s in self.series_list
+            if s.name in data_names
+            or not any(getattr(s, "tseries", None) is t for t in data_tseries)
+        ]
+        self._raw_potential = None
+        self._raw_current = None
+        self._selector = None
+        series_names = self.series_names
+        for name, constant in self._constants.items():
+            if name not in series_names:
+                self.series_list.append(constant)
+        self._populate_constants()
 
     def __getitem__(self, item):
         """Return the (concatenated) (time-shifted) `DataSeries` with name `item`
@@ -329,11 +372,11 @@ class ECMeasurement(Measurement):
         This works by finding all the series that have names matching the raw potential
         names list `self.raw_potential_names` (which should be provided by the Reader).
         If there is only one, it just shifts it to t=0 at self.tstamp.
-        FIXME:
-            If there are multiple it appends them with t=0 at self.tstamp. In this
-            case it also appends the `TimeSeries` to `series_list` since *bad things
-            might happen?* if the `TimeSeries` of a `ValueSeries` in `series_list` is
-            not itself in `series_list`. But this results in redundant TimeSeries.
+        If there are multiple it appends them with t=0 at self.tstamp. In this case it
+        also appends the `TimeSeries` to `series_list` since *bad things might happen?*
+        if the `TimeSeries` of a `ValueSeries` in `series_list` is not itself in
+        `series_list`. The TimeSeries is interned (see `data_series.intern_time_series`)
+        first, so an equal one already there, like that of the raw current, is reused.
         """
         potential_series_list = [
             s for s in self.series_list if s.name in self.raw_potential_names
@@ -344,12 +387,8 @@ class ECMeasurement(Measurement):
             )
         elif len(potential_series_list) > 1:
             raw_potential = append_series(potential_series_list, tstamp=self.tstamp)
-            if self._raw_current and self._raw_current.tseries == raw_potential.tseries:
-                # Then we can re-use the tseries from raw_current rather than
-                # saving a new one :D
-                potential_tseries = self._raw_current.tseries
-            else:
-                potential_tseries = raw_potential.tseries
+            potential_tseries = intern_time_series(raw_potential.tseries)
+            if not any(s is potential_tseries for s in self.series_list):
                 self.series_list.append(potential_tseries)
             self._raw_potential = ValueSeries(
                 name=self.E_str,
@@ -378,7 +417,6 @@ class ECMeasurement(Measurement):
         """Build the raw current and store it data_series and as self._raw_current()
 
         This works the way as `_find_or_build_raw_potential`. See the docstring there.
-        FIXME: it also has the same problems.
         """
         current_series_list = [
             s for s in self.series_list if s.name in self.raw_current_names
@@ -387,14 +425,8 @@ class ECMeasurement(Measurement):
             self._raw_current = time_shifted(current_series_list[0], tstamp=self.tstamp)
         elif len(current_series_list) > 1:
             raw_current = append_series(current_series_list, tstamp=self.tstamp)
-            if self._raw_potential and (
-                self._raw_potential.tseries == raw_current.tseries
-            ):
-                # Then we can re-use the tseries from raw_potential rather than
-                # saving a new one :D
-                current_tseries = self._raw_potential.tseries
-            else:
-                current_tseries = raw_current.tseries
+            current_tseries = intern_time_series(raw_current.tseries)
+            if not any(s is current_tseries for s in self.series_list):
                 self.series_list.append(current_tseries)
             self._raw_current = ValueSeries(
                 name=self.I_str,
@@ -577,7 +609,10 @@ class ECMeasurement(Measurement):
                 )  # comparing with n_up instead puts selector a point ahead
                 changes = np.logical_or(changes, n_down < values)
         selector = np.cumsum(changes)
-        selector_series = ValueSeries(
+        if CFG.compact_integers and get_compact_int_dtype(selector) is not None:
+            selector = selector.astype(get_compact_int_dtype(selector))
+        # The selector is step-like by construction, so it is stored as runs:
+        selector_series = RLEValueSeries(
             name=sel_str, unit_name="", data=selector, tseries=self.potential.tseries,
         )
         self[self.sel_str] = selector_series  # TODO: Better cache'ing. This gets saved.
@@ -0,0 +1,81 @@
+"""Tests of the functions in techniques/analysis_tools.py"""
+
+import warnings
+import numpy as np
+import pytest
+from ixdat.techniques.analysis_tools import (
+    calc_t_using_scan_rate,
+    tspan_passing_through,
+    tspans_passing_through,
+    _build_extrema_trees,
+    _find_first_index,
+)
+
+
+def test_t_from_scan_rate_of_cycles():
+    """With the potential always changing, the time is cumulative |dv| / dvdt"""
+    t = np.linspace(0, 400, 4001)
+    v = 1 - np.abs((t * 0.01) % 2 - 1)  # cycles between 0 and 1 V at 10 mV/s
+    assert np.allclose(calc_t_using_scan_rate(v, dvdt=0.01), t, rtol=0, atol=1e-9)
+
+
+def test_t_from_scan_rate_with_hold():
+    """With a hold, the time falls back on evenly spaced points, as it used to"""
+    t = np.linspace(0, 250, 2501)
+    v = np.minimum(t * 0.01, 1)  # a sweep to 1 V at 10 mV/s and then a hold
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)  # e.g. from dividing by zero
+        t_calc = calc_t_using_scan_rate(v, dvdt=0.01)
+    assert t_calc[0] == 0 and t_calc[-1] > 0
+    assert np.allclose(np.diff(t_calc), t_calc[-1] / (len(t) - 1))
+
+
+def make_cycles(n_cycles=5, n_per_cycle=400, noise=2e-3):
+    """Return t and a noisy potential cycling between 0 and 1 V"""
+    rng = np.random.default_rng(0)
+    t = np.arange(n_cycles * n_per_cycle) * 0.5
+    v = 1 - np.abs((t / (n_per_cycle * 0.25)) % 2 - 1)
+    return t, v + rng.normal(0, noise, t.size)
+
+
+@pytest.mark.parametrize("noise", [2e-3, 1e-2])
+def test_t_from_scan_rate_of_noisy_cycles(noise):
+    """The noise in the potential doesn't make the time run ahead"""
+    t, v = make_cycles(noise=noise)  # at 10 mV/s
+    t_calc = calc_t_using_scan_rate(v, dvdt=0.01)
+    assert np.allclose(t_calc, t, rtol=0, atol=0.025 * t[-1])
+
+
+def test_t_from_scan_rate_of_zero():
+    with pytest.raises(ValueError):
+        calc_t_using_scan_rate(np.linspace(0, 1, 11), dvdt=0)
+
+
+def test_tspans_passing_through_same_as_one_at_a_time():
+    t, v = make_cycles()
+    vspans = [[0.2, 0.8], [0.8, 0.2], [0.1, 0.9], [0.5, 0.51], [1.5, 2], [-1, -0.5]]
+    t_i_list = [None, 130, 333, 700, None, 10]
+    vspans += vspans[::-1]
+    t_i_list += [150, None, 990, None, 400, 0]
+    tspans = tspans_passing_through(t, v, vspans, t_i_list=t_i_list)
+    for tspan, vspan, t_i in zip(tspans, vspans, t_i_list):
+        assert list(tspan) == tspan_passing_through(t, v, vspan, t_i=t_i)
+
+
+def test_find_first_index_same_as_argmax():
+    rng = np.random.default_rng(1)
+    v = rng.normal(size=1000)
+    v[::7] = np.nan
+    min_tree, max_tree = _build_extrema_trees(v)
+    i_0 = rng.integers(0, v.size + 1, 200)
+    thresholds = rng.normal(0, 3, 200)
+    for tree, compare in [
+        (min_tree, np.less),
+        (min_tree, np.less_equal),
+        (max_tree, np.greater),
+        (max_tree, np.greater_equal),
+    ]:
+        i = _find_first_index(tree, i_0, compare, thresholds)
+        for i_found, i_start, threshold in zip(i, i_0, thresholds):
+            hits = np.flatnonzero(compare(v[i_start:], threshold)) + i_start
+            assert i_found == (hits[0] if hits.size else tree[0].size)
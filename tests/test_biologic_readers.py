@@ -0,0 +1,110 @@
+"""Tests of the readers of BioLogic's .mpt and .mpr files"""
+
+import mmap
+import os
+from pathlib import Path
+import numpy as np
+import pytest
+from ixdat import Measurement
+from ixdat.readers import BiologicMPTReader, BiologicMPRReader
+from ixdat.readers.biologic import MPR_MAGIC, MPR_MODULE_HEADER_DTYPE, map_mpr_file
+from ixdat.readers.reading_tools import timestamp_string_to_tstamp
+
+DATA_DIR = Path(__file__).parent.parent / "test_data/biologic_mpr"
+MPT_FILE = DATA_DIR / "Pt_poly_cv_short.mpt"
+MPR_FILE = DATA_DIR / "Pt_poly_cv_short.mpr"
+
+
+def test_mpr_columns_match_mpt():
+    mpt_meas = Measurement.read(MPT_FILE, reader="biologic")
+    mpr_meas = Measurement.read(MPR_FILE, reader="mpr")
+    assert isinstance(mpr_meas.reader, BiologicMPRReader)
+    assert mpr_meas.tstamp == mpt_meas.tstamp
+    assert mpr_meas.series_names == mpt_meas.series_names
+    for series in mpt_meas.series_list:
+        # .mpr files have some columns as float32, which the .mpt file rounds to 8
+        # significant digits.
+        assert np.allclose(mpr_meas[series.name].data, series.data, rtol=1e-6, atol=0)
+
+
+def test_mpr_reader_alias():
+    meas = Measurement.read(MPR_FILE, reader="biologic_mpr")
+    assert isinstance(meas.reader, BiologicMPRReader)
+
+
+def test_mpr_read_header():
+    mpt_meas = Measurement.read(MPT_FILE, reader="biologic")
+    header = Measurement.read_header(MPR_FILE, reader="mpr")
+    assert header["n_rows"] == len(mpt_meas["time/s"].data)
+    assert header["tstamp"] == mpt_meas.tstamp
+    assert set(header["column_names"]) == set(mpt_meas.series_names)
+
+
+def test_mpr_flags_and_integers_are_float_as_in_mpt():
+    mpt_meas = Measurement.read(MPT_FILE, reader="biologic")
+    mpr_meas = Measurement.read(MPR_FILE, reader="mpr")
+    for name in ["mode", "ox/red", "error", "counter inc.", "I Range"]:
+        assert mpr_meas[name].data.dtype == mpt_meas[name].data.dtype == np.float64
+        assert np.array_equal(mpr_meas[name].data, mpt_meas[name].data)
+
+
+def write_mpr_without(path_to_file, shortnames):
+    """Write a copy of MPR_FILE without the modules named in shortnames"""
+    buffer = map_mpr_file(MPR_FILE)
+    content = MPR_MAGIC
+    for module in BiologicMPRReader().read_modules(buffer):
+        if module["shortname"] not in shortnames:
+            start = module["offset"] - MPR_MODULE_HEADER_DTYPE.itemsize - len(b"MODULE")
+            stop = module["offset"] + module["length"]
+            content += buffer[start:stop]
+    path_to_file.write_bytes(content)
+
+
+@pytest.mark.parametrize("with_settings", [True, False])
+def test_mpr_tstamp_without_log(tmp_path, with_settings):
+    """The tstamp is midnight of the settings date, or else the file's mtime"""
+    path_to_file = tmp_path / "no_log.mpr"
+    write_mpr_without(path_to_file, ["VMP LOG"] + ([] if with_settings else ["VMP Set"]))
+    os.utime(path_to_file, (1.6e9, 1.6e9))
+    meas = Measurement.read(path_to_file, reader="mpr")
+    header = Measurement.read_header(path_to_file, reader="mpr")
+    if with_settings:
+        tstamp = timestamp_string_to_tstamp("07/29/20", form="%m/%d/%y")
+    else:
+        tstamp = 1.6e9
+    assert meas.tstamp == header["tstamp"] == tstamp
+    assert len(meas["time/s"].data) == header["n_rows"] == 120
+
+
+def test_mpr_data_is_not_copied():
+    """The float32 columns stay float32 views of the memory-mapped file"""
+    meas = Measurement.read(MPR_FILE, reader="mpr")
+    data = meas["Ewe/V"].data
+    assert data.dtype == np.float32
+    assert np.shares_memory(data, meas.reader.column_data["Ewe/V"])
+    base = data
+    while not isinstance(base, mmap.mmap):
+        base = base.obj if isinstance(base, memoryview) else base.base
+        assert base is not None, "The data is not a view of the file"
+
+
+def test_mpt_follow(tmp_path):
+    """Following a file as it is written gives the same as reading it at the end"""
+    content = MPT_FILE.read_bytes()
+    growing_file = tmp_path / MPT_FILE.name
+    reader = BiologicMPTReader()
+    header_end = content.index(b"\n2\t")  # after the column names
+    for n_bytes in [100, header_end, header_end + 20, 6000, 6001, 15000, len(content)]:
+        growing_file.write_bytes(content[:n_bytes])  # mostly ending mid-line
+        meas = reader.follow(growing_file)
+        if n_bytes <= header_end:
+            assert meas is None
+            continue
+        n_lines = content[header_end:n_bytes].count(b"\n") - 1
+        assert len(meas["time/s"].data) == n_lines
+        assert len(meas.selector.data) == n_lines
+    assert meas is reader.measurement
+    full_meas = BiologicMPTReader().read(MPT_FILE)
+    for series in full_meas.series_list:
+        assert np.array_equal(meas[series.name].data, series.data)
+    assert np.array_equal(meas.selector.data, full_meas.selector.data)
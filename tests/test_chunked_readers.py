@@ -0,0 +1,125 @@
+"""Tests of reading files a chunk of rows at a time, see `readers.chunked`"""
+
+import io
+from pathlib import Path
+import numpy as np
+import pytest
+from ixdat import Measurement
+from ixdat.backends.directory_backend import DirBackend
+from ixdat.config import CFG
+from ixdat.data_series import TimeSeries, UniformTimeSeries, RLEValueSeries
+from ixdat.readers.chunked import ChunkWriter, NpyAppender, NPY_HEADER_SIZE
+
+DATA_DIR = Path(__file__).parent.parent / "test_data"
+FILES_AND_READERS = [
+    (
+        DATA_DIR
+        / "biologic_mpt_and_zilien_tsv/2020-07-29 10_30_39 Pt_poly_cv_01_02_CVA_C01.mpt",
+        "biologic",
+    ),
+    (DATA_DIR / "cinfdata/2021-02-01 17_44_12 cinfdata test.txt", "cinfdata"),
+    (DATA_DIR / "zilien/2021-02-01 17_44_12 test.tsv", "zilien"),
+]
+CHUNK_SIZE = 64  # so that the files have several chunks and a partial last one.
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return DirBackend(directory=tmp_path)
+
+
+@pytest.fixture
+def read_settings():
+    """Turn on the post-processing of the series read, for the test"""
+    settings = {
+        "compact_integers": True,
+        "uniform_time_tolerance": 1e-3,
+        "run_length_encoding_ratio": 0.05,
+    }
+    before = {setting: getattr(CFG, setting) for setting in settings}
+    for setting, value in settings.items():
+        setattr(CFG, setting, value)
+    yield
+    for setting, value in before.items():
+        setattr(CFG, setting, value)
+
+
+def assert_same_series(meas, chunked_meas):
+    """Assert that the series of the measurements are equal, found by name"""
+    assert chunked_meas.series_names == meas.series_names
+    chunked_series = {s.name: s for s in chunked_meas.series_list}
+    for series in meas.series_list:
+        chunked = chunked_series[series.name]
+        assert type(chunked) is type(series)
+        assert chunked.data.dtype == series.data.dtype
+        assert np.array_equal(chunked.data, series.data, equal_nan=True)
+        if isinstance(series, TimeSeries):
+            assert chunked.tstamp == series.tstamp
+
+
+@pytest.mark.parametrize("path_to_file, reader", FILES_AND_READERS)
+def test_chunked_read_same_as_read(backend, path_to_file, reader):
+    meas = Measurement.read(path_to_file, reader=reader)
+    chunked_meas = Measurement.read(
+        path_to_file, reader=reader, chunk_size=CHUNK_SIZE, backend=backend
+    )
+    assert_same_series(meas, chunked_meas)
+    assert max(len(s.data) for s in meas.series_list) > 2 * CHUNK_SIZE
+    for series in chunked_meas.series_list:
+        assert series.backend is backend
+        assert np.array_equal(backend.load_obj_data(series), series.data, equal_nan=True)
+    assert not list((backend.project_directory / "chunks").iterdir())
+
+
+@pytest.mark.parametrize("path_to_file, reader", FILES_AND_READERS)
+def test_chunked_read_is_post_processed_as_read(
+    backend, read_settings, path_to_file, reader
+):
+    meas = Measurement.read(path_to_file, reader=reader)
+    chunked_meas = Measurement.read(
+        path_to_file, reader=reader, chunk_size=CHUNK_SIZE, backend=backend
+    )
+    assert_same_series(meas, chunked_meas)
+
+
+def test_chunked_read_is_post_processed(backend, read_settings):
+    path_to_file, reader = FILES_AND_READERS[2]
+    meas = Measurement.read(
+        path_to_file, reader=reader, chunk_size=CHUNK_SIZE, backend=backend
+    )
+    series = {s.name: s for s in meas.series_list}
+    assert isinstance(series["M2-x"], UniformTimeSeries)
+    assert isinstance(series["cycle number"], RLEValueSeries)
+    assert series["cycle number"].runs["value"].dtype == np.int8
+
+
+def test_npy_appender(tmp_path):
+    appender = NpyAppender(tmp_path / "test.npy", dtype=np.int16)
+    appender.append(np.arange(5))
+    appender.append(np.arange(5, 12))
+    data = appender.close(n_values=10)
+    assert np.array_equal(data, np.arange(10)) and data.dtype == np.int16
+    assert (tmp_path / "test.npy").stat().st_size == NPY_HEADER_SIZE + 10 * 2
+    assert np.array_equal(np.load(tmp_path / "test.npy"), np.arange(10))
+
+
+@pytest.mark.parametrize(
+    "trim, lengths", [(None, [5, 5]), ("first_nan", [3, 1]), ("trailing_nans", [5, 3])]
+)
+def test_chunk_writer_trims_columns(backend, trim, lengths):
+    f = io.StringIO("1\t2\n2\t\n3\t4\n\t\n5\t\n")  # the NaN span a chunk boundary.
+    columns = ChunkWriter(2, backend=backend).read_columns(f, 2, trim=trim, sep="\t")
+    assert [len(column) for column in columns] == lengths
+    full_columns = [[1, 2, 3, np.nan, 5], [2, np.nan, 4, np.nan, np.nan]]
+    for column, full_column, n in zip(columns, full_columns, lengths):
+        assert np.array_equal(column, full_column[:n], equal_nan=True)
+
+
+def test_save_data_obj_moves_data_file(backend, tmp_path):
+    appender = NpyAppender(tmp_path / "t.npy")
+    appender.append(np.arange(10.0))
+    tseries = TimeSeries(name="t", unit_name="s", tstamp=1.6e9, data=appender.close())
+    i = backend.save_data_obj(tseries, data_file=tmp_path / "t.npy")
+    assert not (tmp_path / "t.npy").exists()
+    assert tseries.id == i and tseries.backend is backend
+    assert np.array_equal(backend.load_obj_data(tseries), np.arange(10.0))
@@ -0,0 +1,47 @@
+"""Tests of the reader of cinfdata's text export, see readers/cinfdata.py"""
+
+from pathlib import Path
+import numpy as np
+from ixdat import Measurement
+from ixdat.readers.reading_tools import timestamp_string_to_tstamp
+
+DATA_DIR = Path(__file__).parent.parent / "test_data"
+CINFDATA_FILE = DATA_DIR / "cinfdata/2021-02-01 17_44_12 cinfdata test.txt"
+
+
+def read_columns_line_by_line(path_to_file):
+    """Return {column name: values} of the file, skipping empty cells, line by line"""
+    lines = path_to_file.read_text().splitlines()
+    n_header_lines = next(i for i, line in enumerate(lines) if line.startswith("M")) + 1
+    names = lines[n_header_lines - 1].split("\t")
+    columns = {name: [] for name in names}
+    for line in lines[n_header_lines:]:
+        for name, cell in zip(names, line.split("\t")):
+            if cell:
+                columns[name].append(float(cell))
+    return {name: np.array(values) for name, values in columns.items()}
+
+
+def test_columns_of_unequal_length():
+    meas = Measurement.read(CINFDATA_FILE, reader="cinfdata")
+    columns = read_columns_line_by_line(CINFDATA_FILE)
+    assert len(columns["M2-x"]) == 200 and len(columns["M32-x"]) == 150
+    series = {s.name: s for s in meas.series_list}
+    assert set(series) == {"M2", "M2-x", "M32", "M32-x"}
+    for mass in ["M2", "M32"]:
+        assert series[mass].tseries is series[f"{mass}-x"]
+        assert series[mass].unit_name == "A"
+        assert np.array_equal(series[f"{mass}-x"].data, columns[f"{mass}-x"])
+        # (pandas' parser may differ from float() in the last digit)
+        assert np.allclose(series[mass].data, columns[f"{mass}-y"], rtol=1e-15, atol=0)
+
+
+def test_each_column_has_its_tstamp():
+    meas = Measurement.read(CINFDATA_FILE, reader="cinfdata")
+    tstamp = timestamp_string_to_tstamp("2021-02-01 17:44:12", form="%Y-%m-%d %H:%M:%S")
+    series = {s.name: s for s in meas.series_list}
+    assert meas.tstamp == tstamp
+    assert series["M2-x"].tstamp == tstamp
+    assert series["M32-x"].tstamp == tstamp + 1
+    t, _ = meas.grab("M32")  # relative to meas.tstamp, so one second later
+    assert t[0] == 1 and np.array_equal(t, series["M32-x"].data + 1)
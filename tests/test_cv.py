@@ -0,0 +1,94 @@
+"""Tests of the CyclicVoltammagram class in techniques/cv.py"""
+
+import numpy as np
+from ixdat.data_series import TimeSeries, ValueSeries
+from ixdat.techniques.ec import ECMeasurement
+from ixdat.techniques.cv import CyclicVoltammagram
+
+
+def make_cv(n_cycles=4, n_per_cycle=400, noise=2e-3):
+    """Return a CyclicVoltammagram with a noisy potential cycling between 0 and 1 V"""
+    rng = np.random.default_rng(0)
+    t = np.arange(n_cycles * n_per_cycle) * 0.5
+    v = 1 - np.abs((t / (n_per_cycle * 0.25)) % 2 - 1) + rng.normal(0, noise, t.size)
+    tseries = TimeSeries(name="time/s", unit_name="s", tstamp=1.6e9, data=t)
+    series_list = [
+        tseries,
+        ValueSeries(name="Ewe/V", unit_name="V", data=v, tseries=tseries),
+        ValueSeries(name="I/mA", unit_name="mA", data=np.cos(t), tseries=tseries),
+        ValueSeries(
+            name="cycle number", unit_name="", data=np.ones(t.size), tseries=tseries
+        ),
+    ]
+    cv = ECMeasurement(name="cv", series_list=series_list, tstamp=1.6e9).as_cv()
+    cv.redefine_cycle(start_potential=0.5, redox=True)
+    return cv
+
+
+def assert_same_data(cv, other_cv, names=("Ewe/V", "I/mA")):
+    """Assert that the two CyclicVoltammagrams have the same tstamp, times and data"""
+    assert cv.tstamp == other_cv.tstamp
+    for name in names:
+        t, values = cv.grab(name)
+        other_t, other_values = other_cv.grab(name)
+        assert np.array_equal(t, other_t)
+        assert np.array_equal(values, other_values)
+
+
+def test_select_sweeps_same_as_select_sweep():
+    cv = make_cv()
+    vspans = [[0.2, 0.8], [0.8, 0.2], [0.4, 0.6], [0.9, 0.1], [1.5, 2], [-1, -2]]
+    t_i_list = [None, 300, 450, None, None, 100]
+    sweeps = cv.select_sweeps(vspans, t_i_list=t_i_list)
+    assert len(sweeps) == len(vspans)
+    for sweep, vspan, t_i in zip(sweeps, vspans, t_i_list):
+        assert_same_data(sweep, cv.select_sweep(vspan, t_i=t_i))
+    v = sweeps[0].grab("Ewe/V")[1]
+    assert v.size > 100 and 0.19 < v.min() and v.max() < 0.81
+
+
+def test_iter_cycles_same_as_indexing():
+    cv = make_cv()
+    cycle_numbers = np.unique(cv["cycle"].data)
+    cycles = list(cv.iter_cycles())
+    assert len(cycles) == len(cycle_numbers) > 3
+    for cycle, n in zip(cycles, cycle_numbers):
+        assert_same_data(cycle, cv[int(n)], names=("Ewe/V", "I/mA", "cycle"))
+
+
+def test_iter_sweeps_same_as_cut():
+    cv = make_cv()
+    timed_sweeps = cv.get_timed_sweeps()
+    sweeps = list(cv.iter_sweeps(sweep_types=("anodic", "cathodic", "hold")))
+    assert len(sweeps) == len(timed_sweeps) > 6
+    for sweep, (tspan, sweep_type) in zip(sweeps, timed_sweeps):
+        assert_same_data(sweep, cv.cut(tspan=tspan))
+    anodic_sweeps = list(cv.iter_sweeps(sweep_types=("anodic",)))
+    anodic_tspans = [tspan for tspan, s_type in timed_sweeps if s_type == "anodic"]
+    assert len(anodic_sweeps) == len(anodic_tspans)
+    for sweep, tspan in zip(anodic_sweeps, anodic_tspans):
+        assert_same_data(sweep, cv.cut(tspan=tspan))
+
+
+def test_stack_cycles_of_unequal_length():
+    cvs = [make_cv(n_per_cycle=400), make_cv(n_per_cycle=300)]
+    potential_grid = np.linspace(-0.1, 1.1, 25)  # with grid points outside the data
+    stacked, mean, std = CyclicVoltammagram.stack(cvs, potential_grid)
+    N_sweeps = len(cvs[0].get_timed_sweeps())
+    assert stacked.shape == (2, N_sweeps, 25)
+    for cv, cv_stacked in zip(cvs, stacked):
+        t, v = cv.grab("potential")
+        current = cv.grab_for_t("current", t)
+        for (tspan, sweep_type), sweep_stacked in zip(
+            cv.get_timed_sweeps(), cv_stacked
+        ):
+            sweep = (tspan[0] <= t) & (t <= tspan[-1])
+            sign = 1 if sweep_type == "anodic" else -1
+            x, x_grid = sign * v[sweep], sign * potential_grid
+            order = np.argsort(x, kind="stable")
+            expected = np.interp(x_grid, x[order], current[sweep][order])
+            expected[(x_grid < x.min()) | (x.max() < x_grid)] = np.nan
+            assert np.allclose(sweep_stacked, expected, equal_nan=True)
+    assert np.all(np.isnan(stacked[:, :, [0, -1]]))
+    in_first_cv = ~np.isnan(stacked[0])
+    assert np.allclose(mean.data, np.nanmean(stacked[:, in_first_cv], axis=0))
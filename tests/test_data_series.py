@@ -0,0 +1,149 @@
+"""Tests of the DataSeries classes that store their data compactly"""
+
+import pickle
+import numpy as np
+import pytest
+from ixdat.backends.directory_backend import DirBackend
+from ixdat.data_series import (
+    DataSeries,
+    TimeSeries,
+    UniformTimeSeries,
+    ValueSeries,
+    RLEValueSeries,
+    apply_uniform_time,
+    apply_run_length_encoding,
+    get_compact_int_dtype,
+)
+
+
+def make_uniform_and_plain_tseries(t_start=0.3, t_step=0.1, n=1000):
+    uniform_tseries = UniformTimeSeries(
+        name="t", unit_name="s", tstamp=1.6e9, t_start=t_start, t_step=t_step, n=n
+    )
+    tseries = TimeSeries(name="t", unit_name="s", tstamp=1.6e9, data=uniform_tseries.t)
+    return uniform_tseries, tseries
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_uniform_searchsorted(side):
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    t = np.concatenate([tseries.t, tseries.t + 0.05, [-1, 0.3, 99.9, 100.3, 200]])
+    assert np.array_equal(
+        uniform_tseries.searchsorted(t, side=side),
+        np.searchsorted(tseries.t, t, side=side),
+    )
+
+
+def test_uniform_from_time_series():
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    new_tseries = UniformTimeSeries.from_time_series(tseries, tolerance=1e-4)
+    assert np.allclose(new_tseries.data, tseries.data, rtol=0, atol=1e-12)
+    assert new_tseries.tstamp == tseries.tstamp
+    jitter = np.random.default_rng(0).normal(scale=1e-3, size=tseries.shape)
+    tseries._data = tseries.data + jitter  # 1% of the step
+    assert UniformTimeSeries.from_time_series(tseries, tolerance=1e-4) is None
+    assert UniformTimeSeries.from_time_series(tseries, tolerance=0.1) is not None
+    int_tseries = TimeSeries(name="t", unit_name="s", tstamp=0, data=np.arange(10))
+    assert UniformTimeSeries.from_time_series(int_tseries, tolerance=1e-4) is None
+
+
+def test_uniform_window_selects_as_plain():
+    """Selecting in the window of tspan gives the points of tspan in all the data"""
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    for tspan in ([1.0, 1.5], [0.95, 1.55], [-5, 0.5], [99.9, 200], [200, 300]):
+        window = uniform_tseries.get_window(tspan)
+        t = uniform_tseries.get_t(window)
+        mask, new_tseries = uniform_tseries.select(
+            np.logical_and(tspan[0] <= t, t <= tspan[-1]), window
+        )
+        plain_mask = np.logical_and(tspan[0] <= tseries.t, tseries.t <= tspan[-1])
+        assert np.array_equal(np.arange(1000)[mask], np.flatnonzero(plain_mask))
+        if new_tseries is not None:
+            assert np.allclose(new_tseries.t, tseries.t[plain_mask], rtol=0, atol=1e-12)
+
+
+def test_uniform_data_is_made_once_while_used():
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    data = uniform_tseries.data
+    assert uniform_tseries.data is data
+    assert np.array_equal(pickle.loads(pickle.dumps(uniform_tseries)).data, data)
+    del data
+    assert np.array_equal(uniform_tseries.data, tseries.data)
+
+
+def test_apply_uniform_time():
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    vseries = ValueSeries(name="v", unit_name="", data=np.arange(1e3), tseries=tseries)
+    new_tseries, new_vseries = apply_uniform_time([tseries, vseries], tolerance=1e-4)
+    assert isinstance(new_tseries, UniformTimeSeries)
+    assert new_vseries is vseries and vseries.tseries is new_tseries
+
+
+def test_rle_value_at_sample_times():
+    data = np.repeat(np.arange(100.0), 10)
+    for tseries in make_uniform_and_plain_tseries():
+        vseries = RLEValueSeries(name="v", unit_name="", data=data, tseries=tseries)
+        assert np.array_equal(vseries.value_at(tseries.t), data)
+        assert np.array_equal(vseries.value_at(tseries.t + 0.05), data)
+        assert vseries.value_at(-1) == data[0]
+
+
+def test_uid_follows_changes_to_writeable_data():
+    tseries = TimeSeries(name="t", unit_name="s", tstamp=1.6e9, data=np.arange(10.0))
+    uid = tseries.uid
+    tseries.data[0] = -1
+    assert tseries.uid != uid
+
+
+def test_changed_data_is_saved_as_itself(tmp_path):
+    backend = DirBackend(directory=tmp_path)
+    tseries = TimeSeries(name="t", unit_name="s", tstamp=1.6e9, data=np.arange(10.0))
+    tseries_2 = TimeSeries(name="t", unit_name="s", tstamp=1.6e9, data=np.arange(10.0))
+    assert tseries.uid == tseries_2.uid
+    backend.save_data_obj(tseries)
+    tseries_2.data[0] = -1
+    assert backend.save_data_obj(tseries_2) != tseries.id
+    loaded = backend.get(DataSeries, tseries_2.id)
+    assert np.array_equal(backend.load_obj_data(loaded), tseries_2.data)
+
+
+def test_rle_runs():
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    data = np.repeat([3.0, 1.0, 2.0, 1.0], [100, 250, 600, 50])
+    vseries = RLEValueSeries(name="v", unit_name="", data=data, tseries=tseries)
+    assert vseries.n_runs == 4
+    assert np.array_equal(vseries.data, data)
+    assert vseries.shape == data.shape
+    assert np.array_equal(vseries.get_mask(lambda v: v < 2.5), data < 2.5)
+    for window in [slice(0, 1000), slice(99, 101), slice(120, 300), slice(5, 5)]:
+        runs = vseries.get_runs(window)
+        assert np.array_equal(np.repeat(runs["value"], runs["length"]), data[window])
+
+
+def test_apply_run_length_encoding():
+    uniform_tseries, tseries = make_uniform_and_plain_tseries()
+    step_data = np.repeat(np.arange(10.0), 100)
+    noise_data = np.random.default_rng(0).random(1000)
+    series_list = [
+        tseries,
+        ValueSeries(name="step", unit_name="", data=step_data, tseries=tseries),
+        ValueSeries(name="noise", unit_name="", data=noise_data, tseries=tseries),
+    ]
+    new_tseries, step, noise = apply_run_length_encoding(series_list, ratio=0.01)
+    assert new_tseries is tseries
+    assert isinstance(step, RLEValueSeries) and step.tseries is tseries
+    assert np.array_equal(step.data, step_data)
+    assert noise is series_list[2]
+    step = apply_run_length_encoding(series_list, ratio=0.001)[1]
+    assert step is series_list[1]
+
+
+@pytest.mark.parametrize(
+    "low, high, dtype",
+    [(0, 127, np.int8), (-1, 127, np.int16), (-64, 63, np.int8), (-65, 63, np.int16)],
+)
+@pytest.mark.parametrize("chunk_size", [None, 4])
+def test_compact_int_dtype_holds_differences(low, high, dtype, chunk_size):
+    data = np.array([0, 0, 0, high, low, high], dtype=float)  # in two chunks of 4
+    assert get_compact_int_dtype(data, chunk_size) == dtype
+    assert np.array_equal(np.diff(data.astype(dtype)), np.diff(data))
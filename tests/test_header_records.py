@@ -0,0 +1,66 @@
+"""Tests of the readers' read_header(), which reads a file's metadata but no data"""
+
+import bz2
+from pathlib import Path
+import numpy as np
+import pytest
+from ixdat import Measurement
+
+DATA_DIR = Path(__file__).parent.parent / "test_data"
+MPT_FILES = [
+    DATA_DIR
+    / "biologic_mpt_and_zilien_tsv/2020-07-29 10_30_39 Pt_poly_cv_01_02_CVA_C01.mpt",
+    DATA_DIR / "biologic_mpr/Pt_poly_cv_short.mpt",
+]
+TSV_FILE = DATA_DIR / "zilien/2021-02-01 17_44_12 test.tsv"
+
+
+def write_ivium_file(path_to_file, n_rows, timestamp_string="04/03/2021 19:42:30"):
+    """Write an ivium text export, with its unlabeled extra column, to path_to_file"""
+    t = np.arange(n_rows) * 0.1
+    lines = [timestamp_string, "time/s E/V I/A"]
+    lines += [f"{t_n:.1f} {np.sin(t_n):.6f} {np.cos(t_n):.6e} 0.0" for t_n in t]
+    content = "\n".join(lines) + "\n"
+    if path_to_file.suffix == ".bz2":
+        path_to_file.write_bytes(bz2.compress(content.encode()))
+    else:
+        path_to_file.write_text(content)
+
+
+@pytest.mark.parametrize("path_to_file", MPT_FILES)
+def test_mpt_header(path_to_file):
+    meas = Measurement.read(path_to_file, reader="biologic")
+    header = Measurement.read_header(path_to_file, reader="biologic")
+    assert header["technique"] == "EC"
+    assert header["tstamp"] == meas.tstamp
+    assert header["n_rows"] == len(meas["time/s"].data)
+    assert set(header["column_names"]) <= set(meas.series_names)
+
+
+def test_zilien_header():
+    meas = Measurement.read(TSV_FILE, reader="zilien")
+    header = Measurement.read_header(TSV_FILE, reader="zilien")
+    assert header["tstamp"] == meas.tstamp
+    assert set(header["column_names"]) == set(meas.series_names)
+    assert header["n_rows"] == max(len(series.data) for series in meas.series_list)
+    assert not header["n_rows_is_estimate"]  # the file is smaller than the sample
+
+
+def test_ivium_dataset_header(tmp_path):
+    write_ivium_file(tmp_path / "dataset_1.txt", 30)
+    write_ivium_file(tmp_path / "dataset_2.txt", 20, "04/03/2021 19:43:00")
+    meas = Measurement.read(tmp_path / "dataset", reader="ivium")
+    header = Measurement.read_header(tmp_path / "dataset", reader="ivium")
+    assert header["tstamp"] == meas.tstamp
+    assert header["n_rows"] == 50 == len(meas["time/s"].data)
+    assert len(header["files"]) == 2
+    assert {"time/s", "E/V", "I/A"} <= set(header["column_names"])
+
+
+def test_ivium_dataset_header_with_unknown_n_rows(tmp_path):
+    """The number of rows in a large .bz2 file isn't known without decompressing it"""
+    write_ivium_file(tmp_path / "dataset_1.txt", 30)
+    write_ivium_file(tmp_path / "dataset_2.txt.bz2", 5000)
+    header = Measurement.read_header(tmp_path / "dataset", reader="ivium")
+    assert header["n_rows"] is None
+    assert header["n_rows_is_estimate"]
@@ -0,0 +1,47 @@
+"""Tests of reading the .csv files that ixdat exports, see readers/ixdat_csv.py"""
+
+import gzip
+import shutil
+import numpy as np
+import pytest
+from ixdat import Measurement
+from ixdat.data_series import TimeSeries, ValueSeries
+
+
+def make_measurement():
+    """Return a measurement with two time columns of different lengths"""
+    rng = np.random.default_rng(0)
+    t_long = TimeSeries(name="t_long", unit_name="s", tstamp=1.6e9, data=np.arange(20.0))
+    t_short = TimeSeries(
+        name="t_short", unit_name="s", tstamp=1.6e9, data=np.arange(7.0) * 0.3 + 0.1
+    )
+    series_list = [
+        t_long,
+        ValueSeries(name="a", unit_name="V", data=rng.random(20), tseries=t_long),
+        ValueSeries(name="b", unit_name="A", data=rng.normal(size=20), tseries=t_long),
+        t_short,
+        ValueSeries(name="c", unit_name="", data=rng.random(7) * 1e-10, tseries=t_short),
+    ]
+    return Measurement(name="test", series_list=series_list, tstamp=1.6e9)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_export_and_read_again(tmp_path, compressed):
+    meas = make_measurement()
+    path_to_file = tmp_path / "test.csv"
+    meas.export(path_to_file)
+    lines = path_to_file.read_text().splitlines()
+    assert lines[-1].endswith(",\t") and ",\t,\t" in lines[-1]  # blank cells
+    if compressed:
+        with open(path_to_file, "rb") as f, gzip.open(f"{path_to_file}.gz", "wb") as g:
+            shutil.copyfileobj(f, g)
+        path_to_file = tmp_path / "test.csv.gz"
+    read_meas = Measurement.read(path_to_file, reader="ixdat")
+    assert read_meas.tstamp == meas.tstamp
+    assert set(read_meas.value_names) == set(meas.value_names)
+    for name in meas.value_names:
+        t, values = meas.grab(name)
+        read_t, read_values = read_meas.grab(name)
+        assert read_meas[name].tseries.name == meas[name].tseries.name
+        assert np.array_equal(read_t, t)
+        assert np.array_equal(read_values, values)
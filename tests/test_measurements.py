@@ -0,0 +1,116 @@
+"""Tests of reading, selecting, and cutting measurements"""
+
+from pathlib import Path
+import numpy as np
+import pytest
+from ixdat import Measurement
+from ixdat.config import CFG
+from ixdat.data_series import TimeSeries, UniformTimeSeries, ValueSeries
+
+DATA_DIR = Path(__file__).parent.parent / "test_data"
+MPT_FILES = [
+    DATA_DIR
+    / "biologic_mpt_and_zilien_tsv/2020-07-29 10_30_39 Pt_poly_cv_01_02_CVA_C01.mpt",
+    DATA_DIR / "biologic_mpr/Pt_poly_cv_short.mpt",
+]
+
+
+def test_read_files_in_workers_same_as_serial():
+    serial = Measurement.read_files(MPT_FILES, reader="biologic")
+    parallel = Measurement.read_files(MPT_FILES, reader="biologic", workers=2)
+    assert len(parallel) == len(serial)
+    for meas, parallel_meas in zip(serial, parallel):
+        assert parallel_meas.name == meas.name
+        assert parallel_meas.tstamp == meas.tstamp
+        assert parallel_meas.series_names == meas.series_names
+        for series in meas.series_list:
+            parallel_series = parallel_meas[series.name]
+            assert type(parallel_series) is type(series)
+            assert parallel_series.data.dtype == series.data.dtype
+            assert np.array_equal(parallel_series.data, series.data)
+
+
+def test_saving_does_not_change_series_list():
+    meas = Measurement.read(MPT_FILES[1], reader="biologic")
+    series_list = list(meas.series_list)
+    tseries_list = [s.tseries for s in series_list]
+    meas.data_objects
+    meas.as_dict()
+    assert all(s is s_before for s, s_before in zip(meas.series_list, series_list))
+    assert len(meas.series_list) == len(series_list)
+    assert all(s.tseries is t for s, t in zip(meas.series_list, tseries_list))
+
+
+def test_separate_reads_do_not_share_time_series():
+    meas = Measurement.read(MPT_FILES[1], reader="biologic")
+    meas_2 = Measurement.read(MPT_FILES[1], reader="biologic")
+    assert not any(
+        s.tseries is s_2.tseries for s in meas.series_list for s_2 in meas_2.series_list
+    )
+
+
+def test_intern_time_series_is_opt_in():
+    CFG.intern_time_series = True
+    try:
+        meas = Measurement.read(MPT_FILES[1], reader="biologic")
+        meas_2 = Measurement.read(MPT_FILES[1], reader="biologic")
+    finally:
+        CFG.intern_time_series = False
+    assert meas["time/s"] is meas_2["time/s"]
+
+
+def test_read_data_is_read_only_so_uid_is_hashed_once():
+    meas = Measurement.read(MPT_FILES[1], reader="biologic")
+    vseries = meas["Ewe/V"]
+    assert not vseries.data.flags.writeable
+    assert not vseries.tseries.data.flags.writeable
+    with pytest.raises(ValueError):
+        vseries.data[0] = 0
+    uid = vseries.uid
+    assert vseries._uid == uid and vseries.tseries._uid is not None
+
+
+def make_measurement(uniform, t_offset):
+    """Return a measurement with 1000 points at 0.1 s intervals, relative to tstamp"""
+    tseries = UniformTimeSeries(
+        name="t", unit_name="s", tstamp=1.6e9 + t_offset, t_start=0.3, t_step=0.1, n=1000
+    )
+    if not uniform:
+        tseries = TimeSeries(
+            name="t", unit_name="s", tstamp=tseries.tstamp, data=tseries.data
+        )
+    vseries = ValueSeries(name="v", unit_name="", data=np.arange(1e3), tseries=tseries)
+    return Measurement(name="test", series_list=[tseries, vseries], tstamp=1.6e9)
+
+
+@pytest.mark.parametrize("t_offset", [0, 0.3])
+def test_cut_and_grab_select_the_same_times(t_offset):
+    """With tspan on sample times, grab and cut agree, uniform time or not
+
+    The times themselves can differ in the last digit, as a UniformTimeSeries shifted
+    or cut has a new t_start.
+    """
+    for tspan in ([1.0, 1.5], [0.9, 1.3], [10.6, 11.0], [0, 0.6], [99.9, 200]):
+        t_plain, v_plain = make_measurement(False, t_offset).grab("v", tspan)
+        for uniform in [True, False]:
+            meas = make_measurement(uniform, t_offset)
+            t, v = meas.grab("v", tspan)
+            assert np.array_equal(v, v_plain)
+            assert np.allclose(t, t_plain, rtol=0, atol=1e-9)
+            cut_t, cut_v = meas.cut(tspan).grab("v")
+            assert np.array_equal(cut_v, v_plain)
+            assert np.allclose(cut_t, t_plain, rtol=0, atol=1e-9)
+
+
+def test_select_values_spans():
+    """Selecting on values and value spans keeps the points meeting all criteria"""
+    meas = Measurement.read(MPT_FILES[0], reader="biologic")
+    v, cycle = meas["Ewe/V"].data, meas["cycle number"].data
+    in_span = np.logical_and(0.5 <= v, v <= 1)
+    selected = meas.select_values(spans={"Ewe/V": (1, 0.5)})  # the order is not used
+    assert np.array_equal(selected["Ewe/V"].data, v[in_span])
+    selected = meas.select_values(**{"cycle number": [2, 4]}, spans={"Ewe/V": (0.5, 1)})
+    mask = np.logical_and(in_span, np.isin(cycle, [2, 4]))
+    assert np.array_equal(selected["Ewe/V"].data, v[mask])
+    assert np.array_equal(selected["time/s"].data, meas["time/s"].data[mask])
+    assert meas.select_values(spans={"Ewe/V": (5, 6)}) is None
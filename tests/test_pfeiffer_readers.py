@@ -0,0 +1,41 @@
+"""Tests of the readers of files exported by Pfeiffer Vacuum's PV Mass Spec"""
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from ixdat.spectra import Spectrum, SpectrumSeries
+from ixdat.exceptions import ReadError
+from ixdat.readers.pfeiffer import PVMassSpecScanReader, MID_N_HEADER_LINES
+from ixdat.readers.reading_tools import sniff_reader_name
+
+DATA_DIR = Path(__file__).parent.parent / "test_data/pfeiffer"
+SCAN_FILE = DATA_DIR / "test - Scan.dat"
+SINGLE_SCAN_FILE = DATA_DIR / "single - Scan.dat"
+TSTAMP = PVMassSpecScanReader().read_header(SCAN_FILE)["tstamp"]
+
+
+def test_scan_series():
+    """The scans are as pandas reads them with the header of an MID file"""
+    df = pd.read_csv(SCAN_FILE, header=MID_N_HEADER_LINES - 1, delimiter="\t")
+    masses = sorted((col for col in df.columns if col[0].isdigit()), key=float)
+    spectra = SpectrumSeries.read(SCAN_FILE, reader="pfeiffer_scan")
+    assert spectra.tstamp == TSTAMP
+    assert np.array_equal(spectra.t, df["Time Relative (sec)"])
+    assert np.array_equal(spectra.x, [float(mass) for mass in masses])
+    assert np.array_equal(spectra.y, df[masses].to_numpy())
+
+
+def test_single_scan():
+    spectrum = Spectrum.read(SINGLE_SCAN_FILE, reader="pfeiffer_scan")
+    spectra = SpectrumSeries.read(SCAN_FILE, reader="pfeiffer_scan")
+    assert np.array_equal(spectrum.y, spectra.y[0])
+    with pytest.raises(ReadError):
+        Spectrum.read(SCAN_FILE, reader="pfeiffer_scan")
+
+
+def test_scan_header():
+    header = PVMassSpecScanReader().read_header(SCAN_FILE)
+    assert header["n_rows"] == 5  # which is counted after the header
+    assert "Time Relative (sec)" in header["column_names"]
+    assert sniff_reader_name(SCAN_FILE) == "pfeiffer_scan"
@@ -0,0 +1,73 @@
+"""Tests of the read cache used by `Measurement.read(cache=True)`"""
+
+import os
+import shutil
+from pathlib import Path
+import numpy as np
+import pytest
+from ixdat import Measurement
+from ixdat.config import CFG
+from ixdat.data_series import RLEValueSeries
+from ixdat.readers.read_cache import save_measurement, METADATA_FILE_NAME
+
+MPT_FILE = Path(__file__).parent.parent / "test_data/biologic_mpr/Pt_poly_cv_short.mpt"
+
+
+@pytest.fixture
+def cache_directory(tmp_path):
+    """Use a read cache in tmp_path for the test"""
+    read_cache_directory = CFG._read_cache_directory
+    CFG.read_cache_directory = tmp_path / "read_cache"
+    yield CFG.read_cache_directory
+    CFG._read_cache_directory = read_cache_directory
+
+
+@pytest.fixture
+def mpt_file(tmp_path):
+    """A copy of the .mpt file, which the test can change"""
+    return Path(shutil.copy(MPT_FILE, tmp_path / MPT_FILE.name))
+
+
+def test_cache_hit_is_same_as_read(cache_directory, mpt_file):
+    meas = Measurement.read(mpt_file, reader="biologic")
+    cached_meas = Measurement.read(mpt_file, reader="biologic", cache=True)
+    assert len(list(cache_directory.iterdir())) == 1
+    loaded_meas = Measurement.read(mpt_file, reader="biologic", cache=True)
+    for m in [cached_meas, loaded_meas]:
+        assert type(m) is type(meas)
+        assert m.tstamp == meas.tstamp
+        assert m.series_names == meas.series_names
+        for series in meas.series_list:
+            assert np.array_equal(m[series.name].data, series.data)
+    assert isinstance(loaded_meas["Ewe/V"].data, np.memmap)
+
+
+def test_changed_file_is_read_again(cache_directory, mpt_file):
+    Measurement.read(mpt_file, reader="biologic", cache=True)
+    content = mpt_file.read_bytes()
+    mpt_file.write_bytes(content[: content.rindex(b"\n", 0, -1) + 1])  # one line less
+    meas = Measurement.read(mpt_file, reader="biologic", cache=True)
+    assert len(list(cache_directory.iterdir())) == 2
+    assert len(meas["time/s"].data) == 119
+
+
+def test_entry_saved_by_another_process_is_kept(tmp_path):
+    meas = Measurement.read(MPT_FILE, reader="biologic")
+    entry = tmp_path / "entry"
+    save_measurement(meas, entry)
+    metadata_mtime = os.stat(entry / METADATA_FILE_NAME).st_mtime_ns
+    save_measurement(meas, entry)  # as if another process got there first
+    assert [p.name for p in tmp_path.iterdir()] == ["entry"]
+    assert os.stat(entry / METADATA_FILE_NAME).st_mtime_ns == metadata_mtime
+
+
+def test_changed_read_settings_are_read_again(cache_directory, mpt_file):
+    run_length_encoding_ratio = CFG.run_length_encoding_ratio
+    Measurement.read(mpt_file, reader="biologic", cache=True)
+    try:
+        CFG.run_length_encoding_ratio = 0.5
+        meas = Measurement.read(mpt_file, reader="biologic", cache=True)
+    finally:
+        CFG.run_length_encoding_ratio = run_length_encoding_ratio
+    assert len(list(cache_directory.iterdir())) == 2
+    assert isinstance(meas["cycle number"], RLEValueSeries)
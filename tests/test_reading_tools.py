@@ -0,0 +1,82 @@
+"""Tests of the tools in readers/reading_tools.py for finding and opening files"""
+
+import bz2
+import gzip
+import lzma
+import zipfile
+from pathlib import Path
+import numpy as np
+import pytest
+from ixdat import Measurement
+from ixdat.exceptions import ReadError
+from ixdat.readers.reading_tools import sniff_reader_name, open_file
+
+DATA_DIR = Path(__file__).parent.parent / "test_data"
+MPT_FILE = DATA_DIR / "biologic_mpr/Pt_poly_cv_short.mpt"
+
+
+@pytest.mark.parametrize(
+    "path, reader_name",
+    [
+        (MPT_FILE, "biologic"),
+        (DATA_DIR / "biologic_mpr/Pt_poly_cv_short.mpr", "mpr"),
+        (DATA_DIR / "zilien/2021-02-01 17_44_12 test.tsv", "zilien"),
+        (DATA_DIR / "zilien/2021-02-01 17_44_12 mass scans", "zilien_spectra"),
+        (DATA_DIR / "pfeiffer/test - Scan.dat", "pfeiffer_scan"),
+    ],
+)
+def test_sniff_reader_name(path, reader_name):
+    assert sniff_reader_name(path) == reader_name
+
+
+def test_sniff_unknown_file(tmp_path):
+    path = tmp_path / "unknown.txt"
+    path.write_text("Some data\n1\t2\n")
+    with pytest.raises(ReadError):
+        sniff_reader_name(path)
+    with pytest.raises(ReadError):
+        sniff_reader_name(tmp_path / "missing.txt")
+
+
+def test_read_auto():
+    meas = Measurement.read(MPT_FILE, reader="auto")
+    biologic_meas = Measurement.read(MPT_FILE, reader="biologic")
+    assert type(meas.reader) is type(biologic_meas.reader)
+    assert meas.series_names == biologic_meas.series_names
+    assert np.array_equal(meas["Ewe/V"].data, biologic_meas["Ewe/V"].data)
+
+
+def compress(path, suffix, folder):
+    """Return the path to a copy of the file at path compressed as suffix says"""
+    compressed_path = folder / (path.name + suffix)
+    content = path.read_bytes()
+    if suffix == ".zip":
+        with zipfile.ZipFile(compressed_path, "w") as zip_file:
+            zip_file.writestr(path.name, content)
+    else:
+        open_compressed = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+        with open_compressed[suffix](compressed_path, "wb") as f:
+            f.write(content)
+    return compressed_path
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".zip"])
+def test_read_compressed_file(tmp_path, suffix):
+    compressed_file = compress(MPT_FILE, suffix, tmp_path)
+    with open_file(compressed_file, "rb") as f:
+        assert f.read() == MPT_FILE.read_bytes()
+    assert sniff_reader_name(compressed_file) == "biologic"
+    meas = Measurement.read(compressed_file, reader="auto")
+    biologic_meas = Measurement.read(MPT_FILE, reader="biologic")
+    assert meas.tstamp == biologic_meas.tstamp
+    for series in biologic_meas.series_list:
+        assert np.array_equal(meas[series.name].data, series.data)
+
+
+def test_zip_with_two_files(tmp_path):
+    zip_path = tmp_path / "two.zip"
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr("one.mpt", MPT_FILE.read_bytes())
+        zip_file.writestr("two.mpt", MPT_FILE.read_bytes())
+    with pytest.raises(ReadError):
+        open_file(zip_path)
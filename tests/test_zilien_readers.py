@@ -0,0 +1,135 @@
+"""Tests of the readers of Spectro Inlets' Zilien files"""
+
+import shutil
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from ixdat import Measurement
+from ixdat.data_series import TimeSeries
+from ixdat.spectra import Spectrum, SpectrumSeries
+from ixdat.exceptions import ReadError
+from ixdat.readers import ZilienTSVReader, ZilienSpectraReader
+from ixdat.readers.zilien import read_zilien_spectrum
+
+DATA_DIR = Path(__file__).parent.parent / "test_data/zilien"
+TSV_FILE = DATA_DIR / "2021-02-01 17_44_12 test.tsv"
+EC_MS_FILE = DATA_DIR / "2021-02-01 17_44_12 test EC_MS.npz"  # see development_scripts
+SPECTRA_DIR = DATA_DIR / "2021-02-01 17_44_12 mass scans"
+SPECTRUM_FILES = sorted(SPECTRA_DIR.glob("*.tsv"))
+
+
+def test_tsv_series():
+    meas = Measurement.read(TSV_FILE, reader="zilien")
+    assert meas.tstamp == ZilienTSVReader().read_header(TSV_FILE)["tstamp"]
+    assert meas.metadata["offset"] == "12.5"
+    for name, t_name, length in [
+        ("M2", "M2-x", 200),
+        ("M32", "M32-x", 200),
+        ("Ewe/V", "time/s", 100),
+        ("I/mA", "time/s", 100),
+        ("cycle number", "time/s", 100),
+        ("iongauge - Pressure [mbar]", "iongauge - Time [s]", 50),
+    ]:
+        vseries = meas[name]
+        assert vseries.tseries.name == t_name
+        assert len(vseries.data) == length
+    assert np.allclose(meas["M32-x"].data - meas["M2-x"].data, 0.05)
+
+
+def test_tsv_same_as_ec_ms():
+    """The native reader gives the series that the legacy EC_MS package gave"""
+    ec_ms = pytest.importorskip("EC_MS")
+    from ixdat.readers.ec_ms_pkl import measurement_from_ec_ms_dataset
+
+    ec_ms_meas = measurement_from_ec_ms_dataset(
+        ec_ms.Zilien_Dataset(str(TSV_FILE)).data, name=TSV_FILE.name
+    )
+    meas = Measurement.read(TSV_FILE, reader="zilien")
+    assert meas.tstamp == ec_ms_meas.tstamp
+    assert ec_ms_meas.series_names <= meas.series_names
+    for series in ec_ms_meas.series_list:
+        assert isinstance(meas[series.name], type(series))
+        assert np.allclose(meas[series.name].data, series.data, rtol=1e-12, atol=0)
+
+
+def test_tsv_same_as_saved_ec_ms():
+    """The native reader gives the series EC_MS gave, as saved when it was run"""
+    ec_ms_values = np.load(EC_MS_FILE)
+    meas = Measurement.read(TSV_FILE, reader="zilien")
+    assert meas.tstamp == ec_ms_values["tstamp"]
+    names = list(ec_ms_values["names"])
+    tseries_names = list(ec_ms_values["tseries_names"])
+    assert set(names) <= set(meas.series_names)
+    for i, (name, tseries_name) in enumerate(zip(names, tseries_names)):
+        series = meas[name]
+        if tseries_name:
+            assert series.tseries.name == tseries_name
+        else:
+            assert isinstance(series, TimeSeries)
+        data = ec_ms_values[f"data_{i}"]
+        assert len(series.data) == len(data)
+        assert np.allclose(series.data, data, rtol=1e-12, atol=0)
+
+
+def test_tsv_follow(tmp_path):
+    """Following a file as it is written gives the same as reading it at the end"""
+    content = TSV_FILE.read_bytes()
+    growing_file = tmp_path / TSV_FILE.name
+    reader = ZilienTSVReader()
+    header_end = content.index(b"\n0\t")  # after the column headers
+    for n_bytes in [100, header_end, header_end + 20, 5000, 5001, 9000, len(content)]:
+        growing_file.write_bytes(content[:n_bytes])  # mostly ending mid-line
+        meas = reader.follow(growing_file)
+        if n_bytes <= header_end:
+            assert meas is None
+            continue
+        n_lines = content[header_end:n_bytes].count(b"\n") - 1
+        assert len(meas["M2-x"].data) == n_lines
+        assert len(meas["M2"].data) == n_lines
+    assert meas is reader.measurement
+    full_meas = ZilienTSVReader().read(TSV_FILE)
+    assert meas.series_names == full_meas.series_names
+    for series in full_meas.series_list:
+        assert np.array_equal(meas[series.name].data, series.data)
+    assert np.array_equal(meas.selector.data, full_meas.selector.data)
+
+
+def test_spectrum_same_as_pandas_with_header_9():
+    """The mass scan is parsed as with `pd.read_csv(header=9)`, as it used to be"""
+    for spectrum_file in SPECTRUM_FILES:
+        t, column_names, data = read_zilien_spectrum(spectrum_file)
+        df = pd.read_csv(spectrum_file, header=9, delimiter="\t")
+        assert column_names == list(df.columns)
+        assert np.array_equal(data, df.to_numpy())
+    assert t == 14.0
+
+
+def test_spectrum_reader():
+    spectrum = Spectrum.read(SPECTRUM_FILES[1], reader="zilien_spec")
+    _, _, data = read_zilien_spectrum(SPECTRUM_FILES[1])
+    assert np.array_equal(spectrum.x, data[:, 0])
+    assert np.array_equal(spectrum.y, [data[:, 1]])
+
+
+def test_spectra_reader():
+    spectra = SpectrumSeries.read(SPECTRA_DIR, reader="zilien_spectra")
+    assert spectra.tstamp == Measurement.read(TSV_FILE, reader="zilien").tstamp
+    assert np.array_equal(spectra.t, [2.0, 8.0, 14.0])
+    for spectrum_file, y in zip(SPECTRUM_FILES, spectra.y):
+        _, _, data = read_zilien_spectrum(spectrum_file)
+        assert np.array_equal(spectra.x, data[:, 0])
+        assert np.array_equal(y, data[:, 1])
+    header = ZilienSpectraReader().read_header(SPECTRA_DIR)
+    assert header["tstamp"] == spectra.tstamp
+    assert header["n_rows"] == 3
+    assert header["scan_span"] == [2.0, 14.0]
+
+
+def test_spectra_tstamp_is_needed(tmp_path):
+    spectra_dir = tmp_path / "mass scans"
+    shutil.copytree(SPECTRA_DIR, spectra_dir)
+    with pytest.raises(ReadError):
+        SpectrumSeries.read(spectra_dir, reader="zilien_spectra")
+    spectra = SpectrumSeries.read(spectra_dir, reader="zilien_spectra", tstamp=1.6e9)
+    assert spectra.tstamp == 1.6e9